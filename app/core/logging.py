@@ -2,7 +2,7 @@ import sys
 
 from loguru import logger
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.domain.enums import BaseEnum
 
 
@@ -19,8 +19,9 @@ class LogLevel(BaseEnum):
 
 def set_logger() -> None:
     logger.remove()
-    logger.add(sys.stdout, level=settings.LOG_LEVEL)
+    logger.add(sys.stdout, level=get_settings().LOG_LEVEL)
 
 
 def log(log_level: LogLevel, subject: str, object: str, message: str) -> None:
-    logger.log(log_level.value, f"[{subject}] {object} | {message}")
+    # 引数を渡して Loguru に整形を委ね、閾値未満のレベルでは文字列を組み立てない
+    logger.log(log_level.value, "[{}] {} | {}", subject, object, message)
@@ -29,11 +29,16 @@ def handle_tool_errors(
     request: ToolCallRequest,
     handler: callable,  # type: ignore
 ) -> ToolMessage:
+    log_tool_call(request)
+    # 例外処理はハンドラ呼び出しのみに限定し、ログ出力などの正常系は try の外で実行する
     try:
-        log_tool_call(request)
         tool_response = handler(request)  # type: ignore
-        log_tool_response(tool_response)
-        return tool_response
     except Exception as e:  # noqa: BLE001
-        error_message = f"Tool error: Please check your input and try again. ({e!s})"
-        return ToolMessage(content=error_message, tool_call_id=request.tool_call["id"])
+        tool_response = ToolMessage(
+            content=f"Tool error: Please check your input and try again. ({e!s})",
+            tool_call_id=request.tool_call["id"],
+            name=request.tool_call.get("name"),
+            status="error",
+        )
+    log_tool_response(tool_response)
+    return tool_response
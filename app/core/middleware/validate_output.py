@@ -8,8 +8,7 @@ from loguru import logger
 @after_model
 def validate_output(state: AgentState, runtime: Runtime) -> None:  # noqa: ARG001
     last_message = state["messages"][-1]
-    if isinstance(last_message, AIMessage):
-        if response := last_message.content:
-            logger.info(f"AI response: {response}")
-        elif getattr(last_message, "tool_calls", []):
-            pass
+    # ツール呼び出しのみの応答など、ログ対象がない場合は即座に抜ける
+    if not isinstance(last_message, AIMessage) or not last_message.content:
+        return
+    logger.info("AI response: {}", last_message.content)
@@ -1,11 +1,18 @@
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+
+@lru_cache(maxsize=8)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
 
 
 def get_current_time(
-    timezone: str = settings.TIMEZONE,
+    timezone: str | None = None,
     fmt: str = "%Y-%m-%d %H:%M:%S",
 ) -> str:
-    return datetime.now(ZoneInfo(timezone)).strftime(fmt)
+    timezone = timezone or get_settings().TIMEZONE
+    return datetime.now(_tz(timezone)).strftime(fmt)
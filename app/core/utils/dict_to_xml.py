@@ -1,7 +1,13 @@
-def dict_to_xml_str(data: dict, exclude_keys: list[str] = []) -> str:
-    xml_str = "<item>"
-    for key, value in data.items():
-        if key not in exclude_keys:
-            xml_str += f"<{key}>{value}</{key}>"
-    xml_str += "</item>"
-    return xml_str
+from collections.abc import Container
+from xml.sax.saxutils import escape
+
+
+def dict_to_xml_str(data: dict, exclude_keys: Container[str] = ()) -> str:
+    parts = ["<item>"]
+    parts.extend(
+        f"<{key}>{escape(str(value))}</{key}>"
+        for key, value in data.items()
+        if key not in exclude_keys
+    )
+    parts.append("</item>")
+    return "".join(parts)
@@ -14,7 +14,7 @@ class LangGraphAgent(ABC):
         checkpointer: MemorySaver | None,
         recursion_limit: int,
     ) -> None:
-        self.log = partial(log, log_level=log_level, subject=self.__name__)
+        self.log = partial(log, log_level, self.__name__)
         self.checkpointer = checkpointer
         self.recursion_limit = recursion_limit
         self.graph = self._create_graph()
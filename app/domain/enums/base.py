@@ -1,12 +1,17 @@
 from enum import Enum
-from collections.abc import Iterator
+from functools import cache
+
+
+@cache
+def _enum_values(enum_cls: type[Enum]) -> tuple[str, ...]:
+    return tuple(item.value for item in enum_cls)
 
 
 class BaseEnum(Enum):
     @classmethod
-    def to_list(cls) -> list[str]:
-        return [item.value for item in cls]
+    def to_tuple(cls) -> tuple[str, ...]:
+        return _enum_values(cls)
 
     @classmethod
-    def __iter__(cls) -> Iterator[str]:
-        return iter(cls.to_list())
+    def to_list(cls) -> list[str]:
+        return list(cls.to_tuple())
@@ -8,5 +8,11 @@ class Priority(BaseEnum):
 
     @classmethod
     def up_to(cls, target: "Priority") -> list["Priority"]:
-        priorities = [cls.HIGH, cls.MEDIUM, cls.LOW]
-        return priorities[: priorities.index(target) + 1]
+        return list(_PRIORITY_ORDER[: _PRIORITY_RANK[target] + 1])
+
+
+# Enum のクラス本体に定義するとメンバー扱いになるため、モジュールレベルで保持する
+_PRIORITY_ORDER: tuple[Priority, ...] = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+_PRIORITY_RANK: dict[Priority, int] = {
+    priority: rank for rank, priority in enumerate(_PRIORITY_ORDER)
+}
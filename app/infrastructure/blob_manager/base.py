@@ -9,7 +9,7 @@ from app.core.logging import log, LogLevel
 
 class BaseBlobManager(ABC):
     def __init__(self, log_level: LogLevel = LogLevel.DEBUG) -> None:
-        self.log = partial(log, log_level=log_level, subject=self.__name__)
+        self.log = partial(log, log_level, self.__name__)
 
     @property
     def __name__(self) -> str:
@@ -29,13 +29,13 @@ class BaseBlobManager(ABC):
 
     @abstractmethod
     def read_blob_as_json(
-        self, blob_path: str, schema: BaseModel | None = None
+        self, blob_path: str, schema: type[BaseModel] | None = None
     ) -> dict | list | BaseModel:
         pass
 
     @abstractmethod
     def read_blob_as_jsonl(
-        self, blob_path: str, schema: BaseModel | None = None
+        self, blob_path: str, schema: type[BaseModel] | None = None
     ) -> list[dict] | list[BaseModel]:
         pass
 
@@ -53,7 +53,7 @@ class BaseBlobManager(ABC):
 
     @abstractmethod
     def save_blob_as_jsonl(
-        self, content: list[dict], blob_path: str, schema: BaseModel | None = None
+        self, content: list[dict], blob_path: str, schema: type[BaseModel] | None = None
     ) -> None:
         pass
 
@@ -1,12 +1,22 @@
-import json
+import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from jinja2 import Template
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.core.logging import LogLevel
 from app.infrastructure.blob_manager.base import BaseBlobManager
 
+JSONL_WRITE_BUFFER_SIZE = 256 * 1024
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
 
 class LocalBlobManager(BaseBlobManager):
     def __init__(self, log_level: LogLevel = LogLevel.TRACE) -> None:
@@ -27,22 +37,25 @@ class LocalBlobManager(BaseBlobManager):
         return Template(source=self.read_blob_as_str(blob_path))
 
     def read_blob_as_json(
-        self, blob_path: str, schema: BaseModel | None = None
+        self, blob_path: str, schema: type[BaseModel] | None = None
     ) -> dict | list:
         self.log(object="read_blob_as_json", message=blob_path)
-        with open(blob_path, encoding="utf-8") as fi:
-            if schema:
-                return schema.model_validate_json(fi.read())  # type: ignore
-            return json.load(fi)  # type: ignore
+        with open(blob_path, "rb") as fi:
+            data = fi.read()
+        if schema:
+            return schema.model_validate_json(data)  # type: ignore
+        return orjson.loads(data)  # type: ignore
 
     def read_blob_as_jsonl(
-        self, blob_path: str, schema: BaseModel | None = None
+        self, blob_path: str, schema: type[BaseModel] | None = None
     ) -> list[dict] | list[BaseModel]:
         self.log(object="read_blob_as_jsonl", message=blob_path)
-        with open(blob_path, encoding="utf-8") as fi:
-            if isinstance(schema, BaseModel):
-                return [schema.model_validate_json(line) for line in fi]
-            return [json.loads(line) for line in fi]
+        with open(blob_path, "rb") as fi:
+            lines = [line for line in fi.read().splitlines() if line.strip()]
+        if schema is not None:
+            # 全行を 1 つの JSON 配列にまとめ、検証を 1 回の呼び出しで済ませる
+            return _list_adapter(schema).validate_json(b"[" + b",".join(lines) + b"]")
+        return [orjson.loads(line) for line in lines]
 
     def save_blob_as_bytes(self, content: bytes, blob_path: str) -> None:
         self.log(object="save_blob_as_bytes", message=blob_path)
@@ -56,20 +69,29 @@ class LocalBlobManager(BaseBlobManager):
 
     def save_blob_as_json(self, content: dict, blob_path: str) -> None:
         self.log(object="save_blob_as_json", message=blob_path)
-        with open(blob_path, "w", encoding="utf-8") as fo:
-            json.dump(content, fo, ensure_ascii=False, indent=4)
+        with open(blob_path, "wb") as fo:
+            fo.write(
+                orjson.dumps(
+                    content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
 
     def save_blob_as_jsonl(
-        self, content: list[dict], blob_path: str, schema: BaseModel | None = None
+        self, content: list[dict], blob_path: str, schema: type[BaseModel] | None = None
     ) -> None:
         self.log(object="save_blob_as_jsonl", message=blob_path)
-        with open(blob_path, "w", encoding="utf-8") as fo:
+
+        def encode_lines() -> Iterator[bytes]:
             for line in content:
                 if schema:
                     obj = schema.model_validate(line)
-                    fo.write(obj.model_dump_json(ensure_ascii=False) + "\n")
+                    yield obj.__pydantic_serializer__.to_json(obj)
                 else:
-                    fo.write(json.dumps(line, ensure_ascii=False) + "\n")
+                    yield orjson.dumps(line, option=orjson.OPT_NON_STR_KEYS)
+                yield b"\n"
+
+        with open(blob_path, "wb", buffering=JSONL_WRITE_BUFFER_SIZE) as fo:
+            fo.writelines(encode_lines())
 
     def mkdir(self, blob_dir_path: str) -> None:
         self.log(object="mkdir", message=blob_dir_path)
@@ -77,7 +99,8 @@ class LocalBlobManager(BaseBlobManager):
 
     def list_blobs(self, blob_dir_path: str) -> list[str]:
         self.log(object="list_blobs", message=blob_dir_path)
-        return list(Path(blob_dir_path).iterdir())
+        with os.scandir(blob_dir_path) as entries:
+            return [entry.path for entry in entries]
 
     def exists(self, blob_path: str) -> bool:
         self.log(object="exists", message=blob_path)
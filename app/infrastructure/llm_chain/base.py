@@ -12,7 +12,7 @@ class BaseChain(ABC):
         self,
         log_level: LogLevel,
     ) -> None:
-        self.log = partial(log, log_level=log_level, subject=self.__name__)
+        self.log = partial(log, log_level, self.__name__)
 
     @property
     def __name__(self) -> str:
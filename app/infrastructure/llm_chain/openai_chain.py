@@ -1,4 +1,6 @@
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+
+from jinja2 import Template
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -7,7 +9,7 @@ from langchain_core.tracers.stdout import ConsoleCallbackHandler
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.core.exception import ChainError
 from app.core.logging import LogLevel, log
 from app.core.utils.datetime_utils import get_current_time
@@ -15,7 +17,11 @@ from app.infrastructure.blob_manager.base import BaseBlobManager
 from app.infrastructure.llm_chain.base import BaseChain
 from app.infrastructure.llm_chain.enums import OpenAIModelName
 
-load_dotenv()
+
+@lru_cache(maxsize=16)
+def _chat_model(model_name: str, temperature: float) -> ChatOpenAI:
+    # 同じ (モデル, 温度) のクライアントを共有し、HTTP 接続プールを使い回す
+    return ChatOpenAI(model_name=model_name, temperature=temperature)
 
 
 class BaseOpenAIChain(BaseChain):
@@ -31,28 +37,37 @@ class BaseOpenAIChain(BaseChain):
         self.prompt_path = prompt_path
         super().__init__(log_level)
 
+    def _build_prompt(self, template: str) -> ChatPromptTemplate:
+        # global_instruction は呼び出し時に評価される部分変数として埋め込み、入力 dict を書き換えない
+        prompt = ChatPromptTemplate.from_template(template, template_format="jinja2")
+        return prompt.partial(global_instruction=lambda: self.global_instruction)
+
     def _build_structured_chain(
         self,
         schema: BaseModel,
         temperature: float = 0.0,
     ) -> RunnableSequence:
-        llm = ChatOpenAI(model_name=self.model_name.value, temperature=temperature)
+        llm = _chat_model(self.model_name.value, temperature)
         template = self.blob_manager.read_blob_as_str(self.prompt_path)
-        prompt = ChatPromptTemplate.from_template(template, template_format="jinja2")
+        prompt = self._build_prompt(template)
         return prompt | llm.with_structured_output(schema, method="function_calling")  # type: ignore
 
     def _build_chain(self, temperature: float = 0.0) -> RunnableSequence:
-        llm = ChatOpenAI(model_name=self.model_name.value, temperature=temperature)
+        llm = _chat_model(self.model_name.value, temperature)
         template = self.blob_manager.read_blob_as_str(self.prompt_path)
-        prompt = ChatPromptTemplate.from_template(template, template_format="jinja2")
+        prompt = self._build_prompt(template)
         return prompt | llm | StrOutputParser()  # type: ignore
 
+    @cached_property
+    def _global_template(self) -> Template:
+        # テンプレートの読み込みとパースはインスタンスごとに一度だけ行う
+        return self.blob_manager.read_blob_as_template(
+            get_settings().GLOBAL_INSTRUCTION_PATH
+        )
+
     @property
     def global_instruction(self) -> str:
-        template = self.blob_manager.read_blob_as_template(
-            settings.GLOBAL_INSTRUCTION_PATH
-        )
-        return template.render(current_date=get_current_time())
+        return self._global_template.render(current_date=get_current_time())
 
     def invoke(
         self,
@@ -65,7 +80,6 @@ class BaseOpenAIChain(BaseChain):
             callbacks.append(ConsoleCallbackHandler())
         config = RunnableConfig(callbacks=callbacks)
         try:
-            inputs["global_instruction"] = self.global_instruction
             response = chain.invoke(inputs, config=config)
             log(
                 LogLevel.DEBUG,
@@ -73,8 +87,32 @@ class BaseOpenAIChain(BaseChain):
                 object="invoke",
                 message=response,
             )
-            return response  # type: ignore  # noqa: TRY300
+            return response  # type: ignore
         except Exception as e:
             error_message = f"An error occurred while calling the LLM: {e!s}"
             self.log(object="invoke", message=error_message)
             raise ChainError(self.__name__, error_message) from e
+
+    async def ainvoke(
+        self,
+        chain: RunnableSequence,
+        inputs: dict,
+        verbose: bool = False,
+    ) -> str | BaseModel:
+        callbacks: list[BaseCallbackHandler] = []
+        if verbose:
+            callbacks.append(ConsoleCallbackHandler())
+        config = RunnableConfig(callbacks=callbacks)
+        try:
+            response = await chain.ainvoke(inputs, config=config)
+            log(
+                LogLevel.DEBUG,
+                subject=self.__name__,
+                object="ainvoke",
+                message=response,
+            )
+            return response  # type: ignore
+        except Exception as e:
+            error_message = f"An error occurred while calling the LLM: {e!s}"
+            self.log(object="ainvoke", message=error_message)
+            raise ChainError(self.__name__, error_message) from e
@@ -1,5 +1,6 @@
 """Paper Review Agent implementation."""
 
+import asyncio
 from typing import Any
 
 from langgraph.checkpoint.memory import InMemorySaver, MemorySaver
@@ -58,7 +59,7 @@ class PaperReviewAgent(LangGraphAgent):
         self.gather_interests_node = GatherResearchInterestsNode()
         self.search_papers_node = SearchPapersNode()
         self.evaluate_papers_node = EvaluatePapersNode(scoring_weights=weights)  # 初期フィルタリング
-        self.rank_papers_node = RankPapersNode()
+        self.rank_papers_node = RankPapersNode(llm_config=llm_config)
         # 統合LLM評価（1回の呼び出しで全スコア計算）
         self.unified_llm_evaluate_node = UnifiedLLMEvaluatePapersNode(
             llm_config=llm_config,
@@ -114,6 +115,7 @@ class PaperReviewAgent(LangGraphAgent):
 def create_graph(
     llm_config: LLMConfig | None = None,
     scoring_weights: ScoringWeights | None = None,
+    persist: bool = True,
 ) -> CompiledStateGraph:
     """PaperReviewAgentのグラフを作成.
     
@@ -121,12 +123,13 @@ def create_graph(
     ----
         llm_config: LLM評価の設定（省略時はデフォルト）
         scoring_weights: スコアリング重み設定（省略時はデフォルト）
+        persist: 状態をチェックポイントに保存するか（Falseの場合はノード遷移ごとの保存を省略）
     
     Returns:
     -------
         コンパイル済みのグラフ
     """
-    checkpointer = InMemorySaver()
+    checkpointer = InMemorySaver() if persist else None
     agent = PaperReviewAgent(
         checkpointer=checkpointer,
         log_level=LogLevel.DEBUG,
@@ -137,12 +140,14 @@ def create_graph(
     return agent.graph
 
 
-def invoke_graph(
+async def ainvoke_graph(
     graph: CompiledStateGraph,
     input_data: dict[str, Any],
     config: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """グラフを実行.
+    """グラフを非同期に実行.
+    
+    統合LLM評価ノードなどの非同期ノードを含むため、`graph.ainvoke`で実行します。
     
     Args:
     ----
@@ -158,7 +163,7 @@ def invoke_graph(
         config = {"recursion_limit": 100, "thread_id": "default"}
     
     logger.info("Starting PaperReviewAgent execution...")
-    result = graph.invoke(
+    result = await graph.ainvoke(
         input=input_data,
         config=config,
     )
@@ -166,3 +171,22 @@ def invoke_graph(
     
     return result
 
+
+def invoke_graph(
+    graph: CompiledStateGraph,
+    input_data: dict[str, Any],
+    config: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """グラフを実行（`ainvoke_graph`の同期ラッパー）.
+    
+    Args:
+    ----
+        graph: 実行するグラフ
+        input_data: 入力データ
+        config: 実行設定
+        
+    Returns:
+    -------
+        実行結果
+    """
+    return asyncio.run(ainvoke_graph(graph, input_data, config))
@@ -25,6 +25,11 @@ class LLMConfig:
         temperature: float = 0.0,
         max_tokens: int = 1000,
         timeout: int = 60,
+        batch_size: int = 1,
+        use_response_cache: bool = False,
+        requests_per_minute: int | None = None,
+        batch_api_threshold: int | None = None,
+        reasoning_effort: str | None = None,
     ):
         """LLMConfigを初期化.
         
@@ -34,11 +39,21 @@ class LLMConfig:
             temperature: サンプリング温度（0.0-1.0）
             max_tokens: 最大トークン数
             timeout: タイムアウト（秒）
+            batch_size: 1回のLLM呼び出しでまとめて評価する論文数（1の場合は論文ごとに呼び出す）
+            use_response_cache: LLMの応答と論文ごとの評価結果をディスクにキャッシュし、同一内容の再評価でAPI呼び出しを省略するか
+            requests_per_minute: LLMへの1分あたりの最大リクエスト数（Noneの場合は制限しない）
+            batch_api_threshold: 評価対象数がこの件数を超えた場合にOpenAI Batch APIで評価する（Noneの場合は常にオンライン呼び出し）
+            reasoning_effort: GPT-5系モデルのreasoning_effort（"auto"の場合はモデルごとに調整した値、Noneの場合はAPIの既定値）
         """
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.use_response_cache = use_response_cache
+        self.requests_per_minute = requests_per_minute
+        self.batch_api_threshold = batch_api_threshold
+        self.reasoning_effort = reasoning_effort
     
     def to_dict(self) -> dict:
         """設定を辞書に変換."""
@@ -47,6 +62,11 @@ class LLMConfig:
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
             "timeout": self.timeout,
+            "batch_size": self.batch_size,
+            "use_response_cache": self.use_response_cache,
+            "requests_per_minute": self.requests_per_minute,
+            "batch_api_threshold": self.batch_api_threshold,
+            "reasoning_effort": self.reasoning_effort,
         }
 
 
@@ -63,6 +83,12 @@ class ScoringWeights:
     novelty_weight: float = 0.3     # 新規性の重み
     impact_weight: float = 0.3      # インパクトの重み
     
+    # 統合LLM評価のoverall_score重み（relevance, novelty, impact, practicalityの重み）
+    llm_relevance_weight: float = 0.4      # 関連性の重み
+    llm_novelty_weight: float = 0.25       # 新規性の重み
+    llm_impact_weight: float = 0.25        # インパクトの重み
+    llm_practicality_weight: float = 0.10  # 実用性の重み
+    
     # 関連性スコア計算の重み（同義語拡張に最適化）
     keyword_exact_match_weight: float = 0.3   # 完全一致の重み
     keyword_partial_match_weight: float = 0.15  # 部分一致の重み（0.1→0.15に増加）
@@ -83,6 +109,17 @@ class ScoringWeights:
             raise ValueError(
                 f"relevance_weight + novelty_weight + impact_weight must equal 1.0 (got {total_openreview})"
             )
+        
+        # 統合LLM評価のスコア重みの合計チェック
+        total_llm = (
+            self.llm_relevance_weight + self.llm_novelty_weight
+            + self.llm_impact_weight + self.llm_practicality_weight
+        )
+        if abs(total_llm - 1.0) > 0.01:
+            raise ValueError(
+                "llm_relevance_weight + llm_novelty_weight + llm_impact_weight + llm_practicality_weight "
+                f"must equal 1.0 (got {total_llm})"
+            )
 
 
 # デフォルト設定
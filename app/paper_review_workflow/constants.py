@@ -3,15 +3,21 @@
 # ランキング関連
 DEFAULT_TOP_N_PAPERS = 20  # デフォルトのトップN論文数
 MAX_DISPLAY_PAPERS = 20    # 表示する最大論文数
+PARTIAL_SORT_RATIO = 4     # 上位件数が全体のこの割合未満なら全件ソートせずheapqで上位のみ抽出
 
 # LLM評価関連
 DEFAULT_LLM_MAX_TOKENS = 1000      # LLM評価のデフォルト最大トークン数
 DEFAULT_LLM_TEMPERATURE = 0.0      # LLM評価のデフォルト温度
 DEFAULT_LLM_TIMEOUT = 60           # LLM評価のデフォルトタイムアウト（秒）
 PRELIMINARY_LLM_MAX_TOKENS = 50    # 簡易LLM評価の最大トークン数
+LLM_MAX_RETRIES = 6                # レート制限・接続エラー時のLLM呼び出しの最大リトライ回数
+BATCH_API_MAX_WAIT_SECONDS = 60 * 60  # Batch APIの完了を待つ最大時間（秒、超えたらキャンセルしてオンライン評価に切り替え）
+HTTP_MAX_CONNECTIONS = 64          # 全ノードで共有するHTTP接続プールの最大接続数
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32  # 共有HTTP接続プールで維持するキープアライブ接続数
 
 # テキスト処理関連
 ABSTRACT_SHORT_LENGTH = 300        # アブストラクト短縮の文字数
+ABSTRACT_EVALUATION_LENGTH = 1500  # LLM評価プロンプトに含めるアブストラクトの最大文字数
 MAX_KEYWORDS_DISPLAY = 8           # 表示する最大キーワード数
 MAX_AUTHORS_DISPLAY = 5            # 表示する最大著者数
 MAX_RATIONALE_LENGTH = 500         # 評価理由の最大文字数
@@ -20,10 +26,26 @@ MAX_RATIONALE_LENGTH = 500         # 評価理由の最大文字数
 SYNONYMS_LLM_MAX_TOKENS = 200      # 同義語生成の最大トークン数
 SYNONYMS_COUNT_MIN = 3             # 最小同義語数
 SYNONYMS_COUNT_MAX = 5             # 最大同義語数
+SYNONYMS_LLM_CONCURRENCY = 8       # キーワードごとの同義語生成の最大同時リクエスト数
 
 # キャッシュ関連
 DEFAULT_CACHE_TTL_HOURS = 24       # キャッシュのデフォルトTTL（時間）
 CACHE_DIR_NAME = "storage/cache"   # キャッシュディレクトリ名
+LLM_CACHE_TTL_HOURS = 24 * 7       # LLM応答キャッシュのTTL（時間）
+METADATA_CACHE_TTL_HOURS = 24 * 7  # 論文メタデータキャッシュのTTL（時間）
+CITATION_CACHE_TTL_HOURS = 24 * 7  # 引用分析キャッシュのTTL（時間、被引用数の変化は緩やかなため長め）
+MEMORY_CACHE_MAX_ENTRIES = 256     # ディスクキャッシュの手前に置くメモリキャッシュの最大件数
+SYNONYMS_CACHE_TTL_HOURS = 24 * 30 # 同義語キャッシュのTTL（時間）
+
+# OpenReview API関連
+METADATA_FETCH_CONCURRENCY = 8     # レビューデータをAPIから取得する際の最大同時リクエスト数
+
+# Semantic Scholar API関連
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # /paper/batch の1リクエストで取得する最大論文数（APIの上限）
+SEMANTIC_SCHOLAR_SEARCH_CONCURRENCY = 8  # タイトル検索の最大同時リクエスト数
+SEMANTIC_SCHOLAR_POOL_SIZE = 16    # Semantic Scholarへのキープアライブ接続プールの最大接続数
+SEMANTIC_SCHOLAR_MAX_RETRIES = 5   # レート制限(429)・5xx時の最大リトライ回数
+SEMANTIC_SCHOLAR_RETRY_BACKOFF = 0.5  # リトライ間隔の指数バックオフ係数（秒）
 
 # スコアリング関連
 MIN_SCORE = 0.0                    # 最小スコア値
@@ -1,6 +1,105 @@
 """Factory function for creating LLM instances with GPT-5 support."""
 
+import asyncio
+import re
+import time
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from typing import Any
+
+import httpx
+import orjson
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
+from loguru import logger
+from openai import OpenAI
+from openai.types import Batch
+from pydantic import BaseModel
+
+from app.paper_review_workflow.constants import (
+    BATCH_API_MAX_WAIT_SECONDS,
+    DEFAULT_LLM_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_MAX_RETRIES,
+)
+
+# Batch APIの終了ステータス
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Batch APIに投入する1リクエスト分のプロンプト（文字列、またはbuild_messagesのメッセージリスト）
+BatchPrompt = str | list[BaseMessage]
+
+
+# GPT-5系モデルごとの max_completion_tokens 倍率（推論トークン分の上乗せ）
+_GPT5_TOKEN_MULT = {"gpt-5-nano": 2, "gpt-5-mini": 3, "gpt-5": 4}
+# 表にないGPT-5系モデルの倍率
+_GPT5_DEFAULT_TOKEN_MULT = 5
+# reasoning_effort にこの値を指定した場合のみ、下表のモデルごとの値を使う（省略時はAPIの既定値）
+REASONING_EFFORT_AUTO = "auto"
+# GPT-5系モデルごとに調整した reasoning_effort（REASONING_EFFORT_AUTO 指定時）
+_GPT5_REASONING_EFFORT = {"gpt-5-nano": "minimal", "gpt-5-mini": "low", "gpt-5": "medium"}
+
+# 応答中の最初のコードブロック（```json ... ``` / ``` ... ```、閉じ忘れを含む）
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+# JSONの構造を決める文字（括弧・文字列の引用符・エスケープ）
+_JSON_STRUCTURAL_CHAR_RE = re.compile(r'[{}"\\]')
+# 応答中のオブジェクトの配列（"[1]" のような前置きの括弧は対象外）
+_JSON_OBJECT_ARRAY_RE = re.compile(r"\[\s*\{.*\}\s*\]", re.DOTALL)
+
+
+@cache
+def _gpt5_family(model: str) -> str | None:
+    """Map a GPT-5 model name (possibly date-suffixed) to its calibration-table key."""
+    for family in ("gpt-5-nano", "gpt-5-mini"):
+        if model.startswith(family):
+            return family
+    if model == "gpt-5" or model.startswith("gpt-5-"):
+        return "gpt-5"
+    return None
+
+
+@cache
+def _token_params(model: str) -> tuple[str, int]:
+    """Resolve the token-limit parameter name and multiplier for a model.
+    
+    Returns:
+    -------
+        (parameter name, multiplier applied to max_tokens)
+    """
+    # GPT-5 series uses max_completion_tokens instead of max_tokens
+    # and needs more tokens for reasoning + actual output
+    if model.startswith("gpt-5"):
+        # Reasoning models bill for the reserved budget, so the headroom is
+        # calibrated per model: smaller models reason less
+        return "max_completion_tokens", _GPT5_TOKEN_MULT.get(
+            _gpt5_family(model) or model, _GPT5_DEFAULT_TOKEN_MULT
+        )
+    # GPT-4 and earlier use max_tokens
+    return "max_tokens", 1
+
+
+def _reasoning_effort(model: str, reasoning_effort: str | None) -> str | None:
+    """Resolve reasoning_effort for a model (None leaves the API default)."""
+    if not model.startswith("gpt-5") or reasoning_effort is None:
+        return None
+    if reasoning_effort == REASONING_EFFORT_AUTO:
+        return _GPT5_REASONING_EFFORT.get(_gpt5_family(model) or model)
+    return reasoning_effort
+
+
+def _accepts_temperature(model: str, reasoning_effort: str | None, temperature: float) -> bool:
+    """Whether a request may carry `temperature` (mirrors ChatOpenAI's gpt-5 validation).
+    
+    GPT-5 reasoning models (other than gpt-5-chat and reasoning_effort='none')
+    reject any temperature but the default 1, so it has to be left out.
+    """
+    if model.startswith("gpt-5") and "chat" not in model and reasoning_effort != "none":
+        return temperature == 1
+    return True
 
 
 def create_chat_openai(
@@ -8,12 +107,19 @@ def create_chat_openai(
     temperature: float = 0.0,
     max_tokens: int = 1000,
     timeout: int = 60,
-    **kwargs
+    reasoning_effort: str | None = None,
+    **kwargs: Any,
 ) -> ChatOpenAI:
     """Create ChatOpenAI instance with appropriate parameters for the model.
     
     GPT-5 series requires 'max_completion_tokens' instead of 'max_tokens'.
-    GPT-5 models are reasoning models and need more tokens (reasoning + output).
+    GPT-5 models are reasoning models and need more tokens (reasoning + output);
+    the extra budget and the default reasoning effort are calibrated per model.
+    Instances are cached per argument set, and all instances share the
+    process-wide HTTP connection pool from `get_http_clients`.
+    Rate-limit (429) and connection errors are retried by the OpenAI client
+    with jittered exponential backoff, up to LLM_MAX_RETRIES times unless
+    `max_retries` is given.
     
     Args:
     ----
@@ -21,34 +127,572 @@ def create_chat_openai(
         temperature: Sampling temperature (0.0-1.0)
         max_tokens: Maximum number of tokens to generate
         timeout: Request timeout in seconds
+        reasoning_effort: GPT-5 reasoning effort ('minimal', 'low', 'medium',
+            'high'), or REASONING_EFFORT_AUTO for the per-model calibrated
+            setting; None (default) sends nothing and keeps the API default.
+            Ignored for other models
         **kwargs: Additional arguments to pass to ChatOpenAI
     
     Returns:
     -------
         ChatOpenAI instance configured for the specified model
     """
-    # GPT-5 series uses max_completion_tokens instead of max_tokens
-    # and needs more tokens for reasoning + actual output
-    if model.startswith("gpt-5"):
-        # GPT-5 models are reasoning models - they need significantly more tokens
-        # Original max_tokens is for output, but GPT-5 uses tokens for reasoning too
-        # Multiply by 4-5x to ensure enough tokens for both reasoning and output
-        adjusted_tokens = max_tokens * 5
+    effort = _reasoning_effort(model, reasoning_effort)
+    if effort is not None:
+        kwargs["reasoning_effort"] = effort
+    kwargs.setdefault("max_retries", LLM_MAX_RETRIES)
+    try:
+        return _cached_chat_openai(
+            model, temperature, max_tokens, timeout, tuple(sorted(kwargs.items()))
+        )
+    except TypeError:
+        # ハッシュ不可能な引数（dictなど）を含む場合はキャッシュせずに生成
+        return _build_chat_openai(model, temperature, max_tokens, timeout, kwargs)
+
+
+@lru_cache(maxsize=32)
+def _cached_chat_openai(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    kwargs_items: tuple[tuple[str, Any], ...],
+) -> ChatOpenAI:
+    return _build_chat_openai(model, temperature, max_tokens, timeout, dict(kwargs_items))
+
+
+def _build_chat_openai(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    kwargs: dict[str, Any],
+) -> ChatOpenAI:
+    token_param, multiplier = _token_params(model)
+    kwargs[token_param] = max_tokens * multiplier
+    http_client, http_async_client = get_http_clients()
+    kwargs.setdefault("http_client", http_client)
+    kwargs.setdefault("http_async_client", http_async_client)
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        timeout=timeout,
+        **kwargs
+    )
+
+
+@cache
+def get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the process-wide HTTP clients shared by every chat model.
+    
+    Sharing one connection pool across nodes and models keeps TCP/TLS
+    connections alive between requests instead of opening a new pool per
+    ChatOpenAI instance. The per-request timeout set on each model still
+    applies; the client timeout is only the default.
+    
+    Returns:
+    -------
+        (sync client, async client) with the shared connection limits
+    """
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    timeout = httpx.Timeout(DEFAULT_LLM_TIMEOUT)
+    return (
+        httpx.Client(limits=limits, timeout=timeout),
+        httpx.AsyncClient(limits=limits, timeout=timeout),
+    )
+
+
+@cache
+def get_rate_limiter(requests_per_minute: int) -> InMemoryRateLimiter:
+    """Return the process-wide request rate limiter for a requests-per-minute budget.
+    
+    Passing the same limiter as `rate_limiter=` to every chat model keeps the
+    concurrent fan-out of all nodes under the account's rate limit instead of
+    relying on 429 retries.
+    
+    Args:
+    ----
+        requests_per_minute: Maximum number of requests per minute
+    
+    Returns:
+    -------
+        Shared InMemoryRateLimiter instance (allows bursts of up to 1 second's budget)
+    """
+    requests_per_second = requests_per_minute / 60
+    return InMemoryRateLimiter(
+        requests_per_second=requests_per_second,
+        check_every_n_seconds=0.05,
+        max_bucket_size=max(1.0, requests_per_second),
+    )
+
+
+def supports_structured_output(model: str) -> bool:
+    """Whether the model accepts response_format={"type": "json_schema"}."""
+    return not (model.startswith("gpt-3") or model.startswith("gpt-4-") or model == "gpt-4")
+
+
+def create_chat_openai_structured(
+    model: str,
+    schema: type[BaseModel],
+    temperature: float = 0.0,
+    max_tokens: int = 1000,
+    timeout: int = 60,
+    **kwargs: Any,
+) -> Runnable[LanguageModelInput, AIMessage]:
+    """Create a chat model whose output is constrained to a JSON schema.
+    
+    The schema is sent as a strict `json_schema` response_format, so the
+    server guarantees the reply is a JSON document matching `schema` and
+    callers can validate it with `schema.model_validate_json`. The raw text
+    is still returned (rather than a parsed object) so that streaming and
+    the text-based response cache keep working. Models without Structured
+    Outputs support get the plain model back.
+    
+    Args:
+    ----
+        model: Model name (e.g., 'gpt-4o-mini', 'gpt-5-nano')
+        schema: Pydantic model describing the expected JSON output
+        temperature: Sampling temperature (0.0-1.0)
+        max_tokens: Maximum number of tokens to generate
+        timeout: Request timeout in seconds
+        **kwargs: Additional arguments to pass to create_chat_openai
+    
+    Returns:
+    -------
+        ChatOpenAI instance bound to the response format
+    """
+    llm = create_chat_openai(model, temperature, max_tokens, timeout, **kwargs)
+    if not supports_structured_output(model):
+        return llm
+    return llm.bind(response_format=_json_schema_response_format(schema))
+
+
+@lru_cache(maxsize=16)
+def _json_schema_response_format(schema: type[BaseModel]) -> dict[str, Any]:
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.__name__,
+            "schema": schema.model_json_schema(),
+            "strict": True,
+        },
+    }
+
+
+def build_messages(*static_blocks: str, variable_content: str) -> list[BaseMessage]:
+    """Build a chat message list whose leading part is reusable across calls.
+    
+    OpenAI's prompt cache only hits when the leading tokens of a request are
+    byte-identical, so every static block (rubric, research interests, ...)
+    goes first as its own system message and only the per-call content
+    (paper details) is sent last as the human message.
+    
+    Args:
+    ----
+        *static_blocks: Call-independent texts, in a fixed order
+        variable_content: Per-call text appended as the final human message
+    
+    Returns:
+    -------
+        [SystemMessage(block) for each static block] + [HumanMessage(variable_content)]
+    """
+    return [*_static_messages(static_blocks), HumanMessage(content=variable_content)]
+
+
+@lru_cache(maxsize=32)
+def _static_messages(static_blocks: tuple[str, ...]) -> tuple[SystemMessage, ...]:
+    # 同一プレフィックスのメッセージオブジェクトは呼び出し間で使い回す
+    return tuple(SystemMessage(content=block) for block in static_blocks)
+
+
+async def astream_json(llm: Runnable[LanguageModelInput, AIMessage], messages: LanguageModelInput) -> str:
+    """Stream a completion and stop as soon as the top-level JSON value closes.
+    
+    Evaluation prompts ask for a single JSON object (or array of objects), but models
+    sometimes keep writing prose after it. Reading the stream and closing it
+    once the outermost bracket is balanced avoids waiting (and paying) for
+    that trailing output. Depth tracking starts at the first '{' or '[', and a
+    balanced span that is not a JSON object or array of objects (brackets in
+    leading prose such as "[1]") is skipped so scanning resumes at the next
+    opening bracket. Falls back to a
+    plain `ainvoke` when the model has a response cache, since streaming
+    bypasses LangChain's cache.
+    
+    Args:
+    ----
+        llm: ChatOpenAI instance (optionally bound to a response format)
+        messages: Prompt string or message list
+    
+    Returns:
+    -------
+        Response text up to and including the closing bracket of the first
+        top-level JSON value (the whole text if it never closes)
+    """
+    # 構造化出力用にbindしたモデルでも、cache属性は元のChatOpenAIから引き継がれる
+    if getattr(llm, "cache", None) is not None:
+        response = await llm.ainvoke(messages)
+        return response.text
+    
+    parts: list[str] = []
+    # 走査中のJSON値のうち前のチャンクまでに受信した部分（最初の開き括弧以降）
+    value_parts: list[str] = []
+    depth = 0
+    in_string = False
+    escaped = False
+    stream = llm.astream(messages)
+    try:
+        async for chunk in stream:
+            text = chunk.text
+            value_start: int | None = 0 if depth > 0 else None
+            for i, char in enumerate(text):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = depth > 0
+                elif char in "{[":
+                    if depth == 0:
+                        value_start = i
+                    depth += 1
+                elif char in "}]" and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        candidate = "".join(value_parts) + text[value_start:i + 1]
+                        value_parts.clear()
+                        if not _is_json_document(candidate):
+                            # 前置きの文章中の括弧だったため、次の開き括弧から走査し直す
+                            value_start = None
+                            continue
+                        # 最外側の括弧が閉じたら残りの生成は待たずに打ち切る
+                        parts.append(text[:i + 1])
+                        return "".join(parts)
+            if depth > 0:
+                value_parts.append(text[value_start:])
+            parts.append(text)
+    finally:
+        # 打ち切ったストリームを明示的に閉じてHTTP接続を解放する
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return "".join(parts)
+
+
+def _is_json_document(text: str) -> bool:
+    """Whether the text parses as a JSON object or a non-empty array of objects."""
+    try:
+        value = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return False
+    if isinstance(value, list):
+        # "[]" は前置きの文章中の空括弧である可能性が高いため評価結果とみなさない
+        return bool(value) and all(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
+def strip_json_code_fence(text: str) -> str:
+    """Return the contents of the first Markdown code block, or the text itself.
+    
+    Args:
+    ----
+        text: LLM response text, possibly wrapped in ```json ... ```
+    
+    Returns:
+    -------
+        Stripped code block contents (the stripped text if there is no fence)
+    """
+    match = _JSON_FENCE_RE.search(text)
+    return match.group(1).strip() if match else text.strip()
+
+
+def extract_json_object(text: str) -> str | None:
+    """Return the first balanced JSON object in the text, or None.
+    
+    Scans forward once from the first '{', tracking brace depth outside of
+    string literals (and escapes inside them), so nested objects and braces
+    inside strings are handled in linear time without regex backtracking.
+    
+    Args:
+    ----
+        text: LLM response text containing a JSON object
+    
+    Returns:
+    -------
+        Substring from the first '{' to its matching '}' (None if unbalanced)
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped_index = -1
+    for match in _JSON_STRUCTURAL_CHAR_RE.finditer(text, start):
+        i = match.start()
+        if i == escaped_index:
+            continue
+        char = text[i]
+        if in_string:
+            if char == "\\":
+                escaped_index = i + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def format_id_keyed_items(items: Iterable[tuple[str, str]]) -> str:
+    """Format per-item texts as a numbered list labelled with each item's ID.
+    
+    Batch prompts put several papers in one request and ask the model to
+    answer with a JSON array whose "id" fields echo these labels, so the
+    answers can be matched back regardless of their order.
+    
+    Args:
+    ----
+        items: (ID, item text) pairs in prompt order
+    
+    Returns:
+    -------
+        "[1] ID: <id>\n<text>" entries joined by newlines
+    """
+    return "\n".join(
+        f"[{i}] ID: {item_id}\n{text}"
+        for i, (item_id, text) in enumerate(items, 1)
+    )
+
+
+def parse_id_keyed_json_array(text: str) -> dict[str, dict[str, Any]]:
+    """Parse a JSON array of objects answered for a `format_id_keyed_items` prompt.
+    
+    The array may be wrapped in a code fence, surrounded by prose, or nested
+    in an object (e.g. {"evaluations": [...]}). Elements without an "id" are
+    ignored.
+    
+    Args:
+    ----
+        text: LLM response text containing a JSON array of objects
+    
+    Returns:
+    -------
+        Mapping from each element's "id" (as str) to the element
+    
+    Raises:
+    ------
+        ValueError: If the response contains no parsable JSON
+        TypeError: If the parsed JSON is not an array
+    """
+    match = _JSON_OBJECT_ARRAY_RE.search(text)
+    items = orjson.loads(match.group(0) if match else strip_json_code_fence(text))
+    if not isinstance(items, list):
+        raise TypeError(f"Expected a JSON array, got {type(items).__name__}")
+    return {
+        str(item["id"]): item
+        for item in items
+        if isinstance(item, dict) and "id" in item
+    }
+
+
+def _to_openai_messages(prompt: BatchPrompt) -> list[dict[str, Any]]:
+    """Batch API入力用にプロンプトをChat Completionsのメッセージ形式へ変換."""
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    return [
+        {"role": "system" if isinstance(message, SystemMessage) else "user", "content": message.content}
+        for message in prompt
+    ]
+
+
+class OpenAIBatchClient:
+    """Client for OpenAI's Batch API (/v1/batches).
+    
+    Submits many chat-completion requests as a single JSONL file, which is
+    cheaper and not subject to the online rate limits, at the cost of an
+    asynchronous turnaround (up to the 24h completion window). Waiting is
+    bounded by `max_wait`: a batch still running after that is cancelled and
+    `arun` raises TimeoutError so callers can fall back to online calls.
+    """
+    
+    def __init__(
+        self,
+        model: str,
+        temperature: float = 0.0,
+        max_tokens: int = 1000,
+        poll_interval: float = 30.0,
+        max_wait: float = BATCH_API_MAX_WAIT_SECONDS,
+        reasoning_effort: str | None = None,
+        response_format: dict[str, Any] | None = None,
+    ) -> None:
+        """OpenAIBatchClientを初期化.
         
-        return ChatOpenAI(
-            model=model,
-            temperature=temperature,
-            max_completion_tokens=adjusted_tokens,
-            timeout=timeout,
-            **kwargs
+        Args:
+        ----
+            model: Model name (e.g., 'gpt-4o-mini')
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum number of tokens to generate per request
+            poll_interval: Seconds between batch status checks
+            max_wait: Seconds to wait for the batch before cancelling it
+            reasoning_effort: GPT-5 reasoning effort, or REASONING_EFFORT_AUTO (None keeps the API default)
+            response_format: Chat Completions response_format sent with every request
+        """
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.reasoning_effort = _reasoning_effort(model, reasoning_effort)
+        self.response_format = response_format
+        self.client = OpenAI()
+    
+    def _build_jsonl(self, prompts: dict[str, BatchPrompt]) -> bytes:
+        """custom_id -> prompt の辞書をBatch API入力のJSONLに変換."""
+        token_param, multiplier = _token_params(self.model)
+        params: dict[str, Any] = {token_param: self.max_tokens * multiplier}
+        # GPT-5系の推論モデルは既定値以外のtemperatureを受け付けない（オンライン側はChatOpenAIが除外する）
+        if _accepts_temperature(self.model, self.reasoning_effort, self.temperature):
+            params["temperature"] = self.temperature
+        if self.reasoning_effort is not None:
+            params["reasoning_effort"] = self.reasoning_effort
+        if self.response_format is not None:
+            params["response_format"] = self.response_format
+        return b"\n".join(
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": _to_openai_messages(prompt),
+                    **params,
+                },
+            })
+            for custom_id, prompt in prompts.items()
         )
-    else:
-        # GPT-4 and earlier use max_tokens
-        return ChatOpenAI(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            timeout=timeout,
-            **kwargs
+    
+    def submit(self, prompts: dict[str, BatchPrompt]) -> str:
+        """プロンプトをアップロードしてバッチを作成.
+        
+        Args:
+        ----
+            prompts: custom_id（例: 論文ID）をキー、プロンプトを値とする辞書
+        
+        Returns:
+        -------
+            作成されたバッチのID
+        """
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", self._build_jsonl(prompts)),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
+        logger.info(f"Submitted OpenAI batch {batch.id} ({len(prompts)} requests)")
+        return batch.id
+    
+    def _collect_results(self, batch: Batch) -> dict[str, str]:
+        """終了したバッチの出力ファイルから custom_id -> 応答テキスト を取り出す."""
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning(f"OpenAI batch {batch.id} finished with status '{batch.status}'")
+            return {}
+        
+        results: dict[str, str] = {}
+        content = self.client.files.content(batch.output_file_id).content
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = response.get("body", {}).get("choices") or []
+            if choices:
+                results[record["custom_id"]] = choices[0]["message"]["content"] or ""
+        return results
+    
+    async def arun(self, prompts: dict[str, BatchPrompt]) -> dict[str, str]:
+        """バッチを投入し、イベントループをブロックせずに完了を待つ.
+        
+        Args:
+        ----
+            prompts: custom_id をキー、プロンプトを値とする辞書
+        
+        Returns:
+        -------
+            custom_id をキー、応答テキストを値とする辞書（失敗したリクエストは含まれない）
+        
+        Raises:
+        ------
+            TimeoutError: `max_wait` 秒以内にバッチが終了しなかった場合（バッチはキャンセル済み）
+        """
+        batch_id = await asyncio.to_thread(self.submit, prompts)
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            batch = await asyncio.to_thread(self.client.batches.retrieve, batch_id)
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                return await asyncio.to_thread(self._collect_results, batch)
+            if time.monotonic() >= deadline:
+                await asyncio.to_thread(self.client.batches.cancel, batch_id)
+                raise TimeoutError(
+                    f"OpenAI batch {batch_id} did not finish within {self.max_wait:.0f}s (cancelled)"
+                )
+            await asyncio.sleep(self.poll_interval)
+
 
+def create_batch_openai(
+    model: str,
+    temperature: float = 0.0,
+    max_tokens: int = 1000,
+    poll_interval: float = 30.0,
+    max_wait: float = BATCH_API_MAX_WAIT_SECONDS,
+    reasoning_effort: str | None = None,
+    schema: type[BaseModel] | None = None,
+) -> OpenAIBatchClient:
+    """Create an OpenAI Batch API client with the same token handling as create_chat_openai.
+    
+    When `schema` is given and the model supports Structured Outputs, every
+    request carries the same strict `json_schema` response_format as
+    create_chat_openai_structured.
+    
+    Args:
+    ----
+        model: Model name (e.g., 'gpt-4o-mini', 'gpt-5-nano')
+        temperature: Sampling temperature (0.0-1.0)
+        max_tokens: Maximum number of tokens to generate per request
+        poll_interval: Seconds between batch status checks
+        max_wait: Seconds to wait for the batch before cancelling it
+        reasoning_effort: GPT-5 reasoning effort, or REASONING_EFFORT_AUTO (None keeps the API default)
+        schema: Pydantic model describing the expected JSON output (optional)
+    
+    Returns:
+    -------
+        OpenAIBatchClient instance
+    """
+    return OpenAIBatchClient(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        poll_interval=poll_interval,
+        max_wait=max_wait,
+        reasoning_effort=reasoning_effort,
+        response_format=(
+            _json_schema_response_format(schema)
+            if schema is not None and supports_structured_output(model)
+            else None
+        ),
+    )
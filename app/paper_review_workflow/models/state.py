@@ -1,9 +1,19 @@
 """State management for Paper Review Agent."""
 
-import operator
+import sys
 from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _extend(left: list, right: list) -> list:
+    """リスト型の状態を連結するリデューサー.
+    
+    `operator.add` と同じ結果を、更新のたびに新しいリストを作らず
+    チャネルが保持するリストへの追記で得ます。
+    """
+    left.extend(right)
+    return left
 
 
 class Paper(BaseModel):
@@ -29,6 +39,20 @@ class Paper(BaseModel):
     meta_review: str | None = Field(default=None, title="メタレビュー（エリアチェアのまとめ）")
     author_remarks: str | None = Field(default=None, title="著者の最終コメント")
     decision_comment: str | None = Field(default=None, title="採択判定の詳細コメント")
+    
+    @field_validator("venue", "decision", mode="before")
+    @classmethod
+    def _intern_str(cls, value: Any) -> Any:
+        """論文間で値が重複しやすい文字列をインターンし、同じ値を1つのオブジェクトで共有する."""
+        return sys.intern(value) if type(value) is str else value
+    
+    @field_validator("keywords", mode="before")
+    @classmethod
+    def _intern_keywords(cls, value: Any) -> Any:
+        """キーワードは多くの論文で共通のためインターンする."""
+        if isinstance(value, list):
+            return [sys.intern(kw) if type(kw) is str else kw for kw in value]
+        return value
 
 
 class EvaluatedPaper(Paper):
@@ -60,6 +84,11 @@ class EvaluatedPaper(Paper):
         title="総合スコア",
         description="4つのスコアの重み付き平均（0.0-1.0）",
     )
+    llm_scored: bool = Field(
+        default=False,
+        title="LLM関連性評価済み",
+        description="relevance_scoreが簡易LLM評価で再計算済みか（再評価の省略に使用）",
+    )
     
     # 統合LLM評価による追加情報
     review_summary: str | None = Field(
@@ -121,6 +150,60 @@ class EvaluatedPaper(Paper):
         title="ランク",
         description="論文のランク（1から始まる）",
     )
+    
+    @classmethod
+    def from_paper(cls, paper: Paper, **updates: Any) -> "EvaluatedPaper":
+        """Paperから評価済み論文を作成.
+        
+        `EvaluatedPaper(**paper.model_dump(), ...)` と同じ結果を、`model_dump` による
+        辞書への変換を挟まず、フィールド値を直接渡して検証することで得ます。
+        
+        Args:
+        ----
+            paper: 元の論文
+            **updates: 設定する評価フィールド（relevance_score など）
+            
+        Returns:
+        -------
+            評価済み論文
+        """
+        return cls.model_validate({**paper.__dict__, **updates})
+
+
+class EvaluatedPaperScores(BaseModel):
+    """統合LLM評価の出力スキーマ（OpenAIのStructured Outputsで出力形式を強制する）."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    relevance: float = Field(title="関連性", description="ユーザーの研究興味との関連度（0.0-1.0）")
+    novelty: float = Field(title="新規性", description="研究の独創性・新しさ（0.0-1.0）")
+    impact: float = Field(title="インパクト", description="学術的・実用的な影響力（0.0-1.0）")
+    practicality: float = Field(title="実用性", description="実際の応用可能性（0.0-1.0）")
+    review_summary: str = Field(title="レビュー要約", description="すべてのレビューの2-3文の要約")
+    field_insights: str = Field(title="フィールド活用の説明", description="主に参照したレビューフィールドの1-2文の説明")
+    rationale: str = Field(title="評価理由", description="各スコアの理由の2-3文の説明")
+
+
+class IdentifiedPaperScores(EvaluatedPaperScores):
+    """バッチ評価の1論文分の出力（論文IDつき）."""
+    
+    id: str = Field(title="論文ID", description="プロンプトに記載された論文IDそのまま")
+
+
+class BatchEvaluatedPaperScores(BaseModel):
+    """統合LLMバッチ評価の出力スキーマ."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    evaluations: list[IdentifiedPaperScores] = Field(title="論文ごとの評価結果")
+
+
+class RelevanceScore(BaseModel):
+    """簡易LLM関連性評価の出力スキーマ（OpenAIのStructured Outputsで出力形式を強制する）."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    score: float = Field(title="関連性スコア", description="ユーザーの研究興味との関連度（0.0-1.0）")
 
 
 class EvaluationCriteria(BaseModel):
@@ -176,6 +259,35 @@ class EvaluationCriteria(BaseModel):
         title="簡易LLMフィルタ対象数",
         description="簡易LLM評価する候補論文数（上位N件を評価して精度を向上）",
     )
+    preliminary_llm_batch_size: int = Field(
+        default=1,
+        ge=1,
+        title="簡易LLMフィルタのバッチサイズ",
+        description="簡易LLM評価で1回の呼び出しにまとめる論文数（1の場合は論文ごとに呼び出す）",
+    )
+    max_concurrency: int = Field(
+        default=20,
+        ge=1,
+        title="LLM同時呼び出し数",
+        description="LLM評価を並行実行する際の最大同時リクエスト数",
+    )
+    preliminary_llm_model: str = Field(
+        default="gpt-4o-mini",
+        title="簡易LLMフィルタのモデル",
+        description="簡易LLM評価に使うモデル名（本評価のモデルはLLMConfigで指定）",
+    )
+    preliminary_batch_api_threshold: int | None = Field(
+        default=None,
+        title="簡易LLMフィルタのBatch API切り替え件数",
+        description="簡易LLMフィルタの対象数がこの件数を超えた場合にOpenAI Batch APIで評価する（Noneの場合は常にオンライン呼び出し）",
+    )
+    llm_skip_ratio: float = Field(
+        default=0.0,
+        ge=0.0,
+        lt=1.0,
+        title="LLM評価スキップ割合",
+        description="キーワードによる関連性スコアが下位のこの割合の論文はLLM評価せずキーワードベースのスコアを保持する（0.0の場合は全件評価）",
+    )
 
 
 class PaperReviewAgentInputState(BaseModel):
@@ -218,7 +330,7 @@ class PaperReviewAgentPrivateState(BaseModel):
         default_factory=list,
         title="検索された論文リスト",
     )
-    evaluated_papers: Annotated[list[EvaluatedPaper], operator.add] = Field(
+    evaluated_papers: Annotated[list[EvaluatedPaper], _extend] = Field(
         default_factory=list,
         title="評価済み論文リスト",
     )
@@ -239,7 +351,7 @@ class PaperReviewAgentPrivateState(BaseModel):
         title="キーワード同義語辞書",
         description="各キーワードとその同義語のマッピング（キー: キーワード、値: 同義語リスト）",
     )
-    error_messages: Annotated[list[str], operator.add] = Field(
+    error_messages: Annotated[list[str], _extend] = Field(
         default_factory=list,
         title="エラーメッセージリスト",
     )
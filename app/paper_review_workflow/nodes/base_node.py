@@ -12,6 +12,8 @@ class BaseNode(ABC):
     """ワークフローノードの基底クラス.
     
     全てのノードはこのクラスを継承し、__call__メソッドを実装する必要があります。
+    log_* メソッドは loguru と同じく `{}` プレースホルダーと引数を受け取り、
+    出力されるログレベルの場合にのみ文字列を組み立てます。
     """
     
     def __init__(self) -> None:
@@ -37,23 +39,23 @@ class BaseNode(ABC):
         """ノードの名前を取得."""
         return self.__class__.__name__
     
-    def log_start(self, message: str) -> None:
+    def log_start(self, message: str, *args: Any, **kwargs: Any) -> None:
         """ノード開始ログを出力."""
-        self.logger.info(f"[{self.name}] {message}")
+        self.logger.info("[" + self.name + "] " + message, *args, **kwargs)
     
-    def log_success(self, message: str) -> None:
+    def log_success(self, message: str, *args: Any, **kwargs: Any) -> None:
         """ノード成功ログを出力."""
-        self.logger.success(f"[{self.name}] {message}")
+        self.logger.success("[" + self.name + "] " + message, *args, **kwargs)
     
-    def log_error(self, message: str) -> None:
+    def log_error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """ノードエラーログを出力."""
-        self.logger.error(f"[{self.name}] {message}")
+        self.logger.error("[" + self.name + "] " + message, *args, **kwargs)
     
-    def log_warning(self, message: str) -> None:
+    def log_warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """ノード警告ログを出力."""
-        self.logger.warning(f"[{self.name}] {message}")
+        self.logger.warning("[" + self.name + "] " + message, *args, **kwargs)
     
-    def log_debug(self, message: str) -> None:
+    def log_debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """ノードデバッグログを出力."""
-        self.logger.debug(f"[{self.name}] {message}")
+        self.logger.debug("[" + self.name + "] " + message, *args, **kwargs)
 
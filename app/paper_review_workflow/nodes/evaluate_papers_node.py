@@ -1,23 +1,27 @@
 """Node for evaluating papers based on OpenReview review data."""
 
-import json
+import asyncio
 from typing import Any
 
-from langchain_openai import ChatOpenAI
+import orjson
+from langchain_core.language_models import LanguageModelInput
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from app.paper_review_workflow.models.state import (
     PaperReviewAgentState,
     EvaluatedPaper,
     Paper,
-    EvaluationCriteria,
 )
 from app.paper_review_workflow.tools import fetch_paper_metadata
+from app.paper_review_workflow.tools.cache_manager import CacheManager
+from app.paper_review_workflow.llm_factory import create_chat_openai, strip_json_code_fence
 from app.paper_review_workflow.config import ScoringWeights, DEFAULT_SCORING_WEIGHTS
 from app.paper_review_workflow.constants import (
     SYNONYMS_LLM_MAX_TOKENS,
     SYNONYMS_COUNT_MIN,
     SYNONYMS_COUNT_MAX,
+    SYNONYMS_LLM_CONCURRENCY,
     MIN_SCORE,
     MAX_SCORE,
     NEURIPS_RATING_SCALE,
@@ -25,6 +29,24 @@ from app.paper_review_workflow.constants import (
     RELEVANCE_TEXT_WEIGHT,
     RELEVANCE_COVERAGE_WEIGHT,
     MAX_RATIONALE_LENGTH,
+    METADATA_FETCH_CONCURRENCY,
+    CACHE_DIR_NAME,
+    SYNONYMS_CACHE_TTL_HOURS,
+)
+
+# ディスクキャッシュから読み込んだ同義語辞書の検証スキーマ（キーワード -> 同義語リスト）
+_SYNONYMS_ADAPTER = TypeAdapter(dict[str, list[str]])
+
+# 新規性に関するキーワード（ポジティブ）
+_NOVELTY_POSITIVE_KEYWORDS = (
+    "novel", "new approach", "innovative", "original", "first",
+    "groundbreaking", "pioneering", "unique", "creative", "fresh",
+)
+
+# 新規性が低いことを示すキーワード（ネガティブ）
+_NOVELTY_NEGATIVE_KEYWORDS = (
+    "not novel", "incremental", "limited novelty", "similar to",
+    "existing work", "well-known", "standard approach",
 )
 
 
@@ -40,11 +62,18 @@ class EvaluatePapersNode:
         """
         self.tool = fetch_paper_metadata
         self.weights = scoring_weights or DEFAULT_SCORING_WEIGHTS
-        self._synonyms_cache: dict[str, list[str]] = {}  # 同義語キャッシュ
+        # 同義語生成用のLLM（HTTPクライアントを呼び出し間で使い回すため1回だけ生成）
+        self.synonyms_llm = create_chat_openai(model="gpt-4o-mini", temperature=0.0, max_tokens=SYNONYMS_LLM_MAX_TOKENS)
+        self._synonyms_cache: dict[str, dict[str, list[str]]] = {}  # 同義語キャッシュ（研究興味ごと）
+        # プロセスをまたいで同義語を再利用するためのディスクキャッシュ
+        self._synonyms_disk_cache = CacheManager(cache_dir=CACHE_DIR_NAME, ttl_hours=SYNONYMS_CACHE_TTL_HOURS)
     
-    def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
+    async def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
         """論文評価を実行.
         
+        同義語生成のLLM呼び出しは非同期に行い、レビューデータを持たない論文のメタデータ取得（HTTP）は
+        `asyncio.gather`で並行に実行します（同時リクエスト数は`METADATA_FETCH_CONCURRENCY`で制限）。
+        
         Args:
         ----
             state: 現在の状態
@@ -58,75 +87,47 @@ class EvaluatePapersNode:
         # 最初に同義語を生成（全論文の評価で使用）
         research_interests = state.evaluation_criteria.research_interests
         if research_interests:
-            synonyms = self._generate_synonyms(research_interests)
+            synonyms = await self._generate_synonyms(research_interests)
         else:
             synonyms = {}
         
-        evaluated_papers: list[EvaluatedPaper] = []
+        # キーワードグループは全論文で共通のため、ループ前に1回だけ作成
+        keyword_groups = self._build_keyword_groups(research_interests, synonyms)
         
-        for i, paper in enumerate(state.papers, 1):
-            try:
-                logger.info(f"Evaluating paper {i}/{len(state.papers)}: {paper.title[:50]}...")
-                
-                # メタデータを取得（既にレビューデータがある場合はそれを使用）
-                if paper.reviews and paper.rating_avg is not None:
-                    # all_papers.jsonから読み込んだデータを使用（API呼び出し不要）
-                    logger.debug(f"Using cached review data for {paper.id}")
-                    metadata = {
-                        "reviews": paper.reviews,
-                        "rating_avg": paper.rating_avg,
-                        "confidence_avg": paper.confidence_avg,
-                        "decision": paper.decision,
-                    }
-                else:
-                    # APIから取得
-                    logger.debug(f"Fetching review data from API for {paper.id}")
-                    result = self.tool.invoke({"paper_id": paper.id})
-                    metadata = json.loads(result)
-                    
-                    # エラーチェック
-                    if isinstance(metadata, dict) and "error" in metadata:
-                        logger.warning(f"Failed to fetch metadata for {paper.id}: {metadata['error']}")
-                        # メタデータなしで評価
-                        evaluated_paper = EvaluatedPaper(
-                            **paper.model_dump(),
-                            relevance_score=None,
-                            novelty_score=None,
-                            impact_score=None,
-                            overall_score=0.0,
-                            evaluation_rationale="メタデータ取得失敗",
-                        )
-                        evaluated_papers.append(evaluated_paper)
-                        continue
-                
-                # スコアを計算（paperオブジェクトも渡す）
-                scores = self._calculate_scores(paper, metadata, state.evaluation_criteria)
-                
-                # 評価理由を生成
-                rationale = self._generate_rationale(metadata, scores)
-                
-                # EvaluatedPaperオブジェクトを作成
-                evaluated_paper = EvaluatedPaper(
-                    **paper.model_dump(),
-                    relevance_score=scores["relevance"],
-                    novelty_score=scores["novelty"],
-                    impact_score=scores["impact"],
-                    overall_score=scores["overall"],
-                    evaluation_rationale=rationale,
-                )
-                
-                evaluated_papers.append(evaluated_paper)
-                logger.debug(f"Evaluated: {paper.title[:50]} - Score: {scores['overall']:.2f}")
-                
-            except Exception as e:
-                logger.error(f"Error evaluating paper {paper.id}: {e}")
-                # エラーが発生した場合もスキップせず、スコア0で追加
-                evaluated_paper = EvaluatedPaper(
-                    **paper.model_dump(),
-                    overall_score=0.0,
-                    evaluation_rationale=f"評価エラー: {e!s}",
+        total = len(state.papers)
+        evaluated_papers: list[EvaluatedPaper | None] = [None] * total
+        fetch_indices: list[int] = []
+        
+        for i, paper in enumerate(state.papers):
+            logger.info("Evaluating paper {}/{}: {}...", i + 1, total, paper.title[:50])
+            
+            # メタデータを取得（既にレビューデータがある場合はそれを使用）
+            if paper.reviews and paper.rating_avg is not None:
+                # all_papers.jsonから読み込んだデータを使用（API呼び出し不要）
+                logger.debug("Using cached review data for {}", paper.id)
+                metadata = {
+                    "reviews": paper.reviews,
+                    "rating_avg": paper.rating_avg,
+                    "confidence_avg": paper.confidence_avg,
+                    "decision": paper.decision,
+                }
+                evaluated_papers[i] = self._evaluate_paper(paper, metadata, keyword_groups)
+            else:
+                fetch_indices.append(i)
+        
+        if fetch_indices:
+            # APIから並行に取得（同じ論文IDは1回だけ取得）
+            fetch_ids = list(dict.fromkeys(state.papers[i].id for i in fetch_indices))
+            semaphore = asyncio.Semaphore(METADATA_FETCH_CONCURRENCY)
+            fetched = await asyncio.gather(
+                *[self._fetch_metadata(paper_id, semaphore) for paper_id in fetch_ids],
+                return_exceptions=True,
+            )
+            metadata_by_id = dict(zip(fetch_ids, fetched))
+            for i in fetch_indices:
+                evaluated_papers[i] = self._evaluate_paper(
+                    state.papers[i], metadata_by_id[state.papers[i].id], keyword_groups
                 )
-                evaluated_papers.append(evaluated_paper)
         
         logger.info(f"Successfully evaluated {len(evaluated_papers)} papers")
         
@@ -135,11 +136,90 @@ class EvaluatePapersNode:
             "synonyms": synonyms,
         }
     
+    async def _fetch_metadata(self, paper_id: str, semaphore: asyncio.Semaphore) -> dict[str, Any]:
+        """論文のメタデータをAPIから取得.
+        
+        Args:
+        ----
+            paper_id: 論文ID
+            semaphore: APIへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            メタデータの辞書（取得失敗時は "error" キーを含む）
+        """
+        async with semaphore:
+            logger.debug("Fetching review data from API for {}", paper_id)
+            result = await self.tool.ainvoke({"paper_id": paper_id})
+        return orjson.loads(result)
+    
+    def _evaluate_paper(
+        self,
+        paper: Paper,
+        metadata: dict[str, Any] | BaseException,
+        keyword_groups: tuple[frozenset[str], ...],
+    ) -> EvaluatedPaper:
+        """メタデータから1件の論文を評価（失敗時もスコア0の論文を返す）.
+        
+        Args:
+        ----
+            paper: 論文オブジェクト
+            metadata: 論文のメタデータ（取得時に発生した例外の場合あり）
+            keyword_groups: 研究興味ごとのキーワードグループ
+            
+        Returns:
+        -------
+            評価済み論文
+        """
+        try:
+            if isinstance(metadata, BaseException):
+                raise metadata
+            
+            # エラーチェック
+            if isinstance(metadata, dict) and "error" in metadata:
+                logger.warning("Failed to fetch metadata for {}: {}", paper.id, metadata["error"])
+                # メタデータなしで評価
+                return EvaluatedPaper.from_paper(
+                    paper,
+                    relevance_score=None,
+                    novelty_score=None,
+                    impact_score=None,
+                    overall_score=0.0,
+                    evaluation_rationale="メタデータ取得失敗",
+                )
+            
+            # スコアを計算（paperオブジェクトも渡す）
+            scores = self._calculate_scores(paper, metadata, keyword_groups)
+            
+            # 評価理由を生成
+            rationale = self._generate_rationale(metadata, scores)
+            
+            logger.debug("Evaluated: {} - Score: {:.2f}", paper.title[:50], scores["overall"])
+            
+            # EvaluatedPaperオブジェクトを作成
+            return EvaluatedPaper.from_paper(
+                paper,
+                relevance_score=scores["relevance"],
+                novelty_score=scores["novelty"],
+                impact_score=scores["impact"],
+                overall_score=scores["overall"],
+                evaluation_rationale=rationale,
+            )
+            
+        except Exception as e:
+            logger.error(f"Error evaluating paper {paper.id}: {e}")
+            # エラーが発生した場合もスキップせず、スコア0で追加
+            return EvaluatedPaper.from_paper(
+                paper,
+                overall_score=0.0,
+                evaluation_rationale=f"評価エラー: {e!s}",
+            )
+    
     def _calculate_scores(
         self,
         paper: Paper,
         metadata: dict[str, Any],
-        criteria: EvaluationCriteria,
+        keyword_groups: tuple[frozenset[str], ...],
     ) -> dict[str, float]:
         """レビューデータから各種スコアを計算.
         
@@ -147,7 +227,7 @@ class EvaluatePapersNode:
         ----
             paper: 論文オブジェクト
             metadata: 論文のメタデータ
-            criteria: 評価基準
+            keyword_groups: 研究興味ごとのキーワードグループ
             
         Returns:
         -------
@@ -157,7 +237,7 @@ class EvaluatePapersNode:
         
         if rating_avg is None:
             # レビューデータがない場合：キーワードベースの関連性のみ
-            relevance = self._calculate_relevance_score(paper, criteria)
+            relevance = self._calculate_relevance_score(paper, keyword_groups)
             return {
                 "relevance": relevance,
                 "novelty": 0.5,     # 中立
@@ -169,13 +249,18 @@ class EvaluatePapersNode:
         normalized_rating = rating_avg / NEURIPS_RATING_SCALE
         
         # 1. 関連性スコア：ユーザーの研究興味とのマッチング（キーワードベースのみ）
-        relevance_score = self._calculate_relevance_score(paper, criteria)
+        relevance_score = self._calculate_relevance_score(paper, keyword_groups)
         
         # 2. 新規性スコア：レビュー内容から推定（改善版）
-        novelty_score = self._estimate_novelty_from_reviews(metadata, normalized_rating)
+        reviews = metadata.get("reviews") or []
+        novelty_score = self._estimate_novelty_from_reviews(reviews, normalized_rating)
         
         # 3. インパクトスコア：採択判定とレビュースコアから計算
-        impact_score = self._calculate_impact_score(metadata, normalized_rating)
+        impact_score = self._calculate_impact_score(
+            metadata.get("decision") or "",
+            metadata.get("confidence_avg"),
+            normalized_rating,
+        )
         
         # 4. 総合スコア：設定された重みで統合（重複なし）
         overall_score = (
@@ -191,11 +276,13 @@ class EvaluatePapersNode:
             "overall": min(max(overall_score, MIN_SCORE), MAX_SCORE),
         }
     
-    def _generate_synonyms(self, research_interests: list[str]) -> dict[str, list[str]]:
-        """各キーワードごとにLLMを使って同義語を生成.
+    async def _generate_synonyms(self, research_interests: list[str]) -> dict[str, list[str]]:
+        """全キーワードの同義語をLLMの1回の呼び出しでまとめて生成.
         
-        各キーワードを個別に処理することで、キーワードと同義語辞書のキーが
-        確実に一致するようにします。
+        応答に含まれなかったキーワードのみ個別に生成し直すことで、キーワードと
+        同義語辞書のキーが確実に一致するようにします。
+        全キーワードの同義語が得られた結果はディスクにも保存し、同じ研究興味での
+        再実行ではLLMを呼び出しません。
         
         Args:
         ----
@@ -211,22 +298,94 @@ class EvaluatePapersNode:
             logger.debug("Using cached synonyms")
             return self._synonyms_cache[cache_key]
         
+        cached_result = self._synonyms_disk_cache.get(prefix="synonyms", interests=sorted(research_interests))
+        if cached_result:
+            try:
+                self._synonyms_cache[cache_key] = _SYNONYMS_ADAPTER.validate_json(cached_result)
+                logger.info("Using synonyms cached on disk")
+                return self._synonyms_cache[cache_key]
+            except ValidationError as e:
+                # 形式が不正なキャッシュは使わずに再生成する
+                logger.warning(f"Ignoring invalid synonyms cache: {e}")
+        
         logger.info(f"Generating synonyms for {len(research_interests)} research interests using LLM...")
         
         try:
-            llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.0,
-                max_tokens=SYNONYMS_LLM_MAX_TOKENS,
-            )
+            synonyms = await self._generate_synonyms_batch(research_interests)
             
-            # 各キーワードごとに個別に同義語を生成
-            synonyms = {}
+            # 応答から欠落したキーワードのみ個別に生成
+            missing = [kw for kw in research_interests if kw.lower().strip() not in synonyms]
+            if missing:
+                logger.warning(f"{len(missing)} topics missing from batched synonyms, generating individually")
+                synonyms.update(await self._generate_individual_synonyms(missing))
             
-            for keyword in research_interests:
-                keyword_lower = keyword.lower().strip()
-                
-                prompt = f"""Generate {SYNONYMS_COUNT_MIN}-{SYNONYMS_COUNT_MAX} synonyms and related terms for this research topic:
+            # キャッシュに保存
+            self._synonyms_cache[cache_key] = synonyms
+            
+            # サマリーログ
+            successful = sum(1 for syns in synonyms.values() if syns)
+            logger.success(f"Generated synonyms for {successful}/{len(synonyms)} topics")
+            
+            # 失敗したキーワードがない場合のみディスクに保存（失敗は次回再生成する）
+            if successful == len(synonyms):
+                self._synonyms_disk_cache.set(
+                    orjson.dumps(synonyms).decode(),
+                    prefix="synonyms",
+                    interests=sorted(research_interests),
+                )
+            
+            return synonyms
+            
+        except Exception as e:
+            logger.warning(f"Failed to generate synonyms: {e}. Using original keywords only.")
+            # エラー時は空の辞書を返す（元のキーワードのみ使用）
+            return {}
+    
+    async def _generate_synonyms_batch(self, research_interests: list[str]) -> dict[str, list[str]]:
+        """全キーワードの同義語を1つのプロンプトで生成（失敗・不正な項目は結果に含めない）."""
+        topics = "\n".join(f'- "{keyword}"' for keyword in research_interests)
+        prompt = f"""Generate {SYNONYMS_COUNT_MIN}-{SYNONYMS_COUNT_MAX} synonyms and related terms for each of these research topics:
+
+Topics:
+{topics}
+
+Return ONLY a JSON object mapping each topic (exactly as written above) to a JSON array of its synonyms (all lowercase):
+{{"topic1": ["synonym1", "synonym2", ...], "topic2": [...]}}
+
+Include:
+- Common abbreviations (e.g., "llm" for "large language model")
+- Related terms
+- Alternative phrasings
+- Keep terms concise and technical
+"""
+        
+        try:
+            # 全キーワード分の出力が1回の応答に入るため、出力トークン上限を拡張
+            llm = self.synonyms_llm.bind(max_tokens=SYNONYMS_LLM_MAX_TOKENS * max(1, len(research_interests)))
+            response = await llm.ainvoke(prompt)
+            syn_dict = orjson.loads(strip_json_code_fence(response.text))
+        except Exception as e:
+            logger.warning(f"Failed to generate batched synonyms: {e}")
+            return {}
+        
+        if not isinstance(syn_dict, dict):
+            logger.warning(f"Invalid batched synonym format: expected dict, got {type(syn_dict)}")
+            return {}
+        
+        requested = {keyword.lower().strip() for keyword in research_interests}
+        synonyms: dict[str, list[str]] = {}
+        for topic, syn_list in syn_dict.items():
+            keyword_lower = str(topic).lower().strip()
+            # 依頼したキーワードのリストのみ処理（小文字化）
+            if keyword_lower in requested and isinstance(syn_list, list):
+                synonyms[keyword_lower] = [str(s).lower().strip() for s in syn_list if s]
+                logger.debug(f"  ✓ '{keyword_lower}': {synonyms[keyword_lower][:3]}...")
+        return synonyms
+    
+    async def _generate_individual_synonyms(self, keywords: list[str]) -> dict[str, list[str]]:
+        """キーワードごとの同義語を個別のプロンプトで並行に生成（失敗したキーワードは空リスト）."""
+        prompts: list[LanguageModelInput] = [
+            f"""Generate {SYNONYMS_COUNT_MIN}-{SYNONYMS_COUNT_MAX} synonyms and related terms for this research topic:
 
 Topic: "{keyword}"
 
@@ -239,51 +398,68 @@ Include:
 - Alternative phrasings
 - Keep terms concise and technical
 """
+            for keyword in keywords
+        ]
+        
+        # 全キーワードをまとめて送信（同時実行数はSYNONYMS_LLM_CONCURRENCYで制限）
+        responses = await self.synonyms_llm.abatch(
+            prompts,
+            config={"max_concurrency": SYNONYMS_LLM_CONCURRENCY},
+            return_exceptions=True,
+        )
+        
+        synonyms: dict[str, list[str]] = {}
+        for keyword, response in zip(keywords, responses):
+            keyword_lower = keyword.lower().strip()
+            # エラー時は空リストを設定（そのキーワードだけスキップ）
+            synonyms[keyword_lower] = []
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                syn_list = orjson.loads(strip_json_code_fence(response.text))
                 
-                try:
-                    response = llm.invoke(prompt)
-                    response_text = response.content.strip()
-                    
-                    # JSONパース（コードブロックを除去）
-                    if "```json" in response_text:
-                        response_text = response_text.split("```json")[1].split("```")[0].strip()
-                    elif "```" in response_text:
-                        response_text = response_text.split("```")[1].split("```")[0].strip()
-                    
-                    syn_list = json.loads(response_text)
-                    
-                    # リストの場合のみ処理
-                    if isinstance(syn_list, list):
-                        # 小文字化して重複削除
-                        synonyms[keyword_lower] = [s.lower().strip() for s in syn_list if s]
-                        logger.debug(f"  ✓ '{keyword_lower}': {synonyms[keyword_lower][:3]}...")
-                    else:
-                        logger.warning(f"Invalid synonym format for '{keyword}': expected list, got {type(syn_list)}")
-                        synonyms[keyword_lower] = []
-                
-                except Exception as e:
-                    logger.warning(f"Failed to generate synonyms for '{keyword}': {e}")
-                    # エラー時は空リストを設定（そのキーワードだけスキップ）
-                    synonyms[keyword_lower] = []
-            
-            # キャッシュに保存
-            self._synonyms_cache[cache_key] = synonyms
-            
-            # サマリーログ
-            successful = sum(1 for syns in synonyms.values() if syns)
-            logger.success(f"Generated synonyms for {successful}/{len(synonyms)} topics")
+                # リストの場合のみ処理
+                if isinstance(syn_list, list):
+                    # 小文字化
+                    synonyms[keyword_lower] = [s.lower().strip() for s in syn_list if s]
+                    logger.debug(f"  ✓ '{keyword_lower}': {synonyms[keyword_lower][:3]}...")
+                else:
+                    logger.warning(f"Invalid synonym format for '{keyword}': expected list, got {type(syn_list)}")
             
-            return synonyms
+            except Exception as e:
+                logger.warning(f"Failed to generate synonyms for '{keyword}': {e}")
+        
+        return synonyms
+    
+    def _build_keyword_groups(
+        self,
+        research_interests: list[str],
+        synonyms: dict[str, list[str]],
+    ) -> tuple[frozenset[str], ...]:
+        """研究興味ごとのキーワードグループ（元のキーワード + 同義語、小文字化済み）を作成.
+        
+        Args:
+        ----
+            research_interests: ユーザーの研究興味キーワードリスト
+            synonyms: キーワードごとの同義語辞書
             
-        except Exception as e:
-            logger.warning(f"Failed to generate synonyms: {e}. Using original keywords only.")
-            # エラー時は空の辞書を返す（元のキーワードのみ使用）
-            return {}
+        Returns:
+        -------
+            research_interests と同じ順序のキーワードグループのタプル
+        """
+        keyword_groups = []
+        for interest in research_interests:
+            interest_lower = interest.lower().strip()
+            group_keywords = {interest_lower}
+            if interest_lower in synonyms:
+                group_keywords.update(syn.lower().strip() for syn in synonyms[interest_lower])
+            keyword_groups.append(frozenset(group_keywords))
+        return tuple(keyword_groups)
     
     def _calculate_relevance_score(
         self,
         paper: Paper,
-        criteria: EvaluationCriteria,
+        keyword_groups: tuple[frozenset[str], ...],
     ) -> float:
         """ユーザーの研究興味との関連性を計算（グループベース）.
         
@@ -294,23 +470,18 @@ Include:
         Args:
         ----
             paper: 論文オブジェクト
-            criteria: 評価基準
+            keyword_groups: 研究興味ごとのキーワードグループ（`__call__`で1回だけ作成）
             
         Returns:
         -------
             関連性スコア（0.0-1.0）
         """
-        research_interests = criteria.research_interests
-        
-        if not research_interests:
+        if not keyword_groups:
             # 研究興味が指定されていない場合は中立
             return 0.5
         
-        # 同義語を生成（初回のみLLM呼び出し、その後はキャッシュ）
-        synonyms = self._generate_synonyms(research_interests)
-        
         # 論文データを準備
-        paper_keywords = set([kw.lower().strip() for kw in paper.keywords])
+        paper_keywords = {kw.lower().strip() for kw in paper.keywords}
         paper_text = (paper.title + " " + paper.abstract).lower()
         
         # 各キーワードグループごとにマッチを判定
@@ -318,30 +489,18 @@ Include:
         matched_in_paper_keywords = 0
         matched_in_text_only = 0
         
-        for interest in research_interests:
-            interest_lower = interest.lower().strip()
-            
-            # グループのキーワード（元のキーワード + 同義語）
-            group_keywords = {interest_lower}
-            if interest_lower in synonyms:
-                group_keywords.update([syn.lower().strip() for syn in synonyms[interest_lower]])
-            
+        for group_keywords in keyword_groups:
             # このグループが論文keywordにマッチするか
-            has_keyword_match = bool(group_keywords & paper_keywords)
-            
-            # このグループがタイトル/アブストラクトにマッチするか
-            has_text_match = any(kw in paper_text for kw in group_keywords)
-            
-            if has_keyword_match or has_text_match:
+            if group_keywords & paper_keywords:
                 matched_groups += 1
-                
-                if has_keyword_match:
-                    matched_in_paper_keywords += 1
-                elif has_text_match:
-                    matched_in_text_only += 1
+                matched_in_paper_keywords += 1
+            # keywordで一致しなかったグループのみタイトル/アブストラクトを走査する
+            elif any(kw in paper_text for kw in group_keywords):
+                matched_groups += 1
+                matched_in_text_only += 1
         
         # スコア計算（合計が最大1.0になるように重みを設計）
-        num_groups = len(research_interests)
+        num_groups = len(keyword_groups)
         
         # 論文keywordマッチを優先
         keyword_weight_per_group = RELEVANCE_KEYWORD_WEIGHT / num_groups if num_groups > 0 else 0
@@ -359,10 +518,11 @@ Include:
         total_score = keyword_match_score + text_match_score + coverage_score
         
         logger.debug(
-            f"Relevance: {total_score:.3f} "
-            f"(keyword:{matched_in_paper_keywords}/{num_groups}={keyword_match_score:.3f}, "
-            f"text:{matched_in_text_only}/{num_groups}={text_match_score:.3f}, "
-            f"coverage:{matched_groups}/{num_groups}={coverage_score:.3f})"
+            "Relevance: {:.3f} (keyword:{}/{}={:.3f}, text:{}/{}={:.3f}, coverage:{}/{}={:.3f})",
+            total_score,
+            matched_in_paper_keywords, num_groups, keyword_match_score,
+            matched_in_text_only, num_groups, text_match_score,
+            matched_groups, num_groups, coverage_score,
         )
         
         # 理論上の最大値は設定された重みの合計
@@ -371,14 +531,16 @@ Include:
     
     def _calculate_impact_score(
         self,
-        metadata: dict[str, Any],
+        decision: str,
+        confidence_avg: float | None,
         normalized_rating: float,
     ) -> float:
         """研究のインパクトを計算.
         
         Args:
         ----
-            metadata: 論文のメタデータ
+            decision: 採択判定（不明な場合は空文字列）
+            confidence_avg: レビュアーの平均信頼度
             normalized_rating: 正規化されたレビュースコア
             
         Returns:
@@ -386,7 +548,7 @@ Include:
             インパクトスコア（0.0-1.0）
         """
         # 採択判定の影響
-        decision = metadata.get("decision", "").lower()
+        decision = decision.lower()
         decision_score = 0.5  # デフォルト
         
         if "oral" in decision or "spotlight" in decision:
@@ -397,7 +559,6 @@ Include:
             decision_score = 0.2
         
         # レビュアーの信頼度
-        confidence_avg = metadata.get("confidence_avg")
         confidence_score = (confidence_avg / 5.0) if confidence_avg else 0.5
         
         # インパクトスコア = 採択判定50% + レビュースコア30% + 信頼度20%
@@ -411,36 +572,23 @@ Include:
     
     def _estimate_novelty_from_reviews(
         self,
-        metadata: dict[str, Any],
+        reviews: list[dict[str, Any]],
         normalized_rating: float,
     ) -> float:
         """レビュー内容から新規性を推定（改善版）.
         
         Args:
         ----
-            metadata: 論文のメタデータ
+            reviews: レビュー情報のリスト
             normalized_rating: 正規化されたレビュースコア
             
         Returns:
         -------
             新規性スコア（0.0-1.0）
         """
-        reviews = metadata.get("reviews", [])
         if not reviews:
             return normalized_rating  # レビューがない場合は総合評価を使用
         
-        # 新規性に関するキーワード（ポジティブ）
-        positive_keywords = [
-            "novel", "new approach", "innovative", "original", "first",
-            "groundbreaking", "pioneering", "unique", "creative", "fresh"
-        ]
-        
-        # 新規性が低いことを示すキーワード（ネガティブ）
-        negative_keywords = [
-            "not novel", "incremental", "limited novelty", "similar to",
-            "existing work", "well-known", "standard approach"
-        ]
-        
         positive_score = 0
         negative_score = 0
         
@@ -449,26 +597,21 @@ Include:
             weaknesses = review.get("weaknesses", "").lower()
             summary = review.get("summary", "").lower()
             
-            # レビューテキストを結合
-            review_text = strengths + " " + weaknesses + " " + summary
-            
-            # ポジティブな言及をカウント
-            for keyword in positive_keywords:
-                if keyword in review_text:
-                    # strengths内での言及は重み2倍
-                    if keyword in strengths:
-                        positive_score += 2
-                    else:
-                        positive_score += 1
+            # ポジティブな言及をカウント（フィールドを結合せず個別に走査）
+            for keyword in _NOVELTY_POSITIVE_KEYWORDS:
+                # strengths内での言及は重み2倍
+                if keyword in strengths:
+                    positive_score += 2
+                elif keyword in weaknesses or keyword in summary:
+                    positive_score += 1
         
             # ネガティブな言及をカウント
-            for keyword in negative_keywords:
-                if keyword in review_text:
-                    # weaknesses内での言及は重み2倍
-                    if keyword in weaknesses:
-                        negative_score += 2
-                    else:
-                        negative_score += 1
+            for keyword in _NOVELTY_NEGATIVE_KEYWORDS:
+                # weaknesses内での言及は重み2倍
+                if keyword in weaknesses:
+                    negative_score += 2
+                elif keyword in strengths or keyword in summary:
+                    negative_score += 1
         
         # スコア計算
         if positive_score > 0 or negative_score > 0:
@@ -500,43 +643,40 @@ Include:
         """
         rating_avg = metadata.get("rating_avg")
         confidence_avg = metadata.get("confidence_avg")
-        decision = metadata.get("decision", "N/A")
-        num_reviews = len(metadata.get("reviews", []))
-        
-        parts = []
+        decision = metadata.get("decision") or "N/A"
+        num_reviews = len(metadata.get("reviews") or [])
         
         # 基本情報（レビュー数と評価）
         if num_reviews > 0:
-            parts.append(f"この論文は{num_reviews}件のレビューを受け、")
-            if rating_avg is not None:
-                parts.append(f"平均{rating_avg:.2f}/10の評価を獲得しました。")
-            else:
-                parts.append("評価スコアは未公開です。")
+            rating_text = (
+                f"平均{rating_avg:.2f}/10の評価を獲得しました。" if rating_avg is not None else "評価スコアは未公開です。"
+            )
+            rationale = f"この論文は{num_reviews}件のレビューを受け、 {rating_text}"
         else:
-            parts.append("この論文はまだレビューを受けていません。")
+            rationale = "この論文はまだレビューを受けていません。"
         
         # 採択状況
         decision_lower = decision.lower()
         if "oral" in decision_lower or "spotlight" in decision_lower:
-            parts.append(f"採択判定は「{decision}」で、特に高く評価されています。")
+            rationale += f" 採択判定は「{decision}」で、特に高く評価されています。"
         elif "accept" in decision_lower:
-            parts.append(f"採択判定は「{decision}」です。")
+            rationale += f" 採択判定は「{decision}」です。"
         elif "reject" in decision_lower:
-            parts.append(f"不採択（{decision}）となりました。")
+            rationale += f" 不採択（{decision}）となりました。"
         elif decision != "N/A":
-            parts.append(f"判定状況：{decision}")
+            rationale += f" 判定状況：{decision}"
         
         # スコア詳細
-        parts.append(f"\n\n【評価スコアの詳細】")
-        parts.append(f"総合スコア：{scores['overall']:.3f}")
-        parts.append(f"（内訳：関連性 {scores['relevance']:.3f}、")
-        parts.append(f"新規性 {scores['novelty']:.3f}、")
-        parts.append(f"インパクト {scores['impact']:.3f}）")
+        rationale += (
+            f" \n\n【評価スコアの詳細】 総合スコア：{scores['overall']:.3f}"
+            f" （内訳：関連性 {scores['relevance']:.3f}、 新規性 {scores['novelty']:.3f}、"
+            f" インパクト {scores['impact']:.3f}）"
+        )
         
         # レビュアーの信頼度
         if confidence_avg is not None:
             confidence_desc = "非常に高い" if confidence_avg >= 4.0 else "高い" if confidence_avg >= 3.0 else "中程度"
-            parts.append(f"\nレビュアーの信頼度は{confidence_avg:.2f}/5（{confidence_desc}）です。")
+            rationale += f" \nレビュアーの信頼度は{confidence_avg:.2f}/5（{confidence_desc}）です。"
         
-        return " ".join(parts)
+        return rationale
 
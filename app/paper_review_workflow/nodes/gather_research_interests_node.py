@@ -4,9 +4,12 @@ import json
 import re
 from typing import Any
 
-from langchain_openai import ChatOpenAI
 from loguru import logger
 
+from app.paper_review_workflow.llm_factory import (
+    create_chat_openai,
+    strip_json_code_fence,
+)
 from app.paper_review_workflow.models.state import PaperReviewAgentState
 
 
@@ -20,7 +23,7 @@ class GatherResearchInterestsNode:
         ----
             min_keywords: 最小キーワード数（デフォルト: 3）
         """
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.0, max_tokens=500)
+        self.llm = create_chat_openai(model="gpt-4o-mini", temperature=0.0, max_tokens=500)
         self.min_keywords = min_keywords
     
     def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
@@ -232,12 +235,7 @@ Use lowercase and be specific.
         """
         try:
             # JSONブロックを抽出
-            if "```json" in response_text:
-                json_str = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_str = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response_text.strip()
+            json_str = strip_json_code_fence(response_text)
             
             # JSONをパース
             result = json.loads(json_str)
@@ -7,6 +7,16 @@ from loguru import logger
 
 from app.paper_review_workflow.models.state import PaperReviewAgentState
 
+# 論文ごとのスコア表ヘッダー（論文に依存しないため使い回す）
+_SCORE_TABLE_HEADER = ("#### スコア", "", "| 項目 | スコア |", "|------|--------|")
+
+# 採択判定に含まれるキーワードと発表形式の表示行（先に一致したものを採用）
+_PRESENTATION_FORMATS = (
+    ("oral", "  - 🎤 **発表形式**: Oral Presentation（口頭発表）"),
+    ("spotlight", "  - ✨ **発表形式**: Spotlight Presentation"),
+    ("poster", "  - 📊 **発表形式**: Poster Presentation"),
+)
+
 
 class GeneratePaperReportNode:
     """論文レビューレポートを生成するノード."""
@@ -117,70 +127,62 @@ class GeneratePaperReportNode:
         papers_to_display = state.top_papers if state.top_papers else state.ranked_papers[:10]
         
         for i, paper_data in enumerate(papers_to_display[:20], 1):  # 上位20件
-            # paper_dataが辞書の場合とEvaluatedPaperオブジェクトの場合を処理
-            if isinstance(paper_data, dict):
-                paper = paper_data
-                rank = paper.get('rank', i)
-            else:
-                paper = paper_data
-                rank = getattr(paper, 'rank', i)
+            # paper_dataが辞書の場合とEvaluatedPaperオブジェクトの場合を最初に1回だけ揃える
+            # （オブジェクトはフィールド値の辞書をコピーせずにそのまま参照）
+            paper = paper_data if isinstance(paper_data, dict) else vars(paper_data)
+            rank = paper.get('rank', i)
             
-            # タイトルを取得（辞書とオブジェクト両対応）
-            title = paper.get('title') if isinstance(paper, dict) else paper.title
+            # タイトルを取得
+            title = paper.get('title')
             lines.append(f"### {rank}. {title}")
             lines.append("")
             
             # スコア表示（統合LLM評価版）
-            lines.append("#### スコア")
-            lines.append("")
-            lines.append(f"| 項目 | スコア |")
-            lines.append(f"|------|--------|")
+            lines.extend(_SCORE_TABLE_HEADER)
             
             # 総合スコア（4つの重み付き平均）
-            overall_score = paper.get('overall_score') if isinstance(paper, dict) else getattr(paper, 'overall_score', None)
+            overall_score = paper.get('overall_score')
             if overall_score is not None:
                 lines.append(f"| **総合スコア** | **{overall_score:.3f}** |")
             
             # AI評価詳細スコア
-            relevance_score = paper.get('relevance_score') if isinstance(paper, dict) else getattr(paper, 'relevance_score', None)
+            relevance_score = paper.get('relevance_score')
             if relevance_score is not None:
                 lines.append(f"| 　├ 関連性 | {relevance_score:.3f} |")
             
-            novelty_score = paper.get('novelty_score') if isinstance(paper, dict) else getattr(paper, 'novelty_score', None)
+            novelty_score = paper.get('novelty_score')
             if novelty_score is not None:
                 lines.append(f"| 　├ 新規性 | {novelty_score:.3f} |")
             
-            impact_score = paper.get('impact_score') if isinstance(paper, dict) else getattr(paper, 'impact_score', None)
+            impact_score = paper.get('impact_score')
             if impact_score is not None:
                 lines.append(f"| 　├ インパクト | {impact_score:.3f} |")
             
-            practicality_score = paper.get('practicality_score') if isinstance(paper, dict) else getattr(paper, 'practicality_score', None)
+            practicality_score = paper.get('practicality_score')
             if practicality_score is not None:
                 lines.append(f"| 　└ 実用性 | {practicality_score:.3f} |")
             
             # OpenReview平均評価
-            rating_avg = paper.get('rating_avg') if isinstance(paper, dict) else getattr(paper, 'rating_avg', None)
+            rating_avg = paper.get('rating_avg')
             if rating_avg is not None:
                 lines.append(f"| OpenReview評価 | {rating_avg:.2f}/10 |")
             lines.append("")
             
             # 採択判定と発表形式
-            decision = paper.get('decision') if isinstance(paper, dict) else getattr(paper, 'decision', None)
+            decision = paper.get('decision')
             if decision and decision != "N/A":
                 lines.append(f"**採択判定**: {decision}")
                 
                 # 発表形式を抽出（NeurIPSなどの場合）
                 decision_lower = decision.lower()
-                if "oral" in decision_lower:
-                    lines.append("  - 🎤 **発表形式**: Oral Presentation（口頭発表）")
-                elif "spotlight" in decision_lower:
-                    lines.append("  - ✨ **発表形式**: Spotlight Presentation")
-                elif "poster" in decision_lower:
-                    lines.append("  - 📊 **発表形式**: Poster Presentation")
+                for format_keyword, format_line in _PRESENTATION_FORMATS:
+                    if format_keyword in decision_lower:
+                        lines.append(format_line)
+                        break
                 lines.append("")
             
             # 著者
-            authors = paper.get('authors') if isinstance(paper, dict) else paper.authors
+            authors = paper.get('authors')
             if authors:
                 authors_display = ", ".join(authors[:5])
                 if len(authors) > 5:
@@ -189,13 +191,13 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # キーワード
-            keywords = paper.get('keywords') if isinstance(paper, dict) else paper.keywords
+            keywords = paper.get('keywords')
             if keywords:
                 lines.append(f"**キーワード**: {', '.join(keywords[:8])}")
                 lines.append("")
             
             # アブストラクト（全文表示、セクションとして独立）
-            abstract = paper.get('abstract') if isinstance(paper, dict) else getattr(paper, 'abstract', '')
+            abstract = paper.get('abstract')
             if abstract and abstract.strip():
                 lines.append("#### 概要")
                 lines.append("")
@@ -203,7 +205,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # AI評価（統合LLM評価）
-            ai_rationale = paper.get('ai_rationale') if isinstance(paper, dict) else getattr(paper, 'ai_rationale', None)
+            ai_rationale = paper.get('ai_rationale')
             if ai_rationale and ai_rationale.strip():
                 lines.append("#### 🤖 AI評価")
                 lines.append("")
@@ -211,7 +213,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # レビュー要約
-            review_summary = paper.get('review_summary') if isinstance(paper, dict) else getattr(paper, 'review_summary', None)
+            review_summary = paper.get('review_summary')
             if review_summary and review_summary.strip():
                 lines.append("#### 📊 レビュー要約")
                 lines.append("")
@@ -219,7 +221,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # フィールド活用の説明
-            field_insights = paper.get('field_insights') if isinstance(paper, dict) else getattr(paper, 'field_insights', None)
+            field_insights = paper.get('field_insights')
             if field_insights and field_insights.strip():
                 lines.append("#### 🔍 評価データソース")
                 lines.append("")
@@ -227,7 +229,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # Meta Review（エリアチェアのまとめ）
-            meta_review = paper.get('meta_review') if isinstance(paper, dict) else getattr(paper, 'meta_review', None)
+            meta_review = paper.get('meta_review')
             if meta_review and meta_review.strip():
                 lines.append("#### 📋 Meta Review（エリアチェアのまとめ）")
                 lines.append("")
@@ -239,7 +241,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # Decision の詳細コメント
-            decision_comment = paper.get('decision_comment') if isinstance(paper, dict) else getattr(paper, 'decision_comment', None)
+            decision_comment = paper.get('decision_comment')
             if decision_comment and decision_comment.strip():
                 lines.append("#### 📝 採択理由")
                 lines.append("")
@@ -290,7 +292,7 @@ class GeneratePaperReportNode:
             #         lines.append("")
             
             # レビュースコアの平均値を表示
-            reviews = paper.get('reviews') if isinstance(paper, dict) else getattr(paper, 'reviews', [])
+            reviews = paper.get('reviews')
             if reviews and len(reviews) > 0:
                 lines.append("#### 📊 レビュースコアの平均")
                 lines.append("")
@@ -350,7 +352,7 @@ class GeneratePaperReportNode:
                     lines.append("")
             
             # Author Final Remarks
-            author_remarks = paper.get('author_remarks') if isinstance(paper, dict) else getattr(paper, 'author_remarks', None)
+            author_remarks = paper.get('author_remarks')
             if author_remarks and author_remarks.strip():
                 lines.append("#### 💬 著者からのコメント")
                 lines.append("")
@@ -362,7 +364,7 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # LLM評価理由
-            llm_rationale = paper.get('llm_rationale') if isinstance(paper, dict) else getattr(paper, 'llm_rationale', None)
+            llm_rationale = paper.get('llm_rationale')
             if llm_rationale:
                 lines.append("#### AI評価（内容分析）")
                 lines.append("")
@@ -370,8 +372,8 @@ class GeneratePaperReportNode:
                 lines.append("")
             
             # リンク
-            forum_url = paper.get('forum_url') if isinstance(paper, dict) else paper.forum_url
-            pdf_url = paper.get('pdf_url') if isinstance(paper, dict) else paper.pdf_url
+            forum_url = paper.get('forum_url')
+            pdf_url = paper.get('pdf_url')
             lines.append(f"**🔗 リンク**:")
             lines.append(f"- [OpenReview]({forum_url})")
             lines.append(f"- [PDF]({pdf_url})")
@@ -1,15 +1,18 @@
 """Node for evaluating papers using LLM."""
 
-import json
+import asyncio
 import re
 from typing import Any
 
-from langchain_openai import ChatOpenAI
+import orjson
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from loguru import logger
 
 from app.paper_review_workflow.models.state import (
     PaperReviewAgentState,
     EvaluatedPaper,
+    EvaluationCriteria,
 )
 from app.paper_review_workflow.config import (
     LLMConfig,
@@ -17,14 +20,65 @@ from app.paper_review_workflow.config import (
     ScoringWeights,
     DEFAULT_SCORING_WEIGHTS,
 )
+from app.paper_review_workflow.llm_factory import (
+    build_messages,
+    create_chat_openai,
+    format_id_keyed_items,
+    get_rate_limiter,
+    parse_id_keyed_json_array,
+)
+from app.paper_review_workflow.tools.llm_cache import get_llm_response_cache
+from app.paper_review_workflow.utils import select_low_relevance_indices
 from app.paper_review_workflow.constants import (
     MIN_SCORE,
     MAX_SCORE,
+    ABSTRACT_EVALUATION_LENGTH,
     MAX_AUTHORS_DISPLAY,
     MAX_KEYWORDS_DISPLAY,
     MAX_RATIONALE_LENGTH,
 )
 
+# LLM応答のパースに使う正規表現（論文ごとに呼ばれるためモジュール読み込み時に一度だけコンパイル）
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# プロンプトキャッシュが効くよう、論文に依存しない指示は先頭のシステムメッセージにまとめる
+_RUBRIC_HEADER = """\
+# 前提
+ユーザーの研究興味を踏まえ、最後に提示される論文のタイトルとアブストラクトとキーワードとOpenReview評価を読み判断してください。
+
+# 評価基準 (0.0〜1.0の実数値で評価)
+1. 関連性 (Relevance)
+2. 新規性 (Novelty)
+3. 実用性 (Practicality)
+
+# 出力形式
+"""
+
+EVALUATION_RUBRIC = _RUBRIC_HEADER + """\
+次の形式でJSONのみ出力してください。
+
+{
+  "relevance": float,
+  "novelty": float,
+  "practical": float,
+  "rationale": "2〜3文で各スコアの理由を簡潔に説明"
+}
+"""
+
+BATCH_EVALUATION_RUBRIC = _RUBRIC_HEADER + """\
+論文ごとに1要素のJSON配列のみ出力してください。"id" には論文一覧のIDをそのまま記載してください。
+
+[
+  {
+    "id": "論文ID",
+    "relevance": float,
+    "novelty": float,
+    "practical": float,
+    "rationale": "2〜3文で各スコアの理由を簡潔に説明"
+  }
+]
+"""
+
 
 class LLMEvaluatePapersNode:
     """LLMを使って論文の内容を深く評価するノード."""
@@ -46,24 +100,43 @@ class LLMEvaluatePapersNode:
         self.llm_config = llm_config or DEFAULT_LLM_CONFIG
         self.weights = scoring_weights or DEFAULT_SCORING_WEIGHTS
         self.llm = self._create_llm()
+        # バッチ評価では1回の応答に複数論文分の出力が入るため、出力トークン上限を拡張
+        self.batch_llm = (
+            self._create_llm(self.llm_config.max_tokens * self.llm_config.batch_size)
+            if self.llm_config.batch_size > 1
+            else None
+        )
     
-    def _create_llm(self):
+    def _create_llm(self, max_tokens: int | None = None) -> BaseChatModel:
         """LLMインスタンスを作成."""
         model_name = self.llm_config.model.value
         
         if model_name.startswith("gpt"):
-            return ChatOpenAI(
+            return create_chat_openai(
                 model=model_name,
                 temperature=self.llm_config.temperature,
-                max_tokens=self.llm_config.max_tokens,
+                max_tokens=max_tokens or self.llm_config.max_tokens,
                 timeout=self.llm_config.timeout,
+                reasoning_effort=self.llm_config.reasoning_effort,
+                cache=get_llm_response_cache() if self.llm_config.use_response_cache else None,
+                rate_limiter=(
+                    get_rate_limiter(self.llm_config.requests_per_minute)
+                    if self.llm_config.requests_per_minute
+                    else None
+                ),
             )
         else:
             raise ValueError(f"Unsupported model: {model_name}. Only OpenAI GPT models are supported.")
     
-    def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
+    async def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
         """LLM評価を実行.
         
+        全論文のLLM呼び出しを`asyncio.gather`で並行に発行します
+        （同時リクエスト数は`evaluation_criteria.max_concurrency`で制限）。
+        `llm_config.batch_size` が2以上の場合は、その件数ごとに1回の呼び出しで評価します。
+        `evaluation_criteria.llm_skip_ratio` が正の場合、キーワードによる関連性スコアが
+        下位の論文はLLMに渡さず元のスコアを保持します。
+        
         Args:
         ----
             state: 現在の状態
@@ -74,50 +147,40 @@ class LLMEvaluatePapersNode:
         """
         logger.info(f"LLM evaluating {len(state.ranked_papers)} papers using {self.llm_config.model.value}...")
         
-        llm_evaluated_papers: list[EvaluatedPaper] = []
-        
-        for i, paper in enumerate(state.ranked_papers, 1):
-            try:
-                logger.info(f"LLM evaluating paper {i}/{len(state.ranked_papers)}: {paper.title[:50]}...")
-                
-                # プロンプトを作成
-                prompt = self._create_evaluation_prompt(paper, state.evaluation_criteria)
-                
-                # LLMに評価を依頼
-                response = self.llm.invoke(prompt)
-                response_text = response.content
-                
-                # スコアをパース
-                scores = self._parse_llm_response(response_text)
-                
-                # 論文オブジェクトを更新
-                updated_paper = paper.model_copy(deep=True)
-                updated_paper.llm_relevance_score = scores['relevance']
-                updated_paper.llm_novelty_score = scores['novelty']
-                updated_paper.llm_practical_score = scores['practical']
-                updated_paper.llm_rationale = scores['rationale']
-                
-                # 最終スコアを計算（設定された重みで統合）
-                llm_average = (scores['relevance'] + scores['novelty'] + scores['practical']) / 3
-                updated_paper.final_score = (
-                    paper.overall_score * self.weights.openreview_weight +
-                    llm_average * self.weights.llm_weight
+        skipped = select_low_relevance_indices(state.ranked_papers, state.evaluation_criteria.llm_skip_ratio)
+        if skipped:
+            logger.info(f"Skipping LLM evaluation for {len(skipped)} papers with low keyword relevance")
+        targets = [paper for i, paper in enumerate(state.ranked_papers) if i not in skipped]
+        
+        # 全論文で共通のユーザーの研究興味は1回だけ整形
+        user_interests = self._format_user_interests(state.evaluation_criteria)
+        
+        total = len(targets)
+        batch_size = self.llm_config.batch_size
+        semaphore = asyncio.Semaphore(state.evaluation_criteria.max_concurrency)
+        # gatherは入力順で結果を返すため、ランキング順が保持される
+        if batch_size > 1:
+            batches = await asyncio.gather(*[
+                self._evaluate_batch(
+                    targets[start:start + batch_size],
+                    user_interests,
+                    semaphore,
                 )
-                
-                llm_evaluated_papers.append(updated_paper)
-                
-                logger.debug(f"LLM scores - Relevance: {scores['relevance']:.3f}, "
-                           f"Novelty: {scores['novelty']:.3f}, "
-                           f"Practical: {scores['practical']:.3f}, "
-                           f"Final: {updated_paper.final_score:.3f}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to LLM evaluate paper {paper.id}: {e}")
-                # LLM評価失敗時は元のスコアを保持
-                updated_paper = paper.model_copy(deep=True)
-                updated_paper.final_score = paper.overall_score
-                llm_evaluated_papers.append(updated_paper)
-                continue
+                for start in range(0, total, batch_size)
+            ])
+            evaluated = [paper for batch in batches for paper in batch]
+        else:
+            evaluated = await asyncio.gather(*[
+                self._evaluate_paper(paper, user_interests, i, total, semaphore)
+                for i, paper in enumerate(targets, 1)
+            ])
+        
+        # スキップした論文は元のスコアを保持し、ランキング順に戻す
+        evaluated_iter = iter(evaluated)
+        llm_evaluated_papers: list[EvaluatedPaper] = [
+            self._keep_original_score(paper) if i in skipped else next(evaluated_iter)
+            for i, paper in enumerate(state.ranked_papers)
+        ]
         
         logger.success(f"Successfully LLM evaluated {len(llm_evaluated_papers)} papers")
         
@@ -125,53 +188,157 @@ class LLMEvaluatePapersNode:
             "llm_evaluated_papers": llm_evaluated_papers,
         }
     
-    def _create_evaluation_prompt(self, paper: EvaluatedPaper, criteria) -> str:
-        """評価用プロンプトを作成."""
+    async def _evaluate_paper(
+        self,
+        paper: EvaluatedPaper,
+        user_interests: str,
+        index: int,
+        total: int,
+        semaphore: asyncio.Semaphore,
+    ) -> EvaluatedPaper:
+        """1件の論文をLLMで評価（評価失敗時は元のスコアを保持）.
+        
+        Args:
+        ----
+            paper: 評価対象の論文
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
+            index: 論文の通し番号（ログ用）
+            total: 論文の総数（ログ用）
+            semaphore: LLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            評価結果を反映した論文
+        """
+        try:
+            logger.info("LLM evaluating paper {}/{}: {}...", index, total, paper.title[:50])
+            
+            # プロンプトを作成
+            prompt = self._create_evaluation_prompt(paper, user_interests)
+            
+            # LLMに評価を依頼
+            async with semaphore:
+                response = await self.llm.ainvoke(prompt)
+            
+            # スコアをパース
+            scores = self._parse_llm_response(response.text)
+            
+            return self._apply_scores(paper, scores)
+            
+        except Exception as e:
+            logger.warning("Failed to LLM evaluate paper {}: {}", paper.id, e)
+            # LLM評価失敗時は元のスコアを保持
+            return self._keep_original_score(paper)
+    
+    async def _evaluate_batch(
+        self,
+        papers: list[EvaluatedPaper],
+        user_interests: str,
+        semaphore: asyncio.Semaphore,
+    ) -> list[EvaluatedPaper]:
+        """複数の論文を1回のLLM呼び出しでまとめて評価.
+        
+        Args:
+        ----
+            papers: 評価対象の論文リスト
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
+            semaphore: LLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            入力順に並んだ評価済み論文のリスト（応答に含まれない論文は元のスコアを保持）
+        """
+        logger.info(f"LLM evaluating {len(papers)} papers in one call: {papers[0].title[:50]}...")
+        
+        try:
+            if self.batch_llm is None:
+                raise ValueError("batch evaluation requires llm_config.batch_size >= 2")
+            prompt = self._create_batch_evaluation_prompt(papers, user_interests)
+            async with semaphore:
+                response = await self.batch_llm.ainvoke(prompt)
+            scores_by_id = self._parse_batch_response(response.text)
+        except Exception as e:
+            logger.warning(f"Failed to LLM evaluate batch: {e}")
+            scores_by_id = {}
+        
+        results = []
+        for paper in papers:
+            if paper.id in scores_by_id:
+                results.append(self._apply_scores(paper, scores_by_id[paper.id]))
+            else:
+                logger.warning("No LLM scores returned for paper {}", paper.id)
+                results.append(self._keep_original_score(paper))
+        return results
+    
+    def _apply_scores(self, paper: EvaluatedPaper, scores: dict) -> EvaluatedPaper:
+        """LLMのスコアを論文に反映し、最終スコアを計算."""
+        # 最終スコアを計算（設定された重みで統合）
+        llm_average = (scores['relevance'] + scores['novelty'] + scores['practical']) / 3
+        
+        # 論文オブジェクトを更新（スカラー値のみ上書きするため、レビュー等は浅いコピーで共有）
+        updated_paper = paper.model_copy(update={
+            'llm_relevance_score': scores['relevance'],
+            'llm_novelty_score': scores['novelty'],
+            'llm_practical_score': scores['practical'],
+            'llm_rationale': scores['rationale'],
+            'final_score': (
+                paper.overall_score * self.weights.openreview_weight +
+                llm_average * self.weights.llm_weight
+            ),
+        })
+        
+        logger.debug(
+            "LLM scores - Relevance: {:.3f}, Novelty: {:.3f}, Practical: {:.3f}, Final: {:.3f}",
+            scores["relevance"], scores["novelty"], scores["practical"], updated_paper.final_score,
+        )
+        
+        return updated_paper
+    
+    def _keep_original_score(self, paper: EvaluatedPaper) -> EvaluatedPaper:
+        """LLM評価失敗時に元のスコアを最終スコアとして保持."""
+        return paper.model_copy(update={'final_score': paper.overall_score})
+    
+    def _format_user_interests(self, criteria: EvaluationCriteria) -> str:
+        """ユーザーの研究興味をプロンプト用にフォーマット（同一基準なら常に同じ文字列）."""
         research_interests_str = ", ".join(criteria.research_interests)
         
         # research_description がない場合は research_interests をフォールバック
         user_interests = criteria.research_description or f"キーワード: {research_interests_str}"
-
-        prompt = f"""
-            以下の論文を評価してください。
-
-            # 論文情報
+        return f"# ユーザーの研究興味\n{user_interests}"
+    
+    def _format_paper(self, paper: EvaluatedPaper) -> str:
+        """論文情報をプロンプト用にフォーマット."""
+        return f"""\
 タイトル: {paper.title}
 著者: {', '.join(paper.authors[:MAX_AUTHORS_DISPLAY])}{'...' if len(paper.authors) > MAX_AUTHORS_DISPLAY else ''}
 キーワード: {', '.join(paper.keywords[:MAX_KEYWORDS_DISPLAY])}
 アブストラクト:
-{paper.abstract}
+{paper.abstract[:ABSTRACT_EVALUATION_LENGTH]}{'...' if len(paper.abstract) > ABSTRACT_EVALUATION_LENGTH else ''}
 OpenReview評価 (参考): {paper.rating_avg if paper.rating_avg else 'N/A'}/10
-
-# 前提
-以下の情報をタイトルとアブストラクトとキーワードとOpenReview評価を読み判断してください。
-
-# ユーザーの研究興味
-{user_interests}
-
-# 評価基準 (0.0〜1.0の実数値で評価)
-1. 関連性 (Relevance)
-2. 新規性 (Novelty)
-3. 実用性 (Practicality)
-
-# 出力形式
-次の形式でJSONのみ出力してください。
-
-{{
-  "relevance": float,
-  "novelty": float,
-  "practical": float,
-  "rationale": "2〜3文で各スコアの理由を簡潔に説明"
-}}
 """
-
-        return prompt
+    
+    def _create_batch_evaluation_prompt(self, papers: list[EvaluatedPaper], user_interests: str) -> list[BaseMessage]:
+        """複数論文をまとめて評価するプロンプトを作成（番号付きリスト形式）."""
+        papers_str = format_id_keyed_items((paper.id, self._format_paper(paper)) for paper in papers)
+        return build_messages(
+            BATCH_EVALUATION_RUBRIC,
+            user_interests,
+            variable_content=f"以下の{len(papers)}件の論文をそれぞれ評価してください。\n\n# 論文一覧\n{papers_str}",
+        )
+    
+    def _create_evaluation_prompt(self, paper: EvaluatedPaper, user_interests: str) -> list[BaseMessage]:
+        """評価用プロンプトを作成."""
+        return build_messages(
+            EVALUATION_RUBRIC,
+            user_interests,
+            variable_content=f"以下の論文を評価してください。\n\n# 論文情報\n{self._format_paper(paper)}",
+        )
     
     def _parse_llm_response(self, response: str) -> dict:
         """LLMのレスポンスをパースしてスコアを抽出."""
         try:
             # JSONブロックを抽出
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(response)
             if json_match:
                 json_str = json_match.group(1)
             else:
@@ -179,15 +346,9 @@ OpenReview評価 (参考): {paper.rating_avg if paper.rating_avg else 'N/A'}/10
                 json_str = response.strip()
             
             # JSONをパース
-            scores = json.loads(json_str)
+            scores = orjson.loads(json_str)
             
-            # スコアを0-1の範囲にクリップ
-            return {
-                'relevance': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('relevance', 0.5)))),
-                'novelty': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('novelty', 0.5)))),
-                'practical': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('practical', 0.5)))),
-                'rationale': str(scores.get('rationale', '評価理由なし'))[:MAX_RATIONALE_LENGTH],
-            }
+            return self._normalize_scores(scores)
         except Exception as e:
             logger.warning(f"Failed to parse LLM response: {e}")
             logger.debug(f"Response: {response[:200]}...")
@@ -198,4 +359,19 @@ OpenReview評価 (参考): {paper.rating_avg if paper.rating_avg else 'N/A'}/10
                 'practical': 0.5,
                 'rationale': 'LLM評価のパースに失敗しました',
             }
-
+    
+    def _parse_batch_response(self, response: str) -> dict[str, dict]:
+        """バッチ評価のレスポンス（JSON配列）をパースし、論文IDごとのスコアを返す."""
+        return {
+            paper_id: self._normalize_scores(item)
+            for paper_id, item in parse_id_keyed_json_array(response).items()
+        }
+    
+    def _normalize_scores(self, scores: dict) -> dict:
+        """スコアを0-1の範囲にクリップし、評価理由を切り詰める."""
+        return {
+            'relevance': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('relevance', 0.5)))),
+            'novelty': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('novelty', 0.5)))),
+            'practical': max(MIN_SCORE, min(MAX_SCORE, float(scores.get('practical', 0.5)))),
+            'rationale': str(scores.get('rationale', '評価理由なし'))[:MAX_RATIONALE_LENGTH],
+        }
@@ -1,33 +1,59 @@
 """Node for ranking evaluated papers."""
 
+import asyncio
+import heapq
 import re
 from typing import Any
 
-from langchain_openai import ChatOpenAI
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import Runnable
 from loguru import logger
+from pydantic import ValidationError
 
 from app.paper_review_workflow.models.state import (
     PaperReviewAgentState,
     EvaluatedPaper,
     EvaluationCriteria,
+    RelevanceScore,
 )
 from app.paper_review_workflow.utils import convert_papers_to_dict_list
+from app.paper_review_workflow.config import LLMConfig
+from app.paper_review_workflow.llm_factory import (
+    create_batch_openai,
+    create_chat_openai,
+    create_chat_openai_structured,
+    format_id_keyed_items,
+    get_rate_limiter,
+    parse_id_keyed_json_array,
+)
+from app.paper_review_workflow.tools.llm_cache import get_llm_response_cache
 from app.paper_review_workflow.constants import (
     MAX_DISPLAY_PAPERS,
+    PARTIAL_SORT_RATIO,
     PRELIMINARY_LLM_MAX_TOKENS,
     ABSTRACT_SHORT_LENGTH,
     MAX_KEYWORDS_DISPLAY,
 )
 
+# LLM応答のパースに使う正規表現（論文ごとに呼ばれるためモジュール読み込み時に一度だけコンパイル）
+_FLOAT_RE = re.compile(r'(\d+\.?\d*)')
+
 
 class RankPapersNode:
     """評価済み論文をスコア順にランク付けするノード."""
     
-    def __init__(self) -> None:
-        """RankPapersNodeを初期化."""
-        self.llm = None  # 必要時に初期化（コスト削減）
+    def __init__(self, llm_config: LLMConfig | None = None) -> None:
+        """RankPapersNodeを初期化.
+        
+        Args:
+        ----
+            llm_config: LLM設定（`use_response_cache` と `requests_per_minute` のみ使用、省略時はデフォルト）
+        """
+        from app.paper_review_workflow.config import DEFAULT_LLM_CONFIG
+        
+        self.llm_config = llm_config or DEFAULT_LLM_CONFIG
     
-    def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
+    async def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
         """論文ランキングを実行.
         
         Args:
@@ -53,16 +79,16 @@ class RankPapersNode:
         )
         
         # 総合スコアでソート（降順）
-        ranked_papers = sorted(
-            filtered_papers,
-            key=lambda p: p.overall_score or 0.0,
-            reverse=True,
-        )
+        # top_kが指定されていれば必要な上位のみ抽出（簡易LLMフィルタ有効時は再評価対象分も残す）
+        limit = criteria.top_k_papers
+        if limit is not None and criteria.enable_preliminary_llm_filter:
+            limit += criteria.preliminary_llm_filter_count
+        ranked_papers = self._sort_by_overall_score(filtered_papers, limit)
         
         # 簡易LLMフィルタ（有効な場合）
         if criteria.enable_preliminary_llm_filter and len(ranked_papers) > 0:
             logger.info("🔍 Preliminary LLM filter enabled - evaluating top candidates...")
-            ranked_papers = self._apply_preliminary_llm_filter(
+            ranked_papers = await self._apply_preliminary_llm_filter(
                 ranked_papers, 
                 criteria
             )
@@ -93,6 +119,30 @@ class RankPapersNode:
             "top_papers": top_papers,
         }
     
+    def _sort_by_overall_score(
+        self,
+        papers: list[EvaluatedPaper],
+        limit: int | None = None,
+    ) -> list[EvaluatedPaper]:
+        """総合スコアの降順に並べ替え（上位`limit`件のみ必要な場合は部分ソート）.
+        
+        Args:
+        ----
+            papers: 論文リスト
+            limit: 必要な上位件数（Noneの場合は全件）
+            
+        Returns:
+        -------
+            総合スコア降順の論文リスト（`limit`指定時は最大`limit`件）
+        """
+        def key(p: EvaluatedPaper) -> float:
+            return p.overall_score or 0.0
+        
+        # heapq.nlargestは sorted(..., reverse=True)[:limit] と同じ順序を返す
+        if limit is not None and limit < len(papers) // PARTIAL_SORT_RATIO:
+            return heapq.nlargest(limit, papers, key=key)
+        return sorted(papers, key=key, reverse=True)
+    
     def _meets_criteria(self, paper: EvaluatedPaper, criteria: EvaluationCriteria) -> bool:
         """論文が評価基準を満たすかチェック.
         
@@ -117,13 +167,18 @@ class RankPapersNode:
         
         return True
     
-    def _apply_preliminary_llm_filter(
+    async def _apply_preliminary_llm_filter(
         self, 
         ranked_papers: list[EvaluatedPaper], 
         criteria: EvaluationCriteria,
     ) -> list[EvaluatedPaper]:
         """簡易LLM評価でrelevance_scoreを再計算し、再ソート.
         
+        上位N件のLLM呼び出しは`asyncio.gather`で並行に発行します
+        （同時リクエスト数は`criteria.max_concurrency`で制限）。
+        対象数が`criteria.preliminary_batch_api_threshold`を超える場合はOpenAI Batch APIでまとめて評価します。
+        既にLLMで評価済み（`llm_scored`）の論文は再評価しません。
+        
         Args:
         ----
             ranked_papers: ソート済み論文リスト
@@ -139,80 +194,268 @@ class RankPapersNode:
             len(ranked_papers)
         )
         
-        logger.info(f"Evaluating top {filter_count} papers with LLM for better relevance scoring...")
+        logger.info(f"Evaluating top {filter_count} papers with {criteria.preliminary_llm_model} for better relevance scoring...")
         
-        # LLM初期化
-        if self.llm is None:
-            self.llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.0,
-                max_tokens=PRELIMINARY_LLM_MAX_TOKENS,
-            )
+        candidates = ranked_papers[:filter_count]
+        pending = [paper for paper in candidates if not paper.llm_scored]
+        if len(pending) < filter_count:
+            logger.info(f"Skipping {filter_count - len(pending)} papers already scored by LLM")
         
-        # 上位N件を簡易LLM評価
-        updated_papers = []
-        success_count = 0
+        # 全論文で共通のユーザーの研究興味は1回だけ整形
+        user_interests = self._format_user_interests(criteria)
         
-        for i, paper in enumerate(ranked_papers[:filter_count], 1):
-            try:
-                # LLMで関連性を評価
-                llm_relevance = self._evaluate_relevance_with_llm(paper, criteria)
-                
-                # relevance_scoreを更新
-                updated_paper = paper.model_copy(deep=True)
-                old_score = paper.relevance_score or 0.0
-                updated_paper.relevance_score = llm_relevance
-                
-                # overall_scoreも更新（relevance_weightを考慮）
-                # overall_score = relevance * weight + novelty * weight + impact * weight
-                # 簡易的にrelevanceの差分を反映
-                score_diff = llm_relevance - old_score
-                updated_paper.overall_score = (paper.overall_score or 0.0) + score_diff * 0.4  # relevance_weight=0.4
-                
-                updated_papers.append(updated_paper)
-                success_count += 1
-                
-                if i % 50 == 0:
-                    logger.info(f"  Progress: {i}/{filter_count} papers evaluated")
-                
-            except Exception as e:
-                logger.warning(f"Failed to LLM evaluate paper {paper.id}: {e}")
-                # 失敗時は元のスコアを保持
-                updated_papers.append(paper)
+        if not pending:
+            results = []
+        elif (
+            criteria.preliminary_batch_api_threshold is not None
+            and len(pending) > criteria.preliminary_batch_api_threshold
+        ):
+            results = await self._rescore_with_batch_api(pending, criteria, user_interests)
+        else:
+            results = await self._rescore_online(pending, criteria, user_interests)
+        
+        # 評価済みの論文はそのまま、それ以外は評価結果で置き換え（順序を保持）
+        rescored = iter(results)
+        updated_papers = [paper if paper.llm_scored else next(rescored)[0] for paper in candidates]
+        success_count = sum(1 for _, success in results if success)
         
         # 残りの論文（LLM評価しない）を追加
         remaining_papers = ranked_papers[filter_count:]
         all_papers = updated_papers + remaining_papers
         
         # relevance_scoreで再ソート（overall_scoreに反映されているので、overall_scoreでソート）
-        re_ranked_papers = sorted(
-            all_papers,
-            key=lambda p: p.overall_score or 0.0,
-            reverse=True,
-        )
+        re_ranked_papers = self._sort_by_overall_score(all_papers, criteria.top_k_papers)
         
         logger.success(
-            f"✓ Preliminary LLM filter completed: {success_count}/{filter_count} papers re-scored"
+            f"✓ Preliminary LLM filter completed: {success_count}/{len(pending)} papers re-scored"
         )
         
         return re_ranked_papers
     
-    def _evaluate_relevance_with_llm(
+    async def _rescore_online(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+        user_interests: str,
+    ) -> list[tuple[EvaluatedPaper, bool]]:
+        """オンラインのLLM呼び出しで関連性を並行に再評価.
+        
+        `criteria.preliminary_llm_batch_size` が2以上の場合は、その件数ごとに1回の呼び出しで評価します。
+        
+        Args:
+        ----
+            papers: 評価対象論文リスト
+            criteria: 評価基準
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
+            
+        Returns:
+        -------
+            入力順に並んだ (更新後の論文, 評価成功フラグ) のリスト
+        """
+        # LLM初期化（本評価とは別の安価なモデルを使う。インスタンスはファクトリ側でキャッシュされる）
+        # Structured Outputs対応モデルでは {"score": ...} のJSONのみを返させる
+        llm = create_chat_openai_structured(
+            model=criteria.preliminary_llm_model,
+            schema=RelevanceScore,
+            temperature=0.0,
+            max_tokens=PRELIMINARY_LLM_MAX_TOKENS,
+            reasoning_effort="minimal",
+            cache=get_llm_response_cache() if self.llm_config.use_response_cache else None,
+            rate_limiter=self._rate_limiter(),
+        )
+        
+        total = len(papers)
+        semaphore = asyncio.Semaphore(criteria.max_concurrency)
+        
+        batch_size = criteria.preliminary_llm_batch_size
+        if batch_size > 1:
+            batches = await asyncio.gather(*[
+                self._rescore_batch(papers[start:start + batch_size], criteria, user_interests, semaphore)
+                for start in range(0, total, batch_size)
+            ])
+            return [result for batch in batches for result in batch]
+        
+        completed = 0
+        
+        async def rescore(paper: EvaluatedPaper) -> tuple[EvaluatedPaper, bool]:
+            nonlocal completed
+            try:
+                # LLMで関連性を評価
+                async with semaphore:
+                    llm_relevance = await self._evaluate_relevance_with_llm(llm, paper, user_interests)
+                if llm_relevance is None:
+                    # スコアを取得できなかった論文は未評価のまま残し、次回の再評価対象にする
+                    return paper, False
+                return self._apply_llm_relevance(paper, llm_relevance), True
+                
+            except Exception as e:
+                logger.warning("Failed to LLM evaluate paper {}: {}", paper.id, e)
+                # 失敗時は元のスコアを保持
+                return paper, False
+            
+            finally:
+                completed += 1
+                if completed % 50 == 0:
+                    logger.info("  Progress: {}/{} papers evaluated", completed, total)
+        
+        # gatherは入力順で結果を返す
+        return await asyncio.gather(*[rescore(paper) for paper in papers])
+    
+    async def _rescore_with_batch_api(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+        user_interests: str,
+    ) -> list[tuple[EvaluatedPaper, bool]]:
+        """OpenAI Batch APIで関連性をまとめて再評価（論文IDをcustom_idとして対応付け）.
+        
+        Batch APIが失敗・タイムアウトした場合や応答がなかった論文は、オンライン呼び出しで評価し直します。
+        
+        Args:
+        ----
+            papers: 評価対象論文リスト
+            criteria: 評価基準
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
+            
+        Returns:
+        -------
+            入力順に並んだ (更新後の論文, 評価成功フラグ) のリスト
+        """
+        logger.info(f"Submitting {len(papers)} papers to OpenAI Batch API...")
+        
+        # スコアのみの出力なので、推論モデルに切り替えた場合も推論量は最小にする
+        batch_client = create_batch_openai(
+            model=criteria.preliminary_llm_model,
+            temperature=0.0,
+            max_tokens=PRELIMINARY_LLM_MAX_TOKENS,
+            reasoning_effort="minimal",
+        )
+        try:
+            responses = await batch_client.arun({
+                paper.id: self._create_relevance_prompt(paper, user_interests)
+                for paper in papers
+            })
+        except Exception as e:
+            logger.warning(f"OpenAI Batch API failed: {e}")
+            responses = {}
+        
+        results: list[tuple[EvaluatedPaper, bool] | None] = []
+        for paper in papers:
+            llm_relevance = self._parse_relevance(responses[paper.id]) if paper.id in responses else None
+            results.append(
+                (self._apply_llm_relevance(paper, llm_relevance), True) if llm_relevance is not None else None
+            )
+        
+        # 応答がなかった・パースできなかった論文のみオンラインで再評価
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"{len(missing)} papers missing or unparseable in Batch API results, evaluating online")
+            retried = await self._rescore_online([papers[i] for i in missing], criteria, user_interests)
+            for i, result in zip(missing, retried):
+                results[i] = result
+        
+        return results  # type: ignore[return-value]
+    
+    async def _rescore_batch(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+        user_interests: str,
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[EvaluatedPaper, bool]]:
+        """複数の論文の関連性を1回のLLM呼び出しでまとめて再評価.
+        
+        Args:
+        ----
+            papers: 評価対象論文リスト
+            criteria: 評価基準
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
+            semaphore: LLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            入力順に並んだ (更新後の論文, 評価成功フラグ) のリスト（応答にない論文は元のスコアを保持）
+        """
+        llm = create_chat_openai(
+            model=criteria.preliminary_llm_model,
+            temperature=0.0,
+            max_tokens=PRELIMINARY_LLM_MAX_TOKENS * len(papers),
+            reasoning_effort="minimal",
+            cache=get_llm_response_cache() if self.llm_config.use_response_cache else None,
+            rate_limiter=self._rate_limiter(),
+        )
+        
+        try:
+            async with semaphore:
+                response = await llm.ainvoke(self._create_batch_relevance_prompt(papers, user_interests))
+            scores = self._parse_batch_relevance(response.text)
+        except Exception as e:
+            logger.warning(f"Failed to LLM evaluate {len(papers)} papers in batch: {e}")
+            scores = {}
+        
+        return [
+            (self._apply_llm_relevance(paper, scores[paper.id]), True)
+            if paper.id in scores
+            else (paper, False)
+            for paper in papers
+        ]
+    
+    def _rate_limiter(self) -> InMemoryRateLimiter | None:
+        """本評価と共有するリクエストレート制限（`requests_per_minute` 未指定の場合はNone）."""
+        if self.llm_config.requests_per_minute:
+            return get_rate_limiter(self.llm_config.requests_per_minute)
+        return None
+    
+    def _apply_llm_relevance(self, paper: EvaluatedPaper, llm_relevance: float) -> EvaluatedPaper:
+        """LLMによる関連性スコアを論文に反映."""
+        old_score = paper.relevance_score or 0.0
+        
+        # overall_scoreも更新（relevance_weightを考慮）
+        # overall_score = relevance * weight + novelty * weight + impact * weight
+        # 簡易的にrelevanceの差分を反映
+        score_diff = llm_relevance - old_score
+        
+        # relevance_scoreを更新（スカラー値のみ上書きするため、レビュー等は浅いコピーで共有）
+        return paper.model_copy(update={
+            'relevance_score': llm_relevance,
+            'llm_scored': True,
+            'overall_score': (paper.overall_score or 0.0) + score_diff * 0.4,  # relevance_weight=0.4
+        })
+    
+    async def _evaluate_relevance_with_llm(
         self, 
+        llm: Runnable,
         paper: EvaluatedPaper, 
-        criteria: EvaluationCriteria,
-    ) -> float:
-        """LLMで論文の関連性を簡易評価.
+        user_interests: str,
+    ) -> float | None:
+        """LLMで論文の関連性を簡易評価（LLM呼び出しの例外は呼び出し元へ送出）.
         
         Args:
         ----
+            llm: 簡易評価用のLLM
             paper: 評価対象論文
-            criteria: 評価基準
+            user_interests: プロンプト用に整形済みのユーザーの研究興味
             
         Returns:
         -------
-            関連性スコア（0.0-1.0）
+            関連性スコア（0.0-1.0、応答からスコアを抽出できない場合はNone）
         """
+        prompt = self._create_relevance_prompt(paper, user_interests)
+        response = await llm.ainvoke(prompt)
+        return self._parse_relevance(response.text)
+    
+    def _format_user_interests(self, criteria: EvaluationCriteria) -> str:
+        """ユーザーの研究興味をプロンプト用にフォーマット."""
+        # research_description がない場合は research_interests をフォールバック
+        research_interests_str = ", ".join(criteria.research_interests)
+        return criteria.research_description or f"Keywords: {research_interests_str}"
+    
+    def _create_relevance_prompt(
+        self, 
+        paper: EvaluatedPaper, 
+        user_interests: str,
+    ) -> str:
+        """簡易関連性評価のプロンプトを作成."""
         # アブストラクトを短縮
         abstract_short = (
             paper.abstract[:ABSTRACT_SHORT_LENGTH] + 
@@ -220,10 +463,6 @@ class RankPapersNode:
         )
         keywords_str = ", ".join(paper.keywords[:MAX_KEYWORDS_DISPLAY])
         
-        # research_description がない場合は research_interests をフォールバック
-        research_interests_str = ", ".join(criteria.research_interests)
-        user_interests = criteria.research_description or f"Keywords: {research_interests_str}"
-        
         prompt = f"""Rate the relevance of this paper to the user's research interests.
 
 User's Research Interests:
@@ -241,26 +480,73 @@ Rate the relevance on a scale of 0.0 to 1.0:
 - 0.1-0.3: Slightly relevant, tangential connection
 - 0.0: Not relevant
 
-Return ONLY a single number between 0.0 and 1.0 (e.g., "0.85"). No other text.
+Return ONLY a JSON object with the score between 0.0 and 1.0 (e.g., {{"score": 0.85}}). No other text.
 """
-        
+        return prompt
+    
+    def _parse_relevance(self, response_text: str) -> float | None:
+        """LLMの応答から関連性スコアを抽出（抽出できない場合はNone）."""
         try:
-            response = self.llm.invoke(prompt)
-            response_text = response.content.strip()
-            
-            # 数値を抽出
-            # "0.85"のような形式、または"The relevance is 0.85"のような形式に対応
-            match = re.search(r'(\d+\.?\d*)', response_text)
-            if match:
-                score = float(match.group(1))
-                # 0-1の範囲に制限
-                score = max(0.0, min(1.0, score))
-                return score
-            else:
-                logger.warning(f"Could not parse LLM response: {response_text[:50]}")
-                return paper.relevance_score or 0.5
-                
-        except Exception as e:
-            logger.warning(f"LLM evaluation failed: {e}")
-            return paper.relevance_score or 0.5
+            # Structured Outputs対応モデルではスキーマ通りのJSONが返る
+            score = RelevanceScore.model_validate_json(response_text).score
+            return max(0.0, min(1.0, score))
+        except ValidationError:
+            pass
+        
+        response_text = response_text.strip()
+        
+        # スキーマ非対応モデルでは数値を抽出
+        # "0.85"のような形式、または"The relevance is 0.85"のような形式に対応
+        match = _FLOAT_RE.search(response_text)
+        if match:
+            score = float(match.group(1))
+            # 0-1の範囲に制限
+            score = max(0.0, min(1.0, score))
+            return score
+        else:
+            logger.warning("Could not parse LLM response: {}", response_text[:50])
+            return None
+    
+    def _create_batch_relevance_prompt(
+        self,
+        papers: list[EvaluatedPaper],
+        user_interests: str,
+    ) -> str:
+        """複数論文の簡易関連性評価プロンプトを作成（番号付きリスト形式）."""
+        papers_str = format_id_keyed_items(
+            (
+                paper.id,
+                f"""Title: {paper.title}
+Keywords: {", ".join(paper.keywords[:MAX_KEYWORDS_DISPLAY])}
+Abstract: {paper.abstract[:ABSTRACT_SHORT_LENGTH]}{"..." if len(paper.abstract) > ABSTRACT_SHORT_LENGTH else ""}
+""",
+            )
+            for paper in papers
+        )
+        
+        prompt = f"""Rate the relevance of each paper below to the user's research interests.
+
+User's Research Interests:
+{user_interests}
+
+Papers:
+{papers_str}
+Rate the relevance on a scale of 0.0 to 1.0:
+- 1.0: Highly relevant, directly addresses the research interests
+- 0.7-0.9: Very relevant, closely related
+- 0.4-0.6: Moderately relevant, some overlap
+- 0.1-0.3: Slightly relevant, tangential connection
+- 0.0: Not relevant
 
+Return ONLY a JSON array with one element per paper, using each paper's ID as "id" (e.g., [{{"id": "abc123", "score": 0.85}}, {{"id": "def456", "score": 0.2}}]). No other text.
+"""
+        return prompt
+    
+    def _parse_batch_relevance(self, response_text: str) -> dict[str, float]:
+        """バッチ評価の応答（IDとスコアを持つ要素のJSON配列）をパースし、論文IDごとのスコアを返す."""
+        # 0-1の範囲に制限
+        return {
+            paper_id: max(0.0, min(1.0, float(item['score'])))
+            for paper_id, item in parse_id_keyed_json_array(response_text).items()
+            if 'score' in item
+        }
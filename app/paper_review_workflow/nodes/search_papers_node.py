@@ -1,9 +1,10 @@
 """Node for searching papers using OpenReview API."""
 
-import json
 from typing import Any
 
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from app.paper_review_workflow.models.state import (
     PaperReviewAgentState,
@@ -11,6 +12,9 @@ from app.paper_review_workflow.models.state import (
 )
 from app.paper_review_workflow.tools import search_papers
 
+# 論文リストの検証スキーマはモジュールロード時に一度だけ構築する
+_PAPER_LIST_ADAPTER = TypeAdapter(list[Paper])
+
 
 class SearchPapersNode:
     """論文を検索するノード.
@@ -51,7 +55,7 @@ class SearchPapersNode:
             })
             
             # 結果をパース
-            papers_data = json.loads(result)
+            papers_data = orjson.loads(result)
             
             # エラーチェック
             if isinstance(papers_data, dict) and "error" in papers_data:
@@ -62,15 +66,18 @@ class SearchPapersNode:
                     "error_messages": [error_msg],
                 }
             
-            # Paper オブジェクトのリストに変換
-            papers: list[Paper] = []
-            for paper_data in papers_data:
-                try:
-                    paper = Paper(**paper_data)
-                    papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Failed to parse paper data: {e}")
-                    continue
+            # Paper オブジェクトのリストに変換（まず一括検証し、失敗時のみ1件ずつ検証）
+            try:
+                papers: list[Paper] = _PAPER_LIST_ADAPTER.validate_python(papers_data)
+            except ValidationError:
+                papers = []
+                for paper_data in papers_data:
+                    try:
+                        paper = Paper.model_validate(paper_data)
+                        papers.append(paper)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse paper data: {e}")
+                        continue
             
             logger.info(f"Successfully found {len(papers)} papers")
             
@@ -1,14 +1,22 @@
 """Unified LLM evaluation node - 1回の呼び出しで全評価を完結."""
 
-import json
+import asyncio
 import re
 from typing import Any
 
+import orjson
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import Runnable
 from loguru import logger
+from pydantic import BaseModel, ValidationError
 
 from app.paper_review_workflow.models.state import (
     PaperReviewAgentState,
     EvaluatedPaper,
+    EvaluationCriteria,
+    EvaluatedPaperScores,
+    BatchEvaluatedPaperScores,
 )
 from app.paper_review_workflow.config import (
     LLMConfig,
@@ -20,8 +28,121 @@ from app.paper_review_workflow.constants import (
     MAX_SCORE,
     MAX_AUTHORS_DISPLAY,
     MAX_KEYWORDS_DISPLAY,
+    CACHE_DIR_NAME,
+    LLM_CACHE_TTL_HOURS,
 )
-from app.paper_review_workflow.llm_factory import create_chat_openai
+from app.paper_review_workflow.llm_factory import (
+    astream_json,
+    build_messages,
+    create_batch_openai,
+    create_chat_openai_structured,
+    extract_json_object,
+    format_id_keyed_items,
+    get_rate_limiter,
+    parse_id_keyed_json_array,
+)
+from app.paper_review_workflow.tools.cache_manager import CacheManager
+from app.paper_review_workflow.tools.llm_cache import get_llm_response_cache
+from app.paper_review_workflow.utils import select_low_relevance_indices
+
+# 論文ごとの評価結果キャッシュのプレフィックス
+EVALUATION_CACHE_PREFIX = "llm_eval"
+
+# パース失敗時のデフォルト評価のrationale接頭辞（キャッシュ対象から除外する目印）
+PARSE_ERROR_RATIONALE_PREFIX = "パースエラー"
+
+# LLM応答のパースに使う正規表現（論文ごとに呼ばれるためモジュール読み込み時に一度だけコンパイル）
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# 単一評価・バッチ評価で共通の評価タスク説明
+EVALUATION_TASK_INSTRUCTIONS = """\
+以下の**4つのスコア**を0.0-1.0の範囲で評価してください：
+
+## 1. 関連性 (relevance)
+ユーザーの研究興味との関連度を評価。
+- 論文のキーワード、タイトル、アブストラクトから判断
+- レビューに "relevance" や "significance" フィールドがあれば参考にする
+
+## 2. 新規性 (novelty)
+研究の独創性・新しさを評価。
+- レビューの **"originality"** や **"novelty"** フィールドがあれば優先的に使用
+- **"strengths_and_weaknesses"** に新規性の記述があれば参考
+- **"claims_and_evidence"** や **"contribution"** も参考
+- なければアブストラクトから推測
+
+## 3. インパクト (impact)
+学術的・実用的な影響力を評価。
+- レビューの **"significance"** や **"contribution"** フィールドがあれば優先
+- **"rating"** や **"overall_recommendation"** も重視
+- 採択判定 (Accept/Reject) も考慮
+- **"experimental_designs_or_analyses"** の質も参考
+
+## 4. 実用性 (practicality)
+実際の応用可能性を評価。
+- 実装の容易性、再現性、産業応用の可能性
+- **"methods_and_evaluation_criteria"** や **"code_of_conduct"** フィールドも参考
+- レビューの **"questions_for_authors"** も参考
+
+## 5. レビュー要約 (review_summary)
+すべてのレビューを統合して、2-3文で要約してください：
+- レビューワーの主な評価点（強み・弱み）
+- 平均的な評価傾向
+- Program Chairsの判定理由（あれば）
+
+## 6. フィールド活用の説明 (field_insights)
+どのレビューフィールドを主に使用したかを1-2文で説明：
+例: "ICMLのoverall_recommendationフィールド(平均3.0)とsummaryを主に参照しました"
+例: "NeurIPSのratingフィールド(平均5.5)とstrengths_and_weaknessesを主に参照しました"
+
+"""
+
+# プロンプトキャッシュが効くよう、論文に依存しない指示はすべて先頭のシステムメッセージにまとめる
+UNIFIED_EVALUATION_RUBRIC = f"""\
+あなたは機械学習論文の評価専門家です。ユーザーの研究興味を踏まえ、最後に提示される論文を総合的に評価してください。
+
+# 📝 評価タスク
+
+{EVALUATION_TASK_INSTRUCTIONS}# 出力形式
+
+必ず以下のJSON形式のみを出力してください（説明文は不要）：
+
+{{
+  "relevance": 0.85,
+  "novelty": 0.72,
+  "impact": 0.68,
+  "practicality": 0.80,
+  "review_summary": "レビューワーは手法の理論的堅牢性を高く評価。一方で実験の限定性を指摘。Program Chairsは新規性と実験品質のバランスから採択を推奨。",
+  "field_insights": "ICMLのoverall_recommendation(平均2.75)、theoretical_claims、experimental_designs_or_analysesフィールドを主に参照しました。",
+  "rationale": "この論文はグラフ生成に特化しており、ユーザーの興味に直接関連。新しい手法で実験も充実しているが、大規模データセットでの検証が限定的。"
+}}
+"""
+
+BATCH_EVALUATION_RUBRIC = f"""\
+あなたは機械学習論文の評価専門家です。ユーザーの研究興味を踏まえ、最後に提示される複数の論文をそれぞれ総合的に評価してください。
+
+# 📝 評価タスク
+
+各論文について個別に評価してください。
+{EVALUATION_TASK_INSTRUCTIONS}# 出力形式
+
+必ず以下のJSON形式のみを出力してください（説明文は不要）。
+"evaluations" には論文ごとに1要素を入れ、"id" には論文一覧のIDをそのまま記載してください：
+
+{{
+  "evaluations": [
+    {{
+      "id": "論文ID",
+      "relevance": 0.85,
+      "novelty": 0.72,
+      "impact": 0.68,
+      "practicality": 0.80,
+      "review_summary": "...",
+      "field_insights": "...",
+      "rationale": "..."
+    }}
+  ]
+}}
+"""
 
 
 class UnifiedLLMEvaluatePapersNode:
@@ -43,25 +164,67 @@ class UnifiedLLMEvaluatePapersNode:
         
         self.llm_config = llm_config or DEFAULT_LLM_CONFIG
         self.weights = scoring_weights or DEFAULT_SCORING_WEIGHTS
-        self.llm = self._create_llm()
+        # overall_scoreの重み（評価項目名, 重み）は論文ごとに引き直さないよう1回だけ取り出す
+        self._overall_score_weights = (
+            ('relevance', self.weights.llm_relevance_weight),
+            ('novelty', self.weights.llm_novelty_weight),
+            ('impact', self.weights.llm_impact_weight),
+            ('practicality', self.weights.llm_practicality_weight),
+        )
+        self.llm = self._create_llm(EvaluatedPaperScores)
+        # バッチ評価では1回の応答に複数論文分の出力が入るため、出力トークン上限を拡張
+        self.batch_llm = (
+            self._create_llm(
+                BatchEvaluatedPaperScores,
+                self.llm_config.max_tokens * self.llm_config.batch_size,
+            )
+            if self.llm_config.batch_size > 1
+            else None
+        )
+        # 論文単位の評価結果キャッシュ（バッチ構成やBatch APIの有無によらず再評価を省略）
+        self._evaluation_cache = (
+            CacheManager(cache_dir=CACHE_DIR_NAME, ttl_hours=LLM_CACHE_TTL_HOURS)
+            if self.llm_config.use_response_cache
+            else None
+        )
     
-    def _create_llm(self):
-        """LLMインスタンスを作成."""
+    def _create_llm(
+        self,
+        schema: type[BaseModel],
+        max_tokens: int | None = None,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        """出力をJSONスキーマで制約したLLMインスタンスを作成."""
         model_name = self.llm_config.model.value
         
         if model_name.startswith("gpt"):
-            return create_chat_openai(
+            return create_chat_openai_structured(
                 model=model_name,
+                schema=schema,
                 temperature=self.llm_config.temperature,
-                max_tokens=self.llm_config.max_tokens,
+                max_tokens=max_tokens or self.llm_config.max_tokens,
                 timeout=self.llm_config.timeout,
+                reasoning_effort=self.llm_config.reasoning_effort,
+                cache=get_llm_response_cache() if self.llm_config.use_response_cache else None,
+                rate_limiter=(
+                    get_rate_limiter(self.llm_config.requests_per_minute)
+                    if self.llm_config.requests_per_minute
+                    else None
+                ),
             )
         else:
             raise ValueError(f"Unsupported model: {model_name}. Only OpenAI GPT models are supported.")
     
-    def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
+    async def __call__(self, state: PaperReviewAgentState) -> dict[str, Any]:
         """統合LLM評価を実行.
         
+        全論文のLLM呼び出しを`asyncio.gather`で並行に発行します
+        （同時リクエスト数は`evaluation_criteria.max_concurrency`で制限）。
+        `llm_config.batch_size` が2以上の場合は、その件数ごとに1回の呼び出しで評価します。
+        対象数が`llm_config.batch_api_threshold`を超える場合はOpenAI Batch APIでまとめて評価します。
+        `llm_config.use_response_cache` が有効な場合、同じ内容の論文はキャッシュ済みの評価を再利用します。
+        `evaluation_criteria.llm_skip_ratio` が正の場合、キーワードによる関連性スコアが
+        下位の論文はLLMに渡さずキーワードベースのスコアを保持します。
+        
         Args:
         ----
             state: 現在の状態
@@ -73,71 +236,70 @@ class UnifiedLLMEvaluatePapersNode:
         logger.info(f"🤖 Unified LLM evaluation for {len(state.ranked_papers)} papers using {self.llm_config.model.value}...")
         logger.info(f"📊 1回の呼び出しで全スコア + レビュー要約 + field_insights を取得")
         
-        evaluated_papers: list[EvaluatedPaper] = []
+        criteria = state.evaluation_criteria
         
-        for i, paper in enumerate(state.ranked_papers, 1):
-            try:
-                logger.info(f"  [{i}/{len(state.ranked_papers)}] Evaluating: {paper.title[:50]}...")
-                
-                # 統合プロンプトを作成
-                prompt = self._create_unified_evaluation_prompt(paper, state.evaluation_criteria)
-                
-                # LLMに評価を依頼（1回の呼び出し）
-                response = self.llm.invoke(prompt)
-                response_text = response.content
-                
-                # レスポンスが空の場合の詳細ログ
-                if not response_text or len(response_text.strip()) == 0:
-                    logger.error(f"  ❌ Empty response from LLM for paper: {paper.title[:50]}")
-                    logger.error(f"     Model: {self.llm_config.model.value}")
-                    logger.error(f"     Response object: {response}")
-                    raise ValueError("Empty response from LLM")
-                
-                # レスポンスをパース
-                evaluation = self._parse_llm_response(response_text)
-                
-                # 論文オブジェクトを更新
-                updated_paper = paper.model_copy(deep=True)
-                updated_paper.relevance_score = evaluation['relevance']
-                updated_paper.novelty_score = evaluation['novelty']
-                updated_paper.impact_score = evaluation['impact']
-                updated_paper.practicality_score = evaluation['practicality']
-                updated_paper.review_summary = evaluation['review_summary']
-                updated_paper.field_insights = evaluation['field_insights']
-                updated_paper.ai_rationale = evaluation['rationale']
-                
-                # overall_scoreを計算（4つのスコアの重み付き平均）
-                updated_paper.overall_score = (
-                    evaluation['relevance'] * 0.4 +
-                    evaluation['novelty'] * 0.25 +
-                    evaluation['impact'] * 0.25 +
-                    evaluation['practicality'] * 0.10
-                )
-                
-                evaluated_papers.append(updated_paper)
-                
-                logger.debug(
-                    f"    ✓ Scores: R={evaluation['relevance']:.2f} "
-                    f"N={evaluation['novelty']:.2f} "
-                    f"I={evaluation['impact']:.2f} "
-                    f"P={evaluation['practicality']:.2f} "
-                    f"Overall={updated_paper.overall_score:.2f}"
-                )
-                
-            except Exception as e:
-                logger.warning(f"  ⚠ Failed to evaluate paper {paper.id}: {e}")
-                # 評価失敗時はデフォルト値を設定
-                updated_paper = paper.model_copy(deep=True)
-                updated_paper.relevance_score = 0.5
-                updated_paper.novelty_score = 0.5
-                updated_paper.impact_score = 0.5
-                updated_paper.practicality_score = 0.5
-                updated_paper.overall_score = 0.5
-                updated_paper.review_summary = "評価に失敗しました"
-                updated_paper.field_insights = "N/A"
-                updated_paper.ai_rationale = f"LLM評価エラー: {str(e)[:100]}"
-                evaluated_papers.append(updated_paper)
+        # 関連性の低い論文はLLM評価を省略する
+        skipped = select_low_relevance_indices(state.ranked_papers, criteria.llm_skip_ratio)
+        if skipped:
+            logger.info(f"Skipping LLM evaluation for {len(skipped)} papers with low keyword relevance")
+        resolved_papers: dict[int, EvaluatedPaper] = {
+            i: self._skipped_evaluation(state.ranked_papers[i]) for i in skipped
+        }
+        
+        # キャッシュ済みの論文は評価を復元し、残りのみLLMで評価する
+        cached_count = 0
+        for i, paper in enumerate(state.ranked_papers):
+            if i in skipped:
                 continue
+            evaluation = self._load_cached_evaluation(paper, criteria)
+            if evaluation is not None:
+                resolved_papers[i] = self._apply_evaluation(paper, evaluation)
+                cached_count += 1
+        pending_papers = [
+            paper for i, paper in enumerate(state.ranked_papers) if i not in resolved_papers
+        ]
+        if cached_count:
+            logger.info(f"💾 Restored {cached_count} evaluations from cache, {len(pending_papers)} papers left")
+        
+        total = len(pending_papers)
+        batch_size = self.llm_config.batch_size
+        semaphore = asyncio.Semaphore(criteria.max_concurrency)
+        # gatherは入力順で結果を返すため、ランキング順が保持される
+        if not pending_papers:
+            newly_evaluated: list[EvaluatedPaper] = []
+        elif (
+            self.llm_config.batch_api_threshold is not None
+            and total > self.llm_config.batch_api_threshold
+        ):
+            newly_evaluated = await self._evaluate_with_batch_api(
+                pending_papers,
+                criteria,
+                semaphore,
+            )
+        elif batch_size > 1:
+            batches = await asyncio.gather(*[
+                self._evaluate_batch(
+                    pending_papers[start:start + batch_size],
+                    criteria,
+                    start + 1,
+                    total,
+                    semaphore,
+                )
+                for start in range(0, total, batch_size)
+            ])
+            newly_evaluated = [paper for batch in batches for paper in batch]
+        else:
+            newly_evaluated = await asyncio.gather(*[
+                self._evaluate_paper(paper, criteria, i, total, semaphore)
+                for i, paper in enumerate(pending_papers, 1)
+            ])
+        
+        # 省略分・キャッシュ復元分と新規評価分をランキング順に戻す
+        newly_evaluated_iter = iter(newly_evaluated)
+        evaluated_papers = [
+            resolved_papers[i] if i in resolved_papers else next(newly_evaluated_iter)
+            for i in range(len(state.ranked_papers))
+        ]
         
         logger.success(f"✅ Successfully evaluated {len(evaluated_papers)} papers with unified LLM")
         
@@ -145,21 +307,317 @@ class UnifiedLLMEvaluatePapersNode:
             "llm_evaluated_papers": evaluated_papers,
         }
     
-    def _create_unified_evaluation_prompt(self, paper: EvaluatedPaper, criteria) -> str:
-        """統合評価プロンプトを作成 - 1回の呼び出しで全て完結."""
+    async def _evaluate_paper(
+        self,
+        paper: EvaluatedPaper,
+        criteria: EvaluationCriteria,
+        index: int,
+        total: int,
+        semaphore: asyncio.Semaphore,
+    ) -> EvaluatedPaper:
+        """1件の論文をLLMで評価（評価失敗時はデフォルト値を設定）.
+        
+        Args:
+        ----
+            paper: 評価対象の論文
+            criteria: 評価基準
+            index: 論文の通し番号（ログ用）
+            total: 論文の総数（ログ用）
+            semaphore: LLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            評価結果を反映した論文
+        """
+        try:
+            logger.info("  [{}/{}] Evaluating: {}...", index, total, paper.title[:50])
+            
+            # 統合プロンプトを作成
+            prompt = self._create_unified_evaluation_prompt(paper, criteria)
+            
+            # LLMに評価を依頼（1回の呼び出し、JSONが閉じた時点でストリームを打ち切る）
+            async with semaphore:
+                response_text = await astream_json(self.llm, prompt)
+            
+            # レスポンスが空の場合の詳細ログ
+            if not response_text or len(response_text.strip()) == 0:
+                logger.error(f"  ❌ Empty response from LLM for paper: {paper.title[:50]}")
+                logger.error(f"     Model: {self.llm_config.model.value}")
+                raise ValueError("Empty response from LLM")
+            
+            # レスポンスをパース
+            evaluation = self._parse_llm_response(response_text)
+            
+        except Exception as e:
+            logger.warning("  ⚠ Failed to evaluate paper {}: {}", paper.id, e)
+            return self._fallback_evaluation(paper, e)
+        
+        # キャッシュへの保存は評価の成否に影響させないため、tryの外で行う
+        self._store_evaluation(paper, criteria, evaluation)
+        return self._apply_evaluation(paper, evaluation)
+    
+    async def _evaluate_batch(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+        start_index: int,
+        total: int,
+        semaphore: asyncio.Semaphore,
+    ) -> list[EvaluatedPaper]:
+        """複数の論文を1回のLLM呼び出しでまとめて評価.
+        
+        応答に含まれなかった論文、またはバッチ全体が失敗した場合は1件ずつ評価し直します。
+        
+        Args:
+        ----
+            papers: 評価対象の論文リスト
+            criteria: 評価基準
+            start_index: バッチ先頭論文の通し番号（ログ用）
+            total: 論文の総数（ログ用）
+            semaphore: LLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            入力順に並んだ評価済み論文のリスト
+        """
+        end_index = start_index + len(papers) - 1
+        try:
+            logger.info("  [{}-{}/{}] Evaluating {} papers in one call...", start_index, end_index, total, len(papers))
+            
+            if self.batch_llm is None:
+                raise ValueError("batch evaluation requires llm_config.batch_size >= 2")
+            prompt = self._create_batch_evaluation_prompt(papers, criteria)
+            async with semaphore:
+                response_text = await astream_json(self.batch_llm, prompt)
+            evaluations = self._parse_batch_response(response_text)
+        except Exception as e:
+            logger.warning(f"  ⚠ Batch evaluation failed ({start_index}-{end_index}): {e}")
+            evaluations = {}
+        
+        for paper in papers:
+            if paper.id in evaluations:
+                self._store_evaluation(paper, criteria, evaluations[paper.id])
+        
+        results: list[EvaluatedPaper | None] = [
+            self._apply_evaluation(paper, evaluations[paper.id]) if paper.id in evaluations else None
+            for paper in papers
+        ]
+        
+        # 応答から欠落した論文のみ個別に再評価
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"  ⚠ {len(missing)} papers missing from batch response, evaluating individually")
+            retried = await asyncio.gather(*[
+                self._evaluate_paper(papers[i], criteria, start_index + i, total, semaphore)
+                for i in missing
+            ])
+            for i, paper in zip(missing, retried):
+                results[i] = paper
+        
+        return results  # type: ignore[return-value]
+    
+    async def _evaluate_with_batch_api(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+        semaphore: asyncio.Semaphore,
+    ) -> list[EvaluatedPaper]:
+        """OpenAI Batch APIで全論文をまとめて評価（論文IDをcustom_idとして対応付け）.
         
-        # ユーザーの研究興味
+        Batch APIの応答がなかった論文と応答をパースできなかった論文は、オンライン呼び出しで1件ずつ評価し直します。
+        Batch APIの完了待ちは`BATCH_API_MAX_WAIT_SECONDS`で打ち切られ、その場合は全件をオンラインで評価します。
+        
+        Args:
+        ----
+            papers: 評価対象の論文リスト
+            criteria: 評価基準
+            semaphore: 再評価時のLLMへの同時リクエスト数を制限するセマフォ
+            
+        Returns:
+        -------
+            入力順に並んだ評価済み論文のリスト
+        """
+        logger.info(f"  Submitting {len(papers)} papers to OpenAI Batch API...")
+        
+        batch_client = create_batch_openai(
+            model=self.llm_config.model.value,
+            temperature=self.llm_config.temperature,
+            max_tokens=self.llm_config.max_tokens,
+            reasoning_effort=self.llm_config.reasoning_effort,
+            schema=EvaluatedPaperScores,
+        )
+        try:
+            responses = await batch_client.arun({
+                paper.id: self._create_unified_evaluation_prompt(paper, criteria)
+                for paper in papers
+            })
+        except Exception as e:
+            logger.warning(f"  ⚠ OpenAI Batch API failed: {e}")
+            responses = {}
+        
+        # パースできなかった応答は既定値で埋めず、応答なしとして扱う
+        evaluations: dict[str, dict[str, Any]] = {}
+        for paper_id, response_text in responses.items():
+            try:
+                evaluations[paper_id] = self._decode_llm_response(response_text)
+            except Exception as e:
+                logger.warning(f"  ⚠ Failed to parse Batch API response for {paper_id}: {e}")
+        
+        for paper in papers:
+            if paper.id in evaluations:
+                self._store_evaluation(paper, criteria, evaluations[paper.id])
+        
+        results: list[EvaluatedPaper | None] = [
+            self._apply_evaluation(paper, evaluations[paper.id]) if paper.id in evaluations else None
+            for paper in papers
+        ]
+        
+        # 応答がなかった・パースできなかった論文のみオンラインで再評価
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"  ⚠ {len(missing)} papers missing from Batch API results, evaluating individually")
+            retried = await asyncio.gather(*[
+                self._evaluate_paper(papers[i], criteria, i + 1, len(papers), semaphore)
+                for i in missing
+            ])
+            for i, paper in zip(missing, retried):
+                results[i] = paper
+        
+        return results  # type: ignore[return-value]
+    
+    def _evaluation_cache_key(self, paper: EvaluatedPaper, criteria: EvaluationCriteria) -> dict[str, Any]:
+        """評価結果キャッシュのキーを作成（プロンプトに入る論文情報・研究興味・モデル設定）.
+        
+        overall_scoreの重みはキャッシュした個別スコアから毎回計算するため、キーには含めません。
+        """
+        return {
+            'model': self.llm_config.model.value,
+            'temperature': self.llm_config.temperature,
+            'rubric': UNIFIED_EVALUATION_RUBRIC,
+            'user_interests': self._format_user_interests(criteria),
+            'paper': self._format_paper_details(paper),
+        }
+    
+    def _load_cached_evaluation(
+        self,
+        paper: EvaluatedPaper,
+        criteria: EvaluationCriteria,
+    ) -> dict[str, Any] | None:
+        """キャッシュ済みの評価結果を取得（キャッシュ無効・未保存の場合はNone）."""
+        if self._evaluation_cache is None:
+            return None
+        cached = self._evaluation_cache.get(
+            prefix=EVALUATION_CACHE_PREFIX, **self._evaluation_cache_key(paper, criteria)
+        )
+        if cached is None:
+            return None
+        evaluation: dict[str, Any] = orjson.loads(cached)
+        return evaluation
+    
+    def _store_evaluation(
+        self,
+        paper: EvaluatedPaper,
+        criteria: EvaluationCriteria,
+        evaluation: dict[str, Any],
+    ) -> None:
+        """評価結果をキャッシュに保存（パース失敗時のデフォルト値は保存せず、書き込み失敗は警告のみ）."""
+        if self._evaluation_cache is None or evaluation['rationale'].startswith(PARSE_ERROR_RATIONALE_PREFIX):
+            return
+        try:
+            self._evaluation_cache.set(
+                orjson.dumps(evaluation),
+                prefix=EVALUATION_CACHE_PREFIX,
+                **self._evaluation_cache_key(paper, criteria),
+            )
+        except OSError as e:
+            logger.warning(f"  ⚠ Failed to cache evaluation for paper {paper.id}: {e}")
+    
+    def _apply_evaluation(self, paper: EvaluatedPaper, evaluation: dict) -> EvaluatedPaper:
+        """パース済みの評価結果を論文に反映."""
+        # 論文オブジェクトを更新（スカラー値のみ上書きするため、レビュー等は浅いコピーで共有）
+        updated_paper = paper.model_copy(update={
+            'relevance_score': evaluation['relevance'],
+            'novelty_score': evaluation['novelty'],
+            'impact_score': evaluation['impact'],
+            'practicality_score': evaluation['practicality'],
+            'review_summary': evaluation['review_summary'],
+            'field_insights': evaluation['field_insights'],
+            'ai_rationale': evaluation['rationale'],
+            # overall_scoreを計算（4つのスコアの重み付き平均）
+            'overall_score': sum(
+                evaluation[name] * weight for name, weight in self._overall_score_weights
+            ),
+        })
+        
+        logger.debug(
+            f"    ✓ Scores: R={evaluation['relevance']:.2f} "
+            f"N={evaluation['novelty']:.2f} "
+            f"I={evaluation['impact']:.2f} "
+            f"P={evaluation['practicality']:.2f} "
+            f"Overall={updated_paper.overall_score:.2f}"
+        )
+        
+        return updated_paper
+    
+    def _skipped_evaluation(self, paper: EvaluatedPaper) -> EvaluatedPaper:
+        """LLM評価を省略した論文（キーワードベースのスコアを保持し、省略した旨のみ記録）を返す."""
+        return paper.model_copy(update={
+            'ai_rationale': "キーワードによる関連性が低いためLLM評価を省略しました",
+        })
+    
+    def _fallback_evaluation(self, paper: EvaluatedPaper, error: Exception) -> EvaluatedPaper:
+        """評価失敗時のデフォルト値を設定した論文を返す."""
+        return paper.model_copy(update={
+            'relevance_score': 0.5,
+            'novelty_score': 0.5,
+            'impact_score': 0.5,
+            'practicality_score': 0.5,
+            'overall_score': 0.5,
+            'review_summary': "評価に失敗しました",
+            'field_insights': "N/A",
+            'ai_rationale': f"LLM評価エラー: {str(error)[:100]}",
+        })
+    
+    def _create_unified_evaluation_prompt(
+        self,
+        paper: EvaluatedPaper,
+        criteria: EvaluationCriteria,
+    ) -> list[BaseMessage]:
+        """統合評価プロンプトを作成 - 1回の呼び出しで全て完結."""
+        return build_messages(
+            UNIFIED_EVALUATION_RUBRIC,
+            self._format_user_interests(criteria),
+            variable_content=f"# 📄 論文情報\n\n{self._format_paper_details(paper)}",
+        )
+    
+    def _create_batch_evaluation_prompt(
+        self,
+        papers: list[EvaluatedPaper],
+        criteria: EvaluationCriteria,
+    ) -> list[BaseMessage]:
+        """複数論文をまとめて評価するプロンプトを作成（論文IDをキーにしたJSON配列で回答させる）."""
+        paper_sections = format_id_keyed_items(
+            (paper.id, self._format_paper_details(paper)) for paper in papers
+        )
+        return build_messages(
+            BATCH_EVALUATION_RUBRIC,
+            self._format_user_interests(criteria),
+            variable_content=f"以下の{len(papers)}件の論文を評価してください。\n\n# 📄 論文一覧\n\n{paper_sections}",
+        )
+    
+    def _format_user_interests(self, criteria: EvaluationCriteria) -> str:
+        """ユーザーの研究興味をプロンプト用にフォーマット（同一基準なら常に同じ文字列）."""
         research_interests_str = ", ".join(criteria.research_interests)
         user_interests = criteria.research_description or f"キーワード: {research_interests_str}"
+        return f"# 🎯 ユーザーの研究興味\n\n{user_interests}"
+    
+    def _format_paper_details(self, paper: EvaluatedPaper) -> str:
+        """論文情報とレビューデータをプロンプト用にフォーマット."""
         
         # レビューデータをフォーマット
         reviews_formatted = self._format_dynamic_reviews(paper.reviews)
         
-        prompt = f"""
-あなたは機械学習論文の評価専門家です。以下の論文を総合的に評価してください。
-
-# 📄 論文情報
-
+        return f"""\
 **タイトル**: {paper.title}
 
 **著者**: {', '.join(paper.authors[:MAX_AUTHORS_DISPLAY])}{'...' if len(paper.authors) > MAX_AUTHORS_DISPLAY else ''}
@@ -178,65 +636,7 @@ class UnifiedLLMEvaluatePapersNode:
 
 {reviews_formatted}
 
-# 🎯 ユーザーの研究興味
-
-{user_interests}
-
-# 📝 評価タスク
-
-以下の**4つのスコア**を0.0-1.0の範囲で評価してください：
-
-## 1. 関連性 (relevance)
-ユーザーの研究興味との関連度を評価。
-- 論文のキーワード、タイトル、アブストラクトから判断
-- レビューに "relevance" や "significance" フィールドがあれば参考にする
-
-## 2. 新規性 (novelty)
-研究の独創性・新しさを評価。
-- レビューの **"originality"** や **"novelty"** フィールドがあれば優先的に使用
-- **"strengths_and_weaknesses"** に新規性の記述があれば参考
-- **"claims_and_evidence"** や **"contribution"** も参考
-- なければアブストラクトから推測
-
-## 3. インパクト (impact)
-学術的・実用的な影響力を評価。
-- レビューの **"significance"** や **"contribution"** フィールドがあれば優先
-- **"rating"** や **"overall_recommendation"** も重視
-- 採択判定 (Accept/Reject) も考慮
-- **"experimental_designs_or_analyses"** の質も参考
-
-## 4. 実用性 (practicality)
-実際の応用可能性を評価。
-- 実装の容易性、再現性、産業応用の可能性
-- **"methods_and_evaluation_criteria"** や **"code_of_conduct"** フィールドも参考
-- レビューの **"questions_for_authors"** も参考
-
-## 5. レビュー要約 (review_summary)
-すべてのレビューを統合して、2-3文で要約してください：
-- レビューワーの主な評価点（強み・弱み）
-- 平均的な評価傾向
-- Program Chairsの判定理由（あれば）
-
-## 6. フィールド活用の説明 (field_insights)
-どのレビューフィールドを主に使用したかを1-2文で説明：
-例: "ICMLのoverall_recommendationフィールド(平均3.0)とsummaryを主に参照しました"
-例: "NeurIPSのratingフィールド(平均5.5)とstrengths_and_weaknessesを主に参照しました"
-
-# 出力形式
-
-必ず以下のJSON形式のみを出力してください（説明文は不要）：
-
-{{
-  "relevance": 0.85,
-  "novelty": 0.72,
-  "impact": 0.68,
-  "practicality": 0.80,
-  "review_summary": "レビューワーは手法の理論的堅牢性を高く評価。一方で実験の限定性を指摘。Program Chairsは新規性と実験品質のバランスから採択を推奨。",
-  "field_insights": "ICMLのoverall_recommendation(平均2.75)、theoretical_claims、experimental_designs_or_analysesフィールドを主に参照しました。",
-  "rationale": "この論文はグラフ生成に特化しており、ユーザーの興味に直接関連。新しい手法で実験も充実しているが、大規模データセットでの検証が限定的。"
-}}
 """
-        return prompt
     
     def _format_dynamic_reviews(self, reviews: list[dict]) -> str:
         """動的フィールドを含むレビューを読みやすくフォーマット."""
@@ -289,34 +689,9 @@ class UnifiedLLMEvaluatePapersNode:
         return "\n".join(formatted_lines)
     
     def _parse_llm_response(self, response: str) -> dict:
-        """LLMのレスポンスをパースして評価結果を抽出."""
+        """LLMのレスポンスをパースして評価結果を抽出（パース失敗時はデフォルト値）."""
         try:
-            # JSONブロックを抽出
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # JSONブロックがない場合、全体から{}を探す
-                json_match = re.search(r'\{.*?\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    # 全体をJSONとしてパース
-                    json_str = response.strip()
-            
-            # JSONをパース
-            evaluation = json.loads(json_str)
-            
-            # スコアを0-1の範囲にクリップ
-            return {
-                'relevance': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('relevance', 0.5)))),
-                'novelty': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('novelty', 0.5)))),
-                'impact': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('impact', 0.5)))),
-                'practicality': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('practicality', 0.5)))),
-                'review_summary': str(evaluation.get('review_summary', 'レビュー要約なし'))[:500],
-                'field_insights': str(evaluation.get('field_insights', 'フィールド情報なし'))[:300],
-                'rationale': str(evaluation.get('rationale', '評価理由なし'))[:500],
-            }
+            return self._decode_llm_response(response)
         except Exception as e:
             logger.warning(f"Failed to parse LLM response: {e}")
             logger.warning(f"Full response: {response[:500]}...")
@@ -328,6 +703,58 @@ class UnifiedLLMEvaluatePapersNode:
                 'practicality': 0.5,
                 'review_summary': 'LLM評価のパースに失敗しました',
                 'field_insights': 'パースエラー',
-                'rationale': f'パースエラー: {str(e)[:100]}',
+                'rationale': f'{PARSE_ERROR_RATIONALE_PREFIX}: {str(e)[:100]}',
             }
-
+    
+    def _decode_llm_response(self, response: str) -> dict:
+        """LLMのレスポンスから評価結果を抽出（パースできない場合は例外を送出）."""
+        try:
+            # Structured Outputs対応モデルではスキーマ通りのJSONが返る
+            return self._normalize_evaluation(
+                EvaluatedPaperScores.model_validate_json(response).model_dump()
+            )
+        except ValidationError:
+            pass
+        
+        # JSONブロックを抽出（コードブロックがなければ正規表現は使わない）
+        json_match = _JSON_BLOCK_RE.search(response) if "```" in response else None
+        if json_match:
+            json_str = json_match.group(1)
+        else:
+            # JSONブロックがない場合、全体から対応の取れた{}を探す（見つからなければ全体をパース）
+            json_str = extract_json_object(response) or response.strip()
+        
+        # JSONをパース
+        evaluation = orjson.loads(json_str)
+        
+        return self._normalize_evaluation(evaluation)
+    
+    def _parse_batch_response(self, response: str) -> dict[str, dict]:
+        """バッチ評価のレスポンスをパースし、論文IDごとの評価結果を返す."""
+        try:
+            # Structured Outputs対応モデルではスキーマ通りのJSONが返る
+            batch = BatchEvaluatedPaperScores.model_validate_json(response)
+            return {
+                item.id: self._normalize_evaluation(item.model_dump())
+                for item in batch.evaluations
+            }
+        except ValidationError:
+            pass
+        
+        # スキーマ非対応モデルでは応答中のJSON配列を探す
+        return {
+            paper_id: self._normalize_evaluation(item)
+            for paper_id, item in parse_id_keyed_json_array(response).items()
+        }
+    
+    def _normalize_evaluation(self, evaluation: dict) -> dict:
+        """評価結果のスコアを0-1の範囲にクリップし、テキスト項目を切り詰める."""
+        return {
+            'relevance': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('relevance', 0.5)))),
+            'novelty': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('novelty', 0.5)))),
+            'impact': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('impact', 0.5)))),
+            'practicality': max(MIN_SCORE, min(MAX_SCORE, float(evaluation.get('practicality', 0.5)))),
+            'review_summary': str(evaluation.get('review_summary', 'レビュー要約なし'))[:500],
+            'field_insights': str(evaluation.get('field_insights', 'フィールド情報なし'))[:300],
+            'rationale': str(evaluation.get('rationale', '評価理由なし'))[:500],
+        }
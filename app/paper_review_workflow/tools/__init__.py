@@ -2,12 +2,16 @@
 
 from app.paper_review_workflow.tools.search_papers import search_papers
 from app.paper_review_workflow.tools.fetch_paper_metadata import fetch_paper_metadata
-from app.paper_review_workflow.tools.analyze_citations import analyze_citations
+from app.paper_review_workflow.tools.analyze_citations import (
+    analyze_citations,
+    analyze_citations_batch,
+)
 
 __all__ = [
     "search_papers",
     "fetch_paper_metadata",
     "analyze_citations",
+    "analyze_citations_batch",
 ]
 
 
@@ -1,11 +1,130 @@
 """Tool for analyzing paper citations using Semantic Scholar API."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
 from langchain_core.tools import tool
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.paper_review_workflow.constants import (
+    CACHE_DIR_NAME,
+    CITATION_CACHE_TTL_HOURS,
+    SEMANTIC_SCHOLAR_BATCH_SIZE,
+    SEMANTIC_SCHOLAR_MAX_RETRIES,
+    SEMANTIC_SCHOLAR_POOL_SIZE,
+    SEMANTIC_SCHOLAR_RETRY_BACKOFF,
+    SEMANTIC_SCHOLAR_SEARCH_CONCURRENCY,
+)
+from app.paper_review_workflow.tools.cache_manager import CacheManager
+
+SEMANTIC_SCHOLAR_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+
+# 論文詳細として取得するフィールド（引用情報を含む）
+CITATION_FIELDS = "paperId,title,year,citationCount,referenceCount,influentialCitationCount,citations,citations.title,citations.year,citations.authors,references,references.title,references.year,references.authors"
+
+PAPER_NOT_FOUND_ERROR = "Paper not found in Semantic Scholar"
+
+# 引用分析結果のディスクキャッシュ（再実行時のAPI呼び出しを省略）
+CITATION_CACHE_PREFIX = "semscholar"
+_cache_manager = CacheManager(cache_dir=CACHE_DIR_NAME, ttl_hours=CITATION_CACHE_TTL_HOURS)
+
+
+def _create_session() -> requests.Session:
+    """接続プールとリトライ設定済みのSemantic Scholar用セッションを作成.
+
+    /paper/batch は読み取り専用のPOSTのため、GETと同様にリトライ対象に含めます。
+    """
+    retry = Retry(
+        total=SEMANTIC_SCHOLAR_MAX_RETRIES,
+        backoff_factor=SEMANTIC_SCHOLAR_RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=SEMANTIC_SCHOLAR_POOL_SIZE,
+            pool_maxsize=SEMANTIC_SCHOLAR_POOL_SIZE,
+            max_retries=retry,
+        ),
+    )
+    return session
+
+
+# 呼び出しごとのTCP/TLS接続確立を避けるため、モジュール全体で1つのセッションを共有
+_SESSION = _create_session()
+
+
+def _summarize_linked_papers(linked_papers: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """引用元・参考文献のリストを先頭limit件に絞り、表示用に整形."""
+    return [
+        {
+            "title": linked_paper.get("title", ""),
+            "year": linked_paper.get("year"),
+            "authors": [
+                author.get("name", "")
+                for author in linked_paper.get("authors", [])[:3]  # 最初の3人のみ
+            ],
+        }
+        for linked_paper in linked_papers[:limit]
+    ]
+
+
+def _build_citation_analysis(
+    paper_data: dict[str, Any],
+    max_citations: int,
+    max_references: int,
+) -> dict[str, Any]:
+    """Semantic Scholarの論文詳細から引用分析結果を構築."""
+    paper_year = paper_data.get("year", 2025)
+    citation_count = paper_data.get("citationCount", 0)
+    years_since_publication = max(1, 2025 - paper_year) if paper_year else 1
+    
+    return {
+        "paper_id": paper_data.get("paperId"),
+        "title": paper_data.get("title"),
+        "year": paper_year,
+        "citation_count": citation_count,
+        "reference_count": paper_data.get("referenceCount", 0),
+        "influential_citation_count": paper_data.get("influentialCitationCount", 0),
+        # 引用元論文（この論文を引用している論文）
+        "citations": _summarize_linked_papers(paper_data.get("citations") or [], max_citations),
+        # 参考文献（この論文が引用している論文）
+        "references": _summarize_linked_papers(paper_data.get("references") or [], max_references),
+        "citation_velocity": citation_count / years_since_publication,
+    }
+
+
+def _search_paper_id(paper_title: str) -> str | None:
+    """タイトル検索で最も一致するSemantic Scholarの論文IDを取得（見つからない場合はNone）."""
+    response = _SESSION.get(
+        f"{SEMANTIC_SCHOLAR_BASE_URL}/paper/search",
+        params={"query": paper_title, "limit": "1", "fields": "paperId"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    search_results = response.json()
+    if not search_results.get("data"):
+        return None
+    return str(search_results["data"][0]["paperId"])
+
+
+def _try_search_paper_id(paper_title: str) -> tuple[str | None, str | None]:
+    """タイトル検索で論文IDを取得し、(論文ID, エラーメッセージ) を返す（例外は送出しない）."""
+    if not paper_title.strip():
+        return None, None
+    try:
+        return _search_paper_id(paper_title), None
+    except requests.exceptions.RequestException as e:
+        error_msg = f"Error accessing Semantic Scholar API: {e!s}"
+        logger.warning(f"{error_msg} (title: {paper_title[:50]})")
+        return None, error_msg
 
 
 @tool
@@ -38,92 +157,171 @@ def analyze_citations(
             - citation_velocity: 年間平均引用数
 
     """
+    cache_key = {
+        "title": paper_title,
+        "doi": doi,
+        "max_citations": max_citations,
+        "max_references": max_references,
+    }
+    cached_result = _cache_manager.get(prefix=CITATION_CACHE_PREFIX, **cache_key)
+    if cached_result:
+        logger.debug(f"Using cached citation analysis for: {paper_title}")
+        return cached_result
+    
     try:
-        base_url = "https://api.semanticscholar.org/graph/v1"
-        
         # 論文を検索
         logger.info(f"Analyzing citations for: {paper_title}")
         if doi:
             # DOIがある場合は直接取得
-            search_url = f"{base_url}/paper/DOI:{doi}"
+            search_url = f"{SEMANTIC_SCHOLAR_BASE_URL}/paper/DOI:{doi}"
         else:
             # タイトルで検索
-            search_url = f"{base_url}/paper/search"
-            params = {"query": paper_title, "limit": 1}
-            response = requests.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            search_results = response.json()
-            
-            if not search_results.get("data"):
-                return json.dumps(
-                    {"error": "Paper not found in Semantic Scholar"},
-                    ensure_ascii=False,
-                )
-            
-            paper_id = search_results["data"][0]["paperId"]
-            search_url = f"{base_url}/paper/{paper_id}"
+            paper_id = _search_paper_id(paper_title)
+            if paper_id is None:
+                return orjson.dumps({"error": PAPER_NOT_FOUND_ERROR}).decode()
+            search_url = f"{SEMANTIC_SCHOLAR_BASE_URL}/paper/{paper_id}"
 
         # 論文詳細を取得（引用情報を含む）
-        params = {
-            "fields": "paperId,title,year,citationCount,referenceCount,influentialCitationCount,citations,citations.title,citations.year,citations.authors,references,references.title,references.year,references.authors"
-        }
-        response = requests.get(search_url, params=params, timeout=30)
+        response = _SESSION.get(search_url, params={"fields": CITATION_FIELDS}, timeout=30)
         response.raise_for_status()
         paper_data = response.json()
 
-        # 引用元論文（この論文を引用している論文）
-        citations: list[dict[str, Any]] = []
-        for citation in paper_data.get("citations", [])[:max_citations]:
-            citations.append({
-                "title": citation.get("title", ""),
-                "year": citation.get("year"),
-                "authors": [
-                    author.get("name", "")
-                    for author in citation.get("authors", [])[:3]  # 最初の3人のみ
-                ],
-            })
-
-        # 参考文献（この論文が引用している論文）
-        references: list[dict[str, Any]] = []
-        for reference in paper_data.get("references", [])[:max_references]:
-            references.append({
-                "title": reference.get("title", ""),
-                "year": reference.get("year"),
-                "authors": [
-                    author.get("name", "")
-                    for author in reference.get("authors", [])[:3]
-                ],
-            })
-
         # 分析結果を構築
-        paper_year = paper_data.get("year", 2025)
-        citation_count = paper_data.get("citationCount", 0)
-        years_since_publication = max(1, 2025 - paper_year) if paper_year else 1
-        
-        analysis = {
-            "paper_id": paper_data.get("paperId"),
-            "title": paper_data.get("title"),
-            "year": paper_year,
-            "citation_count": citation_count,
-            "reference_count": paper_data.get("referenceCount", 0),
-            "influential_citation_count": paper_data.get("influentialCitationCount", 0),
-            "citations": citations,
-            "references": references,
-            "citation_velocity": citation_count / years_since_publication,
-        }
+        analysis = _build_citation_analysis(paper_data, max_citations, max_references)
 
         logger.info(
             f"Analyzed citations for: {analysis['title']} "
             f"(Citations: {analysis['citation_count']}, References: {analysis['reference_count']})"
         )
-        return json.dumps(analysis, ensure_ascii=False, indent=2)
+        result = orjson.dumps(analysis, option=orjson.OPT_INDENT_2).decode()
+        _cache_manager.set(result, prefix=CITATION_CACHE_PREFIX, **cache_key)
+        return result
 
     except requests.exceptions.RequestException as e:
         error_msg = f"Error accessing Semantic Scholar API: {e!s}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, ensure_ascii=False)
+        return orjson.dumps({"error": error_msg}).decode()
     except Exception as e:
         error_msg = f"Error analyzing citations: {e!s}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, ensure_ascii=False)
+        return orjson.dumps({"error": error_msg}).decode()
+
+
+@tool
+def analyze_citations_batch(
+    papers: list[dict[str, Any]],
+    max_citations: int = 20,
+    max_references: int = 20,
+) -> str:
+    """複数論文の引用情報をSemantic Scholar APIでまとめて分析します.
+
+    論文詳細は `POST /paper/batch` で最大500件ずつ1リクエストにまとめて取得します。
+    DOIのない論文は、共有セッション（接続プール）を使ってタイトル検索を並行に行い、
+    見つかった論文IDを同じバッチ取得に含めます。
+    `analyze_citations` とキャッシュを共有し、キャッシュ済みの論文はAPIに問い合わせません。
+
+    Args:
+    ----
+        papers (list[dict]): 分析対象の論文リスト。各要素は "title" と任意の "doi" を持つ辞書
+        max_citations (int): 論文ごとに取得する引用元論文の最大件数（デフォルト: 20）
+        max_references (int): 論文ごとに取得する参考文献の最大件数（デフォルト: 20）
 
+    Returns:
+    -------
+        str: 入力順に並んだ引用分析結果のJSON配列。各要素は `analyze_citations` と同じ形式で、
+            見つからなかった論文や取得に失敗した論文は {"error": ...} になります（常に入力と同じ長さ）
+
+    """
+    logger.info(f"Analyzing citations for {len(papers)} papers")
+    try:
+        cache_keys = [
+            {
+                "title": paper.get("title", ""),
+                "doi": paper.get("doi"),
+                "max_citations": max_citations,
+                "max_references": max_references,
+            }
+            for paper in papers
+        ]
+        cached_analyses: dict[int, dict[str, Any]] = {}
+        for i, cache_key in enumerate(cache_keys):
+            cached_result = _cache_manager.get(prefix=CITATION_CACHE_PREFIX, **cache_key)
+            if cached_result:
+                cached_analyses[i] = orjson.loads(cached_result)
+        pending = [i for i in range(len(papers)) if i not in cached_analyses]
+        logger.debug(f"Using cached citation analyses for {len(cached_analyses)} papers")
+        
+        # DOIがある論文はそのまま、ない論文はタイトル検索でSemantic ScholarのIDを解決
+        # （検索に失敗した論文はエラーとして記録し、他の論文の処理は続ける）
+        title_only = [i for i in pending if not papers[i].get("doi")]
+        with ThreadPoolExecutor(max_workers=SEMANTIC_SCHOLAR_SEARCH_CONCURRENCY) as executor:
+            search_results = dict(zip(
+                title_only,
+                executor.map(lambda i: _try_search_paper_id(papers[i].get("title", "")), title_only),
+            ))
+        lookup_ids: dict[int, str] = {}
+        search_errors: dict[int, str] = {}
+        for i in pending:
+            if papers[i].get("doi"):
+                lookup_ids[i] = f"DOI:{papers[i]['doi']}"
+                continue
+            paper_id, error_msg = search_results[i]
+            if paper_id is not None:
+                lookup_ids[i] = paper_id
+            elif error_msg is not None:
+                search_errors[i] = error_msg
+        
+        # 論文詳細をバッチ取得（結果は問い合わせたIDと同じ順序で、未登録の論文はnull）
+        # 失敗したリクエストに含まれる論文のみエラーとする
+        resolved = list(dict.fromkeys(lookup_ids.values()))
+        paper_data_by_id: dict[str, dict[str, Any] | None] = {}
+        fetch_errors: dict[str, str] = {}
+        for start in range(0, len(resolved), SEMANTIC_SCHOLAR_BATCH_SIZE):
+            chunk = resolved[start:start + SEMANTIC_SCHOLAR_BATCH_SIZE]
+            try:
+                response = _SESSION.post(
+                    f"{SEMANTIC_SCHOLAR_BASE_URL}/paper/batch",
+                    params={"fields": CITATION_FIELDS},
+                    json={"ids": chunk},
+                    timeout=60,
+                )
+                response.raise_for_status()
+                paper_data_by_id.update(zip(chunk, response.json()))
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Error accessing Semantic Scholar API: {e!s}"
+                logger.warning(f"{error_msg} ({len(chunk)} papers)")
+                fetch_errors.update(dict.fromkeys(chunk, error_msg))
+        
+        analyses: list[dict[str, Any]] = []
+        for i, cache_key in enumerate(cache_keys):
+            if i in cached_analyses:
+                analyses.append(cached_analyses[i])
+                continue
+            lookup_id = lookup_ids.get(i)
+            if lookup_id is None:
+                analyses.append({"error": search_errors.get(i, PAPER_NOT_FOUND_ERROR)})
+                continue
+            if lookup_id in fetch_errors:
+                analyses.append({"error": fetch_errors[lookup_id]})
+                continue
+            paper_data = paper_data_by_id.get(lookup_id)
+            if not paper_data:
+                analyses.append({"error": PAPER_NOT_FOUND_ERROR})
+                continue
+            analysis = _build_citation_analysis(paper_data, max_citations, max_references)
+            _cache_manager.set(
+                orjson.dumps(analysis, option=orjson.OPT_INDENT_2),
+                prefix=CITATION_CACHE_PREFIX,
+                **cache_key,
+            )
+            analyses.append(analysis)
+        
+        found_count = sum(1 for analysis in analyses if "error" not in analysis)
+        logger.info(f"Analyzed citations for {found_count}/{len(papers)} papers")
+        return orjson.dumps(analyses, option=orjson.OPT_INDENT_2).decode()
+
+    except Exception as e:
+        # 予期しないエラーでも入力順のリスト形式は保つ
+        error_msg = f"Error analyzing citations: {e!s}"
+        logger.error(error_msg)
+        return orjson.dumps([{"error": error_msg} for _ in papers]).decode()
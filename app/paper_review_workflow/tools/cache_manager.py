@@ -1,21 +1,31 @@
 """Cache manager for OpenReview API responses."""
 
 import hashlib
-import json
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 from loguru import logger
 
+from app.paper_review_workflow.constants import MEMORY_CACHE_MAX_ENTRIES
+
 
 class CacheManager:
-    """OpenReview APIレスポンスのキャッシュを管理."""
+    """OpenReview APIレスポンスのキャッシュを管理.
+    
+    ディスクキャッシュの手前に件数上限つきのLRUメモリキャッシュを持ち、
+    同一プロセス内で同じキーを再度参照した場合はファイルアクセスなしで返します。
+    """
     
     def __init__(
         self,
         cache_dir: str = "storage/cache",
         ttl_hours: int = 24,
+        memory_max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
     ) -> None:
         """CacheManagerを初期化.
         
@@ -23,10 +33,39 @@ class CacheManager:
         ----
             cache_dir: キャッシュディレクトリのパス
             ttl_hours: キャッシュの有効時間（時間単位）
+            memory_max_entries: メモリキャッシュの最大件数（0の場合はメモリキャッシュを使わない）
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_hours = ttl_hours
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # キャッシュファイル名 -> (有効期限のUNIX時刻, データ)
+        self._memory_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._memory_max_entries = memory_max_entries
+        # ツールやLangChainのキャッシュはスレッドプールからも呼ばれるため排他する
+        self._memory_lock = threading.Lock()
+    
+    def _remember(self, name: str, data: str, expires_at: float) -> None:
+        """メモリキャッシュに保存し、上限を超えた分は古いものから破棄."""
+        if self._memory_max_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory_cache[name] = (expires_at, data)
+            self._memory_cache.move_to_end(name)
+            while len(self._memory_cache) > self._memory_max_entries:
+                self._memory_cache.popitem(last=False)
+    
+    def _recall(self, name: str) -> str | None:
+        """メモリキャッシュから有効なデータを取得（存在しない・期限切れの場合はNone）."""
+        with self._memory_lock:
+            entry = self._memory_cache.get(name)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.time():
+                del self._memory_cache[name]
+                return None
+            self._memory_cache.move_to_end(name)
+            return data
     
     def _generate_cache_key(self, **kwargs: Any) -> str:
         """キャッシュキーを生成.
@@ -39,9 +78,9 @@ class CacheManager:
         -------
             ハッシュ化されたキャッシュキー
         """
-        # 辞書をソートして一貫性のある文字列を生成
-        key_str = json.dumps(kwargs, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # 辞書をソートして一貫性のあるバイト列を生成（orjsonはUTF-8のバイト列を直接返す）
+        key_bytes = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
     
     def _get_cache_path(self, cache_key: str, prefix: str = "") -> Path:
         """キャッシュファイルのパスを取得.
@@ -96,27 +135,39 @@ class CacheManager:
         cache_key = self._generate_cache_key(**kwargs)
         cache_path = self._get_cache_path(cache_key, prefix)
         
+        data = self._recall(cache_path.name)
+        if data is not None:
+            return data
+        
         if self._is_cache_valid(cache_path):
-            logger.debug(f"Cache hit: {cache_path.name}")
-            return cache_path.read_text(encoding="utf-8")
+            logger.debug("Cache hit: {}", cache_path.name)
+            data = cache_path.read_text(encoding="utf-8")
+            expires_at = cache_path.stat().st_mtime + self.ttl_hours * 3600
+            self._remember(cache_path.name, data, expires_at)
+            return data
         
-        logger.debug(f"Cache miss: {cache_path.name}")
+        logger.debug("Cache miss: {}", cache_path.name)
         return None
     
-    def set(self, data: str, prefix: str = "", **kwargs: Any) -> None:
+    def set(self, data: str | bytes, prefix: str = "", **kwargs: Any) -> None:
         """データをキャッシュに保存.
         
         Args:
         ----
-            data: 保存するデータ（JSON文字列）
+            data: 保存するデータ（JSON文字列、またはUTF-8のバイト列）
             prefix: キャッシュファイルのプレフィックス
             **kwargs: キャッシュキーの生成に使用するパラメータ
         """
         cache_key = self._generate_cache_key(**kwargs)
         cache_path = self._get_cache_path(cache_key, prefix)
         
-        cache_path.write_text(data, encoding="utf-8")
-        logger.debug(f"Cache saved: {cache_path.name}")
+        cache_path.write_bytes(data if isinstance(data, bytes) else data.encode("utf-8"))
+        self._remember(
+            cache_path.name,
+            data.decode("utf-8") if isinstance(data, bytes) else data,
+            time.time() + self.ttl_hours * 3600,
+        )
+        logger.debug("Cache saved: {}", cache_path.name)
     
     def clear(self, prefix: str = "") -> int:
         """キャッシュをクリア.
@@ -134,6 +185,13 @@ class CacheManager:
         else:
             pattern = "*.json"
         
+        with self._memory_lock:
+            if prefix:
+                for name in [name for name in self._memory_cache if name.startswith(f"{prefix}_")]:
+                    del self._memory_cache[name]
+            else:
+                self._memory_cache.clear()
+        
         deleted = 0
         for cache_file in self.cache_dir.glob(pattern):
             cache_file.unlink()
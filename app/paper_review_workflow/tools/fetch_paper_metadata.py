@@ -1,12 +1,18 @@
 """Tool for fetching detailed paper metadata using OpenReview API."""
 
-import json
 from typing import Any
 
 import openreview
+import orjson
 from langchain_core.tools import tool
 from loguru import logger
 
+from app.paper_review_workflow.constants import CACHE_DIR_NAME, METADATA_CACHE_TTL_HOURS
+from app.paper_review_workflow.tools.cache_manager import CacheManager
+
+# 取得済みメタデータのディスクキャッシュ（再実行時のAPI呼び出しを省略）
+_cache_manager = CacheManager(cache_dir=CACHE_DIR_NAME, ttl_hours=METADATA_CACHE_TTL_HOURS)
+
 
 @tool
 def fetch_paper_metadata(paper_id: str) -> str:
@@ -32,16 +38,25 @@ def fetch_paper_metadata(paper_id: str) -> str:
             - forum_url: フォーラムURL
 
     """
+    cached_result = _cache_manager.get(prefix="paper_metadata", paper_id=paper_id)
+    if cached_result:
+        logger.debug(f"Using cached metadata for paper: {paper_id}")
+        return cached_result
+    
     try:
         # OpenReview APIクライアントを初期化
         client = openreview.api.OpenReviewClient(baseurl="https://api2.openreview.net")
 
-        # 論文情報を取得
+        # フォーラム内の全ノート（論文本体・レビュー・採択判定）を1回のリクエストで取得
         logger.info(f"Fetching metadata for paper: {paper_id}")
-        note = client.get_note(paper_id)
+        forum_notes = client.get_notes(forum=paper_id)
+        note = next((n for n in forum_notes if n.id == paper_id), None)
+        if note is None:
+            # フォーラム一覧に本体が含まれない場合のみ個別に取得
+            note = client.get_note(paper_id)
 
-        # レビュー情報を取得
-        reviews = client.get_notes(forum=paper_id, invitation=".*Review$")
+        # レビュー情報を抽出
+        reviews = [n for n in forum_notes if _has_invitation_suffix(n, "Review")]
         
         # 評価スコアを集計
         ratings: list[float] = []
@@ -85,7 +100,7 @@ def fetch_paper_metadata(paper_id: str) -> str:
             })
 
         # 採択判定を取得
-        decisions = client.get_notes(forum=paper_id, invitation=".*Decision$")
+        decisions = [n for n in forum_notes if _has_invitation_suffix(n, "Decision")]
         decision = "N/A"
         if decisions:
             decision_content = decisions[0].content.get("decision", {})
@@ -119,10 +134,17 @@ def fetch_paper_metadata(paper_id: str) -> str:
         }
 
         logger.info(f"Fetched metadata for paper: {metadata['title']}")
-        return json.dumps(metadata, ensure_ascii=False, indent=2)
+        result = orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode()
+        # 取得に成功した場合のみキャッシュ（エラー応答は次回再取得する）
+        _cache_manager.set(result, prefix="paper_metadata", paper_id=paper_id)
+        return result
 
     except Exception as e:
         error_msg = f"Error fetching paper metadata: {e!s}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, ensure_ascii=False)
+        return orjson.dumps({"error": error_msg}).decode()
+
 
+def _has_invitation_suffix(note: Any, suffix: str) -> bool:
+    """ノートのinvitationのいずれかが指定の接尾辞で終わるか判定."""
+    return any(invitation.endswith(suffix) for invitation in getattr(note, "invitations", None) or [])
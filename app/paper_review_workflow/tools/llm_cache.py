@@ -0,0 +1,73 @@
+"""Disk-backed LLM response cache built on CacheManager."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from langchain_core.caches import BaseCache
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+from app.paper_review_workflow.constants import CACHE_DIR_NAME, LLM_CACHE_TTL_HOURS
+from app.paper_review_workflow.tools.cache_manager import CacheManager
+
+# キャッシュファイルのプレフィックス
+LLM_CACHE_PREFIX = "llm"
+
+
+class LLMResponseCache(BaseCache):
+    """LLMの応答をディスクにキャッシュするLangChainキャッシュ.
+    
+    キーはプロンプト全文とモデル設定（llm_string）から生成されるため、
+    同じ論文・同じ研究興味・同じモデル設定での再評価はAPI呼び出しなしで応答を返します。
+    """
+    
+    def __init__(self, cache_manager: CacheManager | None = None) -> None:
+        """LLMResponseCacheを初期化.
+        
+        Args:
+        ----
+            cache_manager: 保存先のCacheManager（省略時はデフォルトのキャッシュディレクトリ）
+        """
+        self.cache_manager = cache_manager or CacheManager(
+            cache_dir=CACHE_DIR_NAME,
+            ttl_hours=LLM_CACHE_TTL_HOURS,
+        )
+    
+    def lookup(self, prompt: str, llm_string: str) -> Sequence[Generation] | None:
+        """キャッシュから応答を取得（存在しない場合はNone）."""
+        cached = self.cache_manager.get(
+            prefix=LLM_CACHE_PREFIX, prompt=prompt, llm_string=llm_string
+        )
+        if cached is None:
+            return None
+        return [
+            ChatGeneration(message=AIMessage(content=item["text"]))
+            if item.get("chat")
+            else Generation(text=item["text"])
+            for item in orjson.loads(cached)
+        ]
+    
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """応答をキャッシュに保存."""
+        items = [
+            {"chat": isinstance(gen, ChatGeneration), "text": gen.text}
+            for gen in return_val
+        ]
+        self.cache_manager.set(
+            orjson.dumps(items),
+            prefix=LLM_CACHE_PREFIX,
+            prompt=prompt,
+            llm_string=llm_string,
+        )
+    
+    def clear(self, **kwargs: Any) -> None:
+        """キャッシュされた応答をすべて削除."""
+        self.cache_manager.clear(prefix=LLM_CACHE_PREFIX)
+
+
+@lru_cache(maxsize=1)
+def get_llm_response_cache() -> LLMResponseCache:
+    """プロセス共通のLLMResponseCacheを取得."""
+    return LLMResponseCache()
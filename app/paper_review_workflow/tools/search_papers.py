@@ -1,10 +1,10 @@
 """Tool for searching papers using OpenReview API."""
 
-import json
 from pathlib import Path
 from typing import Any
 
 import openreview
+import orjson
 from langchain_core.tools import tool
 from loguru import logger
 
@@ -74,7 +74,7 @@ def search_papers(
         
         if papers_file.exists():
             logger.info(f"Loading from local papers data: {papers_file}")
-            all_papers = json.loads(papers_file.read_text(encoding="utf-8"))
+            all_papers = orjson.loads(papers_file.read_bytes())
             
             # キーワードと採択状況でフィルタリング
             filtered_papers: list[dict[str, Any]] = []
@@ -103,7 +103,7 @@ def search_papers(
                 filter_msg += f", skipped {skipped_rejected} rejected papers"
             logger.info(filter_msg)
             
-            return json.dumps(filtered_papers, ensure_ascii=False, indent=2)
+            return orjson.dumps(filtered_papers, option=orjson.OPT_INDENT_2).decode()
         
         # ローカルキャッシュがない場合は従来のキャッシュをチェック
         logger.info("No local papers data found. Checking temporary cache...")
@@ -184,7 +184,7 @@ def search_papers(
                 break
 
         logger.info(f"Found {len(papers)} papers from {venue} {year}")
-        result = json.dumps(papers, ensure_ascii=False, indent=2)
+        result = orjson.dumps(papers, option=orjson.OPT_INDENT_2).decode()
         
         # キャッシュに保存
         _cache_manager.set(result, prefix="search_papers", **cache_key_params)
@@ -194,5 +194,5 @@ def search_papers(
     except Exception as e:
         error_msg = f"Error searching papers: {e!s}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, ensure_ascii=False)
+        return orjson.dumps({"error": error_msg}).decode()
 
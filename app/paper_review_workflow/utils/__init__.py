@@ -4,9 +4,11 @@ from app.paper_review_workflow.utils.paper_converter import (
     convert_paper_to_dict,
     convert_papers_to_dict_list,
 )
+from app.paper_review_workflow.utils.paper_selection import select_low_relevance_indices
 
 __all__ = [
     "convert_paper_to_dict",
     "convert_papers_to_dict_list",
+    "select_low_relevance_indices",
 ]
 
@@ -0,0 +1,24 @@
+"""Utility functions for selecting papers."""
+
+from app.paper_review_workflow.models.state import EvaluatedPaper
+
+
+def select_low_relevance_indices(papers: list[EvaluatedPaper], skip_ratio: float) -> set[int]:
+    """キーワードによる関連性スコアが下位`skip_ratio`の論文の添字を選択.
+
+    LLM評価ノードが、評価を省略する論文を決めるために使用します。
+
+    Args:
+    ----
+        papers: 評価対象の論文リスト
+        skip_ratio: 選択する論文の割合（0.0-1.0）
+
+    Returns:
+    -------
+        選択した論文の添字の集合
+    """
+    skip_count = int(len(papers) * skip_ratio)
+    if skip_count == 0:
+        return set()
+    order = sorted(range(len(papers)), key=lambda i: papers[i].relevance_score or 0.0)
+    return set(order[:skip_count])
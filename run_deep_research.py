@@ -145,6 +145,36 @@ def parse_arguments() -> argparse.Namespace:
         default=1000,
         help="LLM最大トークン数（デフォルト: 1000）",
     )
+    parser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=1,
+        help="1回のLLM呼び出しでまとめて評価する論文数（デフォルト: 1）",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="LLMの応答をキャッシュし、同じ論文・研究興味での再評価時にAPI呼び出しを省略",
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=int,
+        default=None,
+        help="LLMへの1分あたりの最大リクエスト数（デフォルト: 制限なし）",
+    )
+    parser.add_argument(
+        "--llm-batch-api-threshold",
+        type=int,
+        default=None,
+        help="LLM評価の対象数がこの件数を超えた場合にOpenAI Batch APIで評価。完了を最大1時間待ち、超えた場合はオンライン評価に切り替え（デフォルト: 使用しない）",
+    )
+    parser.add_argument(
+        "--reasoning-effort",
+        type=str,
+        default=None,
+        choices=["auto", "minimal", "low", "medium", "high"],
+        help="GPT-5系モデルのreasoning_effort。autoはモデルごとに調整した値（nano: minimal, mini: low, gpt-5: medium）（デフォルト: APIの既定値）",
+    )
     
     # 出力設定
     parser.add_argument(
@@ -207,11 +237,17 @@ def run_paper_review(args: argparse.Namespace) -> None:
             model=get_llm_model(args.model),
             temperature=args.temperature,
             max_tokens=args.max_tokens,
+            batch_size=args.llm_batch_size,
+            use_response_cache=args.llm_cache,
+            requests_per_minute=args.llm_rpm,
+            batch_api_threshold=args.llm_batch_api_threshold,
+            reasoning_effort=args.reasoning_effort,
         )
         
         # グラフを作成
         logger.info("🔧 ワークフローを初期化中...")
-        graph = create_graph(llm_config=llm_config)
+        # 1回限りの実行で途中状態は参照しないため、チェックポイントは保存しない
+        graph = create_graph(llm_config=llm_config, persist=False)
         
         # 研究興味を取得
         if args.research_description: